@@ -1,5 +1,7 @@
 """Configurações da aplicação."""
 import os
+import tempfile
+from typing import List, Optional
 
 # Configurações da aplicação
 APP_TITLE = "Test Application API"
@@ -9,13 +11,112 @@ APP_VERSION = "1.0.0"
 # Configurações de tempo
 HEALTHTIME_THRESHOLD_SECONDS = 60
 
-# Configurações de fault injection
-FAULT_SOFT_WEIGHTS = [200, 200, 200, 200, 200, 200, 200, 503]  # 87.5% success, 12.5% failure
-FAULT_NORMAL_OPTIONS = [200, 503]  # 50% each
+# Configurações de fault injection (pesos relativos de cada status)
+FAULT_NORMAL_WEIGHTS = {200: 1, 503: 1}  # 50% each
+FAULT_SOFT_WEIGHTS = {200: 7, 503: 1}  # 87.5% success, 12.5% failure
+FAULT_BODYLESS_STATUSES = (204, 205, 304)  # Não podem levar corpo; as regras respondem sempre com JSON
+FAULT_MAX_LATENCY_MS = 60000  # Latência injetada máxima por requisição
+
+# Limites dos endpoints de atraso (/delay)
+MAX_DELAY_CHUNKS = 10000
+MAX_DELAY_CHUNK_BYTES = 65536
 
 # Limites de performance
 MAX_DURATION_SECONDS = 300  # 5 minutos máximo
 
+# Configurações dos endpoints de banda (download/upload)
+BANDWIDTH_BUFFER_BYTES = 4 * 1024 * 1024  # Buffer pré-alocado servido pelo download
+DEFAULT_DOWNLOAD_CHUNK_BYTES = 256 * 1024
+MAX_DOWNLOAD_BYTES = 100 * 1024 ** 3
+
+# Configurações do stress test de disco
+MAX_DISK_STRESS_SIZE_MB = 65536
+DEFAULT_DISK_BLOCK_KB = 64
+
+# Configurações do launcher de produção com múltiplos workers
+DEFAULT_WORKER_GRACEFUL_TIMEOUT_SECONDS = 30.0
+DEFAULT_WORKER_MAX_RESTARTS = 5  # Reinícios permitidos dentro da janela antes de desistir
+DEFAULT_WORKER_RESTART_WINDOW_SECONDS = 60.0
+
+# Configurações dos jobs de stress em background
+DEFAULT_MAX_CONCURRENT_JOBS = 2
+JOB_HISTORY_SIZE = 50  # Quantidade de jobs finalizados mantidos para consulta
+JOB_PROGRESS_INTERVAL_SECONDS = 1.0
+
+# Configurações do stress test de banda de memória
+DEFAULT_MEMORY_BANDWIDTH_BUFFER_MB = 64  # Por buffer; dois por worker, maiores que o cache L3
+MAX_MEMORY_BANDWIDTH_BUFFER_MB = 4096
+MEMORY_BANDWIDTH_BLOCK_BYTES = 4 * 1024 * 1024  # Bloco copiado entre verificações de modo e parada
+
+# Configurações do stress test do GC
+DEFAULT_GC_GRAPH_SIZE = 1000  # Nós por grafo de objetos
+DEFAULT_GC_RETAIN_GRAPHS = 10  # Grafos mais recentes mantidos vivos
+MAX_GC_RETAINED_OBJECTS = 5_000_000  # Limite de nós retidos (retain_graphs * graph_size)
+GC_MONITOR_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Configurações do stress test de memória com tamanho alvo
+DEFAULT_MEMORY_CHUNK_MB = 8
+MAX_MEMORY_TARGET_MB = 65536
+
+# Configurações do cliente SQS
+DEFAULT_SQS_REGION = "us-east-1"
+DEFAULT_SQS_MAX_POOL_CONNECTIONS = 50
+DEFAULT_SQS_MAX_ATTEMPTS = 3
+DEFAULT_SQS_RETRY_MODE = "standard"
+DEFAULT_SQS_CONNECT_TIMEOUT_SECONDS = 2.0
+DEFAULT_SQS_READ_TIMEOUT_SECONDS = 25.0  # Maior que o long polling máximo (20s)
+SQS_MAX_BATCH_SIZE = 10  # Limite de entradas por chamada SendMessageBatch/DeleteMessageBatch
+DEFAULT_SQS_BULK_CONCURRENCY = 8
+DEFAULT_SQS_EXECUTOR_MAX_WORKERS = 32
+MAX_SQS_BULK_CONCURRENCY = 64
+SQS_MAX_WAIT_SECONDS = 20  # Long polling máximo permitido pelo SQS
+MAX_SQS_RECEIVE_COUNT = 10000
+MAX_SQS_RECEIVE_TIMEOUT_SECONDS = 120
+
+# Configurações do codec das mensagens SQS (compressão e offload para blob store)
+SQS_CODECS = ("none", "gzip", "zlib")
+DEFAULT_SQS_CODEC = "none"
+DEFAULT_SQS_CODEC_LEVEL = 6
+DEFAULT_SQS_CODEC_MIN_BYTES = 1024  # Abaixo disso o base64 e o cabeçalho anulam o ganho da compressão
+SQS_MAX_MESSAGE_BYTES = 256 * 1024  # Limite do SQS para corpo e atributos
+DEFAULT_SQS_BLOB_THRESHOLD_BYTES = 200 * 1024
+
+# Configurações padrão do consumidor SQS em background
+DEFAULT_SQS_CONSUMER_POLLERS = 2
+DEFAULT_SQS_CONSUMER_WORKERS = 8
+DEFAULT_SQS_CONSUMER_PREFETCH = 100
+DEFAULT_SQS_CONSUMER_DELETE_FLUSH_MS = 100
+
+# Detecção de limites do contêiner (cgroup)
+DEFAULT_CGROUP_ROOT = "/sys/fs/cgroup"
+DEFAULT_MEMORY_LIMIT_HEADROOM_PERCENT = 10  # Margem abaixo do limite de memória mantida pelos stress tests
+
+# Profiler por amostragem (/debug/profile)
+MAX_PROFILE_SECONDS = 60
+DEFAULT_PROFILE_INTERVAL_MS = 10
+
+# Telemetria de recursos do processo (sampler em background)
+DEFAULT_TELEMETRY_INTERVAL_MS = 1000
+DEFAULT_TELEMETRY_BUFFER_SIZE = 300  # Amostras mantidas no buffer circular
+
+# Load shedding e readiness (0 desabilita o limite)
+LOAD_MONITOR_INTERVAL_SECONDS = 0.05
+DEFAULT_LOAD_SHED_MAX_LAG_MS = 500
+DEFAULT_LOAD_SHED_MAX_IN_FLIGHT = 0
+DEFAULT_LOAD_SHED_MAX_THREADPOOL_QUEUE = 64
+DEFAULT_LOAD_SHED_EXEMPT_PATHS = "/healthcheck,/ready,/metrics"
+LOAD_SHED_RETRY_AFTER_SECONDS = 1
+
+# Configurações da instrumentação Prometheus das requisições
+METRICS_MODES = ("default", "lean", "off")
+DEFAULT_METRICS_MODE = "default"
+DEFAULT_METRICS_EXCLUDED_ROUTES = "/metrics"
+DEFAULT_METRICS_SAMPLE_EVERY = 10  # Uma a cada N requisições das rotas amostradas é medida
+
+# Configurações do pool de workers de CPU
+DEFAULT_DUTY_CYCLE_PERIOD_MS = 100
+DUTY_CYCLE_CONTROLLER_GAIN = 0.5  # Ganho do controlador integral do duty cycle
+
 # Variáveis de ambiente
 def get_version() -> str:
     """Retorna a versão da aplicação da variável de ambiente."""
@@ -29,6 +130,18 @@ def get_host() -> str:
     """Retorna o host da aplicação."""
     return os.getenv("HOST", "0.0.0.0")
 
+def get_workers() -> int:
+    """Retorna o número de workers do launcher (WORKERS ou WEB_CONCURRENCY; padrão 1; 0 = automático)."""
+    return max(0, int(os.getenv("WORKERS") or os.getenv("WEB_CONCURRENCY") or "1"))
+
+def get_worker_graceful_timeout() -> float:
+    """Retorna o tempo máximo de encerramento gracioso de cada worker, em segundos."""
+    return float(os.getenv("WORKER_GRACEFUL_TIMEOUT_SECONDS", str(DEFAULT_WORKER_GRACEFUL_TIMEOUT_SECONDS)))
+
+def get_worker_max_restarts() -> int:
+    """Retorna quantos reinícios de workers são tolerados dentro da janela de reinício."""
+    return int(os.getenv("WORKER_MAX_RESTARTS", str(DEFAULT_WORKER_MAX_RESTARTS)))
+
 def get_sqs_queue_url() -> str:
     """Retorna a URL da fila SQS."""
     queue_url = os.getenv("SQS_QUEUE_URL")
@@ -36,3 +149,168 @@ def get_sqs_queue_url() -> str:
         raise ValueError("Variável de ambiente 'SQS_QUEUE_URL' não encontrada")
     return queue_url
 
+def get_sqs_region() -> str:
+    """Retorna a região AWS utilizada pelo cliente SQS."""
+    return os.getenv("SQS_REGION") or os.getenv("AWS_REGION") or DEFAULT_SQS_REGION
+
+def get_sqs_endpoint_url() -> Optional[str]:
+    """Retorna o endpoint customizado do SQS (ex.: emulador local), se definido."""
+    return os.getenv("SQS_ENDPOINT_URL") or None
+
+def get_sqs_max_pool_connections() -> int:
+    """Retorna o número máximo de conexões HTTP mantidas pelo cliente SQS."""
+    return int(os.getenv("SQS_MAX_POOL_CONNECTIONS", str(DEFAULT_SQS_MAX_POOL_CONNECTIONS)))
+
+def get_sqs_max_attempts() -> int:
+    """Retorna o número máximo de tentativas das chamadas ao SQS."""
+    return int(os.getenv("SQS_MAX_ATTEMPTS", str(DEFAULT_SQS_MAX_ATTEMPTS)))
+
+def get_sqs_retry_mode() -> str:
+    """Retorna o modo de retry do botocore (legacy, standard ou adaptive)."""
+    return os.getenv("SQS_RETRY_MODE", DEFAULT_SQS_RETRY_MODE)
+
+def get_sqs_connect_timeout() -> float:
+    """Retorna o timeout de conexão com o SQS em segundos."""
+    return float(os.getenv("SQS_CONNECT_TIMEOUT_SECONDS", str(DEFAULT_SQS_CONNECT_TIMEOUT_SECONDS)))
+
+def get_sqs_read_timeout() -> float:
+    """Retorna o timeout de leitura das respostas do SQS em segundos."""
+    return float(os.getenv("SQS_READ_TIMEOUT_SECONDS", str(DEFAULT_SQS_READ_TIMEOUT_SECONDS)))
+
+def get_sqs_executor_max_workers() -> int:
+    """Retorna o número de threads do executor dedicado às chamadas ao SQS."""
+    return max(1, int(os.getenv("SQS_EXECUTOR_MAX_WORKERS", str(DEFAULT_SQS_EXECUTOR_MAX_WORKERS))))
+
+def get_sqs_codec() -> str:
+    """Retorna a compressão aplicada aos corpos das mensagens SQS (none, gzip ou zlib)."""
+    return os.getenv("SQS_CODEC", DEFAULT_SQS_CODEC).strip().lower()
+
+def get_sqs_codec_level() -> int:
+    """Retorna o nível de compressão dos corpos das mensagens SQS (1-9)."""
+    return int(os.getenv("SQS_CODEC_LEVEL", str(DEFAULT_SQS_CODEC_LEVEL)))
+
+def get_sqs_codec_min_bytes() -> int:
+    """Retorna o tamanho mínimo em bytes de um corpo para que ele seja comprimido."""
+    return max(0, int(os.getenv("SQS_CODEC_MIN_BYTES", str(DEFAULT_SQS_CODEC_MIN_BYTES))))
+
+def get_sqs_blob_store() -> str:
+    """Retorna o blob store dos corpos grandes (vazio desativa o offload)."""
+    return os.getenv("SQS_BLOB_STORE", "").strip().lower()
+
+def get_sqs_blob_dir() -> str:
+    """Retorna o diretório do blob store local."""
+    return os.getenv("SQS_BLOB_DIR") or os.path.join(tempfile.gettempdir(), "sqs-blobs")
+
+def get_sqs_blob_threshold_bytes() -> int:
+    """Retorna o tamanho do corpo codificado a partir do qual ele é enviado ao blob store."""
+    threshold = int(os.getenv("SQS_BLOB_THRESHOLD_BYTES", str(DEFAULT_SQS_BLOB_THRESHOLD_BYTES)))
+    return max(0, min(threshold, SQS_MAX_MESSAGE_BYTES))
+
+def get_fault_seed() -> Optional[int]:
+    """Retorna a semente inicial do fault injection (FAULT_SEED), se definida."""
+    seed = os.getenv("FAULT_SEED")
+    return int(seed) if seed else None
+
+def get_disk_stress_dir() -> str:
+    """Retorna o diretório onde o stress test de disco cria o arquivo temporário."""
+    return os.getenv("DISK_STRESS_DIR") or tempfile.gettempdir()
+
+def get_max_concurrent_jobs() -> int:
+    """Retorna o número máximo de jobs de stress executando simultaneamente."""
+    return max(1, int(os.getenv("STRESS_MAX_CONCURRENT_JOBS", str(DEFAULT_MAX_CONCURRENT_JOBS))))
+
+def get_duty_cycle_period_seconds() -> float:
+    """Retorna a duração do ciclo de duty cycle dos workers de CPU em segundos."""
+    return int(os.getenv("CPU_DUTY_CYCLE_PERIOD_MS", str(DEFAULT_DUTY_CYCLE_PERIOD_MS))) / 1000
+
+def get_cpu_pool_prestart() -> bool:
+    """Indica se o pool de workers de CPU deve ser iniciado junto com a aplicação."""
+    return os.getenv("CPU_POOL_PRESTART", "false").lower() in ("1", "true", "yes")
+
+def get_fast_start() -> bool:
+    """Indica se a inicialização adia para o primeiro uso tudo que não é necessário para atender."""
+    return os.getenv("FAST_START", "false").lower() in ("1", "true", "yes")
+
+def get_messaging_enabled() -> bool:
+    """Indica se os endpoints de mensageria (SQS) são registrados."""
+    return os.getenv("MESSAGING_ENABLED", "true").lower() in ("1", "true", "yes")
+
+def get_performance_enabled() -> bool:
+    """Indica se os endpoints de performance e de jobs de stress são registrados."""
+    return os.getenv("PERFORMANCE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+def get_gc_monitor_enabled() -> bool:
+    """Indica se as pausas do GC são medidas e exportadas desde a inicialização."""
+    return os.getenv("GC_MONITOR_ENABLED", "true").lower() in ("1", "true", "yes")
+
+def get_cgroup_root() -> str:
+    """Retorna a raiz do sistema de arquivos do cgroup usada na detecção de limites."""
+    return os.getenv("CGROUP_ROOT") or DEFAULT_CGROUP_ROOT
+
+def get_memory_limit_headroom_percent() -> float:
+    """Retorna a margem (em %) mantida abaixo do limite de memória pelos stress tests."""
+    return min(90.0, max(0.0, float(os.getenv("MEMORY_LIMIT_HEADROOM_PERCENT", str(DEFAULT_MEMORY_LIMIT_HEADROOM_PERCENT)))))
+
+def get_profiler_enabled() -> bool:
+    """Indica se o endpoint de profiling (/debug/profile) deve ser exposto."""
+    return os.getenv("PROFILER_ENABLED", "false").lower() in ("1", "true", "yes")
+
+def get_telemetry_enabled() -> bool:
+    """Indica se o sampler de recursos deve ser iniciado junto com a aplicação."""
+    return os.getenv("TELEMETRY_ENABLED", "true").lower() in ("1", "true", "yes")
+
+def get_telemetry_interval_seconds() -> float:
+    """Retorna o intervalo entre amostras do sampler de recursos em segundos."""
+    return max(10, int(os.getenv("TELEMETRY_INTERVAL_MS", str(DEFAULT_TELEMETRY_INTERVAL_MS)))) / 1000
+
+def get_telemetry_buffer_size() -> int:
+    """Retorna quantas amostras o buffer circular do sampler de recursos mantém."""
+    return max(1, int(os.getenv("TELEMETRY_BUFFER_SIZE", str(DEFAULT_TELEMETRY_BUFFER_SIZE))))
+
+def get_load_shed_enabled() -> bool:
+    """Indica se o middleware de load shedding recusa requisições sob sobrecarga."""
+    return os.getenv("LOAD_SHED_ENABLED", "false").lower() in ("1", "true", "yes")
+
+def get_load_shed_max_lag_ms() -> float:
+    """Retorna o atraso máximo do event loop (ms) antes de recusar requisições."""
+    return max(0.0, float(os.getenv("LOAD_SHED_MAX_LAG_MS", str(DEFAULT_LOAD_SHED_MAX_LAG_MS))))
+
+def get_load_shed_max_in_flight() -> int:
+    """Retorna o número máximo de requisições em andamento por worker."""
+    return max(0, int(os.getenv("LOAD_SHED_MAX_IN_FLIGHT", str(DEFAULT_LOAD_SHED_MAX_IN_FLIGHT))))
+
+def get_load_shed_max_threadpool_queue() -> int:
+    """Retorna o tamanho máximo da fila de espera do threadpool das rotas síncronas."""
+    return max(0, int(os.getenv("LOAD_SHED_MAX_THREADPOOL_QUEUE", str(DEFAULT_LOAD_SHED_MAX_THREADPOOL_QUEUE))))
+
+def get_load_shed_exempt_paths() -> List[str]:
+    """Retorna os caminhos nunca recusados nem contabilizados pelo load shedding (probes e métricas)."""
+    paths = os.getenv("LOAD_SHED_EXEMPT_PATHS", DEFAULT_LOAD_SHED_EXEMPT_PATHS)
+    return [path.strip() for path in paths.split(",") if path.strip()]
+
+def get_metrics_mode() -> str:
+    """Retorna o modo de instrumentação das requisições (default, lean ou off)."""
+    return os.getenv("METRICS_MODE", DEFAULT_METRICS_MODE).strip().lower()
+
+def get_metrics_excluded_routes() -> List[str]:
+    """Retorna os caminhos que nunca geram métricas por requisição."""
+    routes = os.getenv("METRICS_EXCLUDED_ROUTES", DEFAULT_METRICS_EXCLUDED_ROUTES)
+    return [route.strip() for route in routes.split(",") if route.strip()]
+
+def get_metrics_buckets() -> List[float]:
+    """Retorna os buckets do histograma de latência em segundos (vazio usa o padrão do modo)."""
+    buckets = os.getenv("METRICS_BUCKETS", "")
+    return sorted(float(bucket) for bucket in buckets.split(",") if bucket.strip())
+
+def get_metrics_include_method() -> bool:
+    """Indica se o modo lean inclui o método HTTP nos rótulos."""
+    return os.getenv("METRICS_INCLUDE_METHOD", "false").lower() in ("1", "true", "yes")
+
+def get_metrics_sampled_routes() -> List[str]:
+    """Retorna os caminhos de alta frequência medidos por amostragem no modo lean."""
+    routes = os.getenv("METRICS_SAMPLED_ROUTES", "")
+    return [route.strip() for route in routes.split(",") if route.strip()]
+
+def get_metrics_sample_every() -> int:
+    """Retorna de quantas em quantas requisições as rotas amostradas são medidas."""
+    return max(1, int(os.getenv("METRICS_SAMPLE_EVERY", str(DEFAULT_METRICS_SAMPLE_EVERY))))
@@ -0,0 +1,247 @@
+"""Launcher de produção com múltiplos workers uvicorn.
+
+O processo principal abre o socket de escuta uma única vez e inicia N
+processos worker que aceitam conexões no mesmo socket, de modo que o
+atendimento de requisições escala com os núcleos disponíveis. Por padrão
+é iniciado um único worker (WORKERS); com --workers 0 o número de workers
+segue a afinidade de CPU e o limite de CPU do cgroup.
+
+As métricas Prometheus são agregadas pelo modo multiprocess do
+prometheus_client: cada worker grava suas métricas em arquivos no diretório
+PROMETHEUS_MULTIPROC_DIR e o /metrics de qualquer worker soma os de todos.
+Quando um worker termina seus arquivos de gauges 'live' são descartados.
+
+Sinais tratados pelo processo principal:
+- SIGTERM/SIGINT: encerramento gracioso de todos os workers
+- SIGHUP: reinício gradual, um worker por vez, sem derrubar o serviço
+
+Uso:
+    python -m app.launcher --workers 4 --port 8000
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .config import (
+    DEFAULT_WORKER_RESTART_WINDOW_SECONDS, get_host, get_port, get_worker_graceful_timeout,
+    get_worker_max_restarts, get_workers
+)
+from .services.resource_service import get_effective_cpu_count
+
+# Intervalo de verificação dos workers pelo supervisor
+SUPERVISE_INTERVAL_SECONDS = 0.5
+# Espera após iniciar um worker no reinício gradual, antes de parar o anterior
+ROLLING_RESTART_WARMUP_SECONDS = 2.0
+
+def prepare_multiproc_dir() -> Tuple[str, bool]:
+    """Prepara o diretório compartilhado de métricas do modo multiprocess.
+
+    Usa PROMETHEUS_MULTIPROC_DIR se definido (os arquivos de execuções
+    anteriores são removidos) ou cria um diretório temporário. A variável é
+    definida antes de iniciar os workers, que a herdam antes de importar o
+    prometheus_client.
+
+    Returns:
+        Tuple com o diretório e se ele foi criado pelo launcher
+    """
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".db"):
+                os.unlink(os.path.join(directory, name))
+        return directory, False
+    directory = tempfile.mkdtemp(prefix="prometheus-multiproc-")
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+    return directory, True
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Abre o socket de escuta compartilhado pelos workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+def serve(sock: socket.socket, uvicorn_options: Dict[str, Any]) -> None:
+    """Executa um worker uvicorn aceitando conexões no socket compartilhado.
+
+    Esta função será executada em cada processo worker.
+    """
+    import uvicorn
+
+    config = uvicorn.Config("app.main:app", **uvicorn_options)
+    uvicorn.Server(config).run(sockets=[sock])
+
+class WorkerSupervisor:
+    """Inicia, monitora e reinicia os processos worker.
+
+    Um worker que termina inesperadamente é reiniciado. Se mais de
+    'max_restarts' reinícios ocorrerem dentro de 'restart_window_seconds' o
+    supervisor desiste e encerra com erro, deixando o orquestrador (ex.:
+    Kubernetes) decidir o que fazer com o contêiner.
+
+    Args:
+        workers: Número de processos worker
+        sock: Socket de escuta compartilhado
+        uvicorn_options: Opções repassadas ao uvicorn.Config de cada worker
+        graceful_timeout: Tempo máximo de encerramento gracioso de cada worker
+        max_restarts: Reinícios tolerados dentro da janela
+        restart_window_seconds: Duração da janela de contagem de reinícios
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        sock: socket.socket,
+        uvicorn_options: Dict[str, Any],
+        graceful_timeout: float,
+        max_restarts: int,
+        restart_window_seconds: float = DEFAULT_WORKER_RESTART_WINDOW_SECONDS
+    ):
+        self.workers = workers
+        self.sock = sock
+        self.uvicorn_options = uvicorn_options
+        self.graceful_timeout = graceful_timeout
+        self.max_restarts = max_restarts
+        self.restart_window_seconds = restart_window_seconds
+        # 'spawn' evita herdar threads e locks do processo principal
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[Optional[multiprocessing.Process]] = [None] * workers
+        self._restarts: Deque[float] = deque()
+        self._should_exit = threading.Event()
+        self._should_reload = threading.Event()
+
+    def _start_worker(self, slot: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=serve, args=(self.sock, self.uvicorn_options), name=f"uvicorn-worker-{slot}"
+        )
+        process.start()
+        print(f"Worker {slot} iniciado no PID {process.pid}")
+        return process
+
+    def _stop_worker(self, process: multiprocessing.Process) -> None:
+        if process.is_alive():
+            process.terminate()
+        process.join(self.graceful_timeout)
+        if process.is_alive():
+            print(f"Worker PID {process.pid} não encerrou em {self.graceful_timeout}s; forçando")
+            process.kill()
+            process.join()
+        self._mark_dead(process)
+
+    @staticmethod
+    def _mark_dead(process: multiprocessing.Process) -> None:
+        """Descarta os arquivos de gauges 'live' do worker encerrado."""
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ and process.pid is not None:
+            from prometheus_client import multiprocess
+            multiprocess.mark_process_dead(process.pid)
+
+    def _allow_restart(self) -> bool:
+        now = time.monotonic()
+        self._restarts.append(now)
+        while self._restarts and now - self._restarts[0] > self.restart_window_seconds:
+            self._restarts.popleft()
+        return len(self._restarts) <= self.max_restarts
+
+    def _rolling_restart(self) -> None:
+        print("Reinício gradual dos workers solicitado")
+        for slot, old in enumerate(self._processes):
+            if self._should_exit.is_set():
+                return
+            self._processes[slot] = self._start_worker(slot)
+            time.sleep(ROLLING_RESTART_WARMUP_SECONDS)
+            if old is not None:
+                self._stop_worker(old)
+
+    def _handle_exit(self, signum: int, frame: Any) -> None:
+        self._should_exit.set()
+
+    def _handle_reload(self, signum: int, frame: Any) -> None:
+        self._should_reload.set()
+
+    def run(self) -> int:
+        """Executa o supervisor até receber um sinal de término.
+
+        Returns:
+            int: Código de saída do launcher
+        """
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._handle_reload)
+
+        exit_code = 0
+        for slot in range(self.workers):
+            self._processes[slot] = self._start_worker(slot)
+
+        while not self._should_exit.wait(SUPERVISE_INTERVAL_SECONDS):
+            if self._should_reload.is_set():
+                self._should_reload.clear()
+                self._rolling_restart()
+                continue
+            for slot, process in enumerate(self._processes):
+                if process is None or process.is_alive():
+                    continue
+                self._mark_dead(process)
+                print(f"Worker {slot} (PID {process.pid}) terminou com código {process.exitcode}")
+                if not self._allow_restart():
+                    print(f"Mais de {self.max_restarts} reinícios em {self.restart_window_seconds:.0f}s; encerrando")
+                    exit_code = 1
+                    self._should_exit.set()
+                    break
+                self._processes[slot] = self._start_worker(slot)
+
+        print("Encerrando workers...")
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            if process is not None:
+                self._stop_worker(process)
+        return exit_code
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Ponto de entrada do launcher."""
+    parser = argparse.ArgumentParser(description="Launcher da aplicação com múltiplos workers uvicorn")
+    parser.add_argument("--host", default=get_host(), help="Endereço de escuta (padrão: HOST ou 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=get_port(), help="Porta de escuta (padrão: PORT ou 8000)")
+    parser.add_argument("--workers", type=int, default=get_workers(),
+                        help="Número de workers (padrão: WORKERS ou 1; 0 usa os núcleos disponíveis no cgroup)")
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info"), help="Nível de log do uvicorn")
+    parser.add_argument("--backlog", type=int, default=2048, help="Tamanho da fila de conexões pendentes")
+    args = parser.parse_args(argv)
+
+    # O estado em memória (jobs, fault injection, consumidor) é de cada worker: mais de um só por opção explícita
+    workers = args.workers or get_effective_cpu_count()
+    directory, created = prepare_multiproc_dir()
+    sock = bind_socket(args.host, args.port)
+    print(f"Iniciando {workers} worker(s) em {args.host}:{args.port} (métricas em {directory})")
+
+    supervisor = WorkerSupervisor(
+        workers=workers,
+        sock=sock,
+        uvicorn_options={"log_level": args.log_level, "backlog": args.backlog},
+        graceful_timeout=get_worker_graceful_timeout(),
+        max_restarts=get_worker_max_restarts()
+    )
+    try:
+        exit_code = supervisor.run()
+    finally:
+        sock.close()
+        if created:
+            shutil.rmtree(directory, ignore_errors=True)
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
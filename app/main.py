@@ -1,31 +1,124 @@
 """Aplicação principal FastAPI."""
+# Importado antes de tudo para que a fase 'imports' inclua o FastAPI e as dependências da aplicação
+from .startup import startup_timings
+
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
-from prometheus_fastapi_instrumentator import Instrumentator
 
-from .config import APP_TITLE, APP_DESCRIPTION, APP_VERSION
-from .routers import info, health, fault, performance, messaging
+from .config import (
+    APP_TITLE, APP_DESCRIPTION, APP_VERSION, get_cpu_pool_prestart, get_fast_start, get_gc_monitor_enabled,
+    get_load_shed_enabled, get_load_shed_exempt_paths, get_messaging_enabled, get_performance_enabled, get_profiler_enabled,
+    get_telemetry_enabled
+)
+from .metrics import MetricsSettings, setup_metrics
+from .middleware import LoadSheddingMiddleware
+from .routers import info, health, fault, delay, telemetry
+from .services.gc_monitor import gc_monitor
+from .services.load_monitor import load_monitor
+from .services.telemetry_service import get_resource_sampler, shutdown_resource_sampler
+
+startup_timings.record("imports", startup_timings.created_at)
+
+def _loaded(module: str) -> bool:
+    """Indica se um módulo de serviço já foi importado (subsistemas carregados sob demanda)."""
+    return f"{__package__}.services.{module}" in sys.modules
+
+def _shutdown_subsystems() -> None:
+    """Finaliza os subsistemas de background que chegaram a ser carregados."""
+    if _loaded("job_service"):
+        from .services.job_service import job_manager
+        job_manager.cancel_all()
+    if _loaded("sqs_consumer"):
+        from .services.sqs_consumer import shutdown_consumer
+        shutdown_consumer()
+    if _loaded("sqs_async"):
+        from .services.sqs_async import shutdown_sqs_executor
+        shutdown_sqs_executor()
+    if _loaded("cpu_service"):
+        from .services.cpu_service import shutdown_burner_pool
+        shutdown_burner_pool()
+    shutdown_resource_sampler()
+    gc_monitor.stop()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Inicializa e finaliza os recursos de background da aplicação.
+
+    Com FAST_START o pool de CPU e o sampler de telemetria não são iniciados
+    aqui; ambos iniciam no primeiro uso.
+    """
+    with startup_timings.phase("lifespan"):
+        fast_start = get_fast_start()
+        if get_cpu_pool_prestart() and not fast_start:
+            from .services.cpu_service import get_burner_pool
+            get_burner_pool().start()
+        if get_telemetry_enabled() and not fast_start:
+            get_resource_sampler().start()
+        if get_gc_monitor_enabled():
+            gc_monitor.start()
+        load_monitor.start()
+    startup_timings.mark_ready()
+    yield
+    await load_monitor.stop()
+    _shutdown_subsystems()
 
 def create_app() -> FastAPI:
-    """Cria e configura a aplicação FastAPI."""
+    """Cria e configura a aplicação FastAPI.
+
+    Os routers de mensageria, performance/jobs e debug só são importados
+    quando habilitados, de modo que réplicas sem esses subsistemas não pagam
+    a importação dos seus serviços.
+    """
     app = FastAPI(
         title=APP_TITLE,
         description=APP_DESCRIPTION,
         version=APP_VERSION,
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
-    
+
     # Incluir routers
-    app.include_router(info.router)
-    app.include_router(health.router)
-    app.include_router(fault.router)
-    app.include_router(performance.router)
-    app.include_router(messaging.router)
-    
+    with startup_timings.phase("routers"):
+        app.include_router(info.router)
+        app.include_router(health.router)
+        app.include_router(fault.router)
+        app.include_router(delay.router)
+        if get_performance_enabled():
+            from .routers import jobs, performance
+            app.include_router(performance.router)
+            app.include_router(jobs.router)
+        if get_messaging_enabled():
+            from .routers import messaging
+            app.include_router(messaging.router)
+        app.include_router(telemetry.router)
+        if get_profiler_enabled():
+            from .routers import debug
+            app.include_router(debug.router)
+    startup_timings.features = {
+        "fast_start": get_fast_start(),
+        "performance": get_performance_enabled(),
+        "messaging": get_messaging_enabled(),
+        "profiler": get_profiler_enabled(),
+    }
+
     # Configurar métricas Prometheus
-    Instrumentator().instrument(app).expose(app)
-    
+    with startup_timings.phase("metrics"):
+        setup_metrics(app, MetricsSettings.from_env())
+
+    # Adicionado por último para ser o middleware mais externo: recusas por
+    # sobrecarga não passam pelos demais middlewares
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        monitor=load_monitor,
+        exempt_paths=get_load_shed_exempt_paths(),
+        enabled=get_load_shed_enabled()
+    )
+
     return app
 
 # Instância da aplicação
-app = create_app()
\ No newline at end of file
+app = create_app()
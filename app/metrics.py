@@ -0,0 +1,195 @@
+"""Camada de métricas Prometheus das requisições HTTP.
+
+Modos (METRICS_MODE):
+- default: prometheus_fastapi_instrumentator com as métricas padrão
+  (handler, method e status; histogramas de alta e baixa resolução e
+  tamanhos de requisição e resposta), respeitando as rotas excluídas.
+- lean: middleware ASGI próprio com apenas http_requests_total e
+  http_request_duration_seconds. Rotas excluídas são descartadas por
+  comparação de caminho antes de qualquer trabalho, o handler vem da rota
+  já resolvida pelo roteador (sem um segundo casamento de rotas), os
+  rótulos se limitam a handler e classe de status (method é opcional), os
+  buckets são configuráveis e rotas de alta frequência podem ser amostradas.
+- off: nenhuma métrica por requisição.
+
+Em todos os modos /metrics é exposto pelo instrumentator, o que mantém o
+suporte ao modo multiprocess (PROMETHEUS_MULTIPROC_DIR) do launcher.
+"""
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from prometheus_fastapi_instrumentator import Instrumentator
+
+from .config import (
+    METRICS_MODES, get_metrics_buckets, get_metrics_excluded_routes, get_metrics_include_method,
+    get_metrics_mode, get_metrics_sample_every, get_metrics_sampled_routes
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+@dataclass
+class MetricsSettings:
+    """Configuração da camada de métricas."""
+
+    mode: str = "default"
+    excluded_routes: List[str] = field(default_factory=lambda: ["/metrics"])
+    buckets: Sequence[float] = ()
+    include_method: bool = False
+    sampled_routes: List[str] = field(default_factory=list)
+    sample_every: int = 1
+
+    @classmethod
+    def from_env(cls) -> "MetricsSettings":
+        """Lê a configuração das variáveis de ambiente."""
+        return cls(
+            mode=get_metrics_mode(),
+            excluded_routes=get_metrics_excluded_routes(),
+            buckets=get_metrics_buckets(),
+            include_method=get_metrics_include_method(),
+            sampled_routes=get_metrics_sampled_routes(),
+            sample_every=get_metrics_sample_every(),
+        )
+
+class LeanMetricsMiddleware:
+    """Middleware ASGI que registra contagem e latência das requisições com custo mínimo.
+
+    Nas rotas amostradas apenas 1 a cada 'sample_every' requisições é medida;
+    o contador é incrementado em 'sample_every' nessa requisição, de modo que
+    http_requests_total continua uma estimativa não enviesada da vazão, e o
+    histograma mantém a forma da distribuição com menos observações.
+
+    Args:
+        app: Aplicação ASGI encapsulada
+        requests_total: Contador de requisições
+        duration: Histograma de latência
+        excluded_routes: Caminhos nunca medidos
+        include_method: Inclui o método HTTP nos rótulos
+        sampled_routes: Caminhos medidos por amostragem
+        sample_every: Uma a cada N requisições das rotas amostradas é medida
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_total: Counter,
+        duration: Histogram,
+        excluded_routes: Sequence[str] = (),
+        include_method: bool = False,
+        sampled_routes: Sequence[str] = (),
+        sample_every: int = 1
+    ):
+        self.app = app
+        self.requests_total = requests_total
+        self.duration = duration
+        self.excluded_routes = frozenset(excluded_routes)
+        self.include_method = include_method
+        self.sampled_routes = frozenset(sampled_routes) if sample_every > 1 else frozenset()
+        self.sample_every = sample_every
+        self._sample_counters: Dict[str, int] = {}
+        # Filhos dos rótulos em cache: evita a busca com lock do prometheus_client por requisição
+        self._children: Dict[Tuple[str, ...], Tuple[Any, Any]] = {}
+
+    def _metrics_for(self, labels: Tuple[str, ...]) -> Tuple[Any, Any]:
+        children = self._children.get(labels)
+        if children is None:
+            children = (self.requests_total.labels(*labels), self.duration.labels(*labels[:-1]))
+            self._children[labels] = children
+        return children
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        if path in self.excluded_routes:
+            await self.app(scope, receive, send)
+            return
+
+        weight = 1
+        if path in self.sampled_routes:
+            count = self._sample_counters.get(path, 0) + 1
+            self._sample_counters[path] = count
+            if count % self.sample_every:
+                await self.app(scope, receive, send)
+                return
+            weight = self.sample_every
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            route = scope.get("route")
+            handler = getattr(route, "path", None) or "none"
+            status_class = f"{status_code // 100}xx"
+            labels = (handler, scope["method"], status_class) if self.include_method else (handler, status_class)
+            counter, histogram = self._metrics_for(labels)
+            counter.inc(weight)
+            histogram.observe(duration)
+
+def setup_metrics(app: FastAPI, settings: MetricsSettings, registry: Optional[CollectorRegistry] = None) -> None:
+    """Instala a instrumentação HTTP conforme o modo e expõe /metrics.
+
+    Args:
+        app: Aplicação FastAPI
+        settings: Configuração da camada de métricas
+        registry: Registry das métricas (padrão: o registry global do prometheus_client)
+
+    Raises:
+        ValueError: Se o modo for inválido
+    """
+    if settings.mode not in METRICS_MODES:
+        raise ValueError(f"Modo de métricas inválido. Opções: {', '.join(METRICS_MODES)}")
+
+    if settings.mode == "default":
+        instrumentator = Instrumentator(
+            excluded_handlers=[f"^{re.escape(route)}$" for route in settings.excluded_routes],
+            registry=registry
+        )
+        if settings.buckets:
+            instrumentator.instrument(app, latency_highr_buckets=settings.buckets)
+        else:
+            instrumentator.instrument(app)
+        instrumentator.expose(app)
+        return
+
+    Instrumentator(registry=registry).expose(app)
+    if settings.mode == "off":
+        return
+
+    labels = ["handler", "method", "status"] if settings.include_method else ["handler", "status"]
+    histogram_labels = labels[:-1]
+    registry = registry or REGISTRY
+    requests_total = Counter("http_requests_total", "Total de requisições HTTP.", labels, registry=registry)
+    duration = Histogram(
+        "http_request_duration_seconds",
+        "Latência das requisições HTTP em segundos.",
+        histogram_labels,
+        registry=registry,
+        **({"buckets": settings.buckets} if settings.buckets else {})
+    )
+    app.add_middleware(
+        LeanMetricsMiddleware,
+        requests_total=requests_total,
+        duration=duration,
+        excluded_routes=settings.excluded_routes,
+        include_method=settings.include_method,
+        sampled_routes=settings.sampled_routes,
+        sample_every=settings.sample_every
+    )
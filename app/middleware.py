@@ -0,0 +1,63 @@
+"""Middlewares ASGI da aplicação."""
+from typing import Any, Awaitable, Callable, Dict, Iterable, MutableMapping
+
+from .config import LOAD_SHED_RETRY_AFTER_SECONDS
+from .responses import PreEncodedJSON
+from .services.load_monitor import (
+    REASON_EVENT_LOOP_LAG, REASON_IN_FLIGHT, REASON_THREADPOOL_QUEUE, LoadMonitor
+)
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Corpos de recusa pré-serializados, um por motivo de sobrecarga
+SHED_BODIES: Dict[str, PreEncodedJSON] = {
+    reason: PreEncodedJSON({"detail": f"Serviço sobrecarregado ({reason}), tente novamente"}, status_code=503)
+    for reason in (REASON_EVENT_LOOP_LAG, REASON_IN_FLIGHT, REASON_THREADPOOL_QUEUE)
+}
+
+class LoadSheddingMiddleware:
+    """Recusa requisições com 503 enquanto o worker está sobrecarregado.
+
+    Middleware ASGI puro (sem BaseHTTPMiddleware) para que tanto a admissão
+    quanto a recusa custem poucos microssegundos: a decisão compara os sinais
+    já medidos pelo LoadMonitor e a resposta de recusa é pré-serializada,
+    com Retry-After. Os caminhos isentos (probes e /metrics) nunca são
+    recusados nem contabilizados.
+
+    Args:
+        app: Aplicação ASGI encapsulada
+        monitor: Monitor com os sinais de carga e os limites
+        exempt_paths: Caminhos que não passam pelo controle de admissão
+        enabled: Se False apenas contabiliza as requisições em andamento
+    """
+
+    def __init__(self, app: ASGIApp, monitor: LoadMonitor, exempt_paths: Iterable[str] = (), enabled: bool = True):
+        self.app = app
+        self.monitor = monitor
+        self.exempt_paths = frozenset(exempt_paths)
+        self.enabled = enabled
+        self._retry_after = (b"retry-after", str(LOAD_SHED_RETRY_AFTER_SECONDS).encode("latin-1"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        monitor = self.monitor
+        if self.enabled:
+            reason = monitor.overload_reason()
+            if reason is not None:
+                monitor.shed(reason)
+                body = SHED_BODIES[reason]
+                await send({"type": "http.response.start", "status": 503, "headers": body.raw_headers + [self._retry_after]})
+                await send({"type": "http.response.body", "body": body.body})
+                return
+
+        monitor.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            monitor.request_finished()
@@ -1,12 +1,71 @@
 """Modelos Pydantic da aplicação."""
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional
+
+from .config import (
+    FAULT_BODYLESS_STATUSES, FAULT_MAX_LATENCY_MS, MAX_DELAY_CHUNKS, DEFAULT_DISK_BLOCK_KB, MAX_DISK_STRESS_SIZE_MB, MAX_DELAY_CHUNK_BYTES, DEFAULT_MEMORY_CHUNK_MB, MAX_DURATION_SECONDS, MAX_MEMORY_TARGET_MB, SQS_MAX_WAIT_SECONDS,
+    DEFAULT_SQS_CONSUMER_POLLERS, DEFAULT_SQS_CONSUMER_WORKERS, DEFAULT_SQS_CONSUMER_PREFETCH,
+    DEFAULT_SQS_CONSUMER_DELETE_FLUSH_MS, DEFAULT_GC_GRAPH_SIZE, DEFAULT_GC_RETAIN_GRAPHS,
+    DEFAULT_MEMORY_BANDWIDTH_BUFFER_MB, MAX_MEMORY_BANDWIDTH_BUFFER_MB
+)
 
 class Healthcheck(BaseModel):
     """Modelo para resposta de healthcheck."""
     status: int = Field(..., description="Status HTTP retornado")
     description: str = Field(..., description="Descrição do status")
 
+class FaultOutcome(BaseModel):
+    """Modelo de um status possível de uma regra de fault injection."""
+    status: int = Field(..., ge=200, le=599, description="Status HTTP retornado (exceto 204, 205 e 304, que não têm corpo)")
+    weight: float = Field(..., gt=0, description="Peso relativo do status")
+
+    @field_validator("status")
+    @classmethod
+    def _status_with_body(cls, value: int) -> int:
+        if value in FAULT_BODYLESS_STATUSES:
+            raise ValueError(f"O status {value} não pode ter corpo e não é suportado")
+        return value
+
+class FaultLatency(BaseModel):
+    """Modelo da distribuição de latência injetada por uma regra."""
+    distribution: Literal["none", "fixed", "uniform", "lognormal", "percentiles"] = Field("none", description="Distribuição da latência")
+    ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Latência constante (fixed)")
+    min_ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Latência mínima (uniform)")
+    max_ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Latência máxima (uniform)")
+    median_ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Mediana (lognormal)")
+    sigma: Optional[float] = Field(None, ge=0, description="Desvio padrão do logaritmo (lognormal)")
+    p50_ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Percentil 50 alvo (percentiles)")
+    p99_ms: Optional[float] = Field(None, ge=0, le=FAULT_MAX_LATENCY_MS, description="Percentil 99 alvo (percentiles)")
+    cap_ms: Optional[float] = Field(None, gt=0, le=FAULT_MAX_LATENCY_MS, description="Limite superior das amostras lognormais")
+
+class FaultRuleSpec(BaseModel):
+    """Modelo de uma regra de fault injection."""
+    outcomes: List[FaultOutcome] = Field(..., min_length=1, description="Status possíveis e seus pesos")
+    latency: FaultLatency = Field(default_factory=FaultLatency, description="Latência injetada antes da resposta")
+    description: Optional[str] = Field(None, description="Descrição da regra")
+
+class FaultRulesUpdate(BaseModel):
+    """Modelo para atualização das regras de fault injection."""
+    rules: Dict[str, FaultRuleSpec] = Field(default_factory=dict, description="Regras a criar ou substituir, por nome")
+    seed: Optional[int] = Field(None, description="Nova semente global; reinicia a sequência de todas as regras")
+    replace: bool = Field(False, description="Remove as regras que não estiverem em 'rules' (exceto 'normal' e 'soft')")
+
+class FaultRulesResponse(BaseModel):
+    """Modelo para resposta de configuração de fault injection."""
+    seed: Optional[int] = Field(None, description="Semente global (nula quando aleatória)")
+    rules: Dict[str, Dict[str, Any]] = Field(..., description="Regras ativas, com probabilidades e número de decisões")
+
+class DelayRequest(FaultLatency):
+    """Modelo dos parâmetros de query do endpoint de atraso sorteado."""
+    chunks: int = Field(0, ge=0, le=MAX_DELAY_CHUNKS, description="Blocos enviados ao longo do atraso (0: corpo JSON ao final)")
+    chunk_bytes: int = Field(1, ge=1, le=MAX_DELAY_CHUNK_BYTES, description="Tamanho de cada bloco em bytes")
+
+class DelayResponse(BaseModel):
+    """Modelo para resposta dos endpoints de atraso."""
+    status: str = Field(..., description="Status da operação")
+    delay_ms: float = Field(..., description="Atraso aplicado em milissegundos")
+    distribution: str = Field(..., description="Distribuição usada para definir o atraso")
+
 class HostnameResponse(BaseModel):
     """Modelo para resposta de hostname."""
     hostname: str = Field(..., description="Nome do host do servidor")
@@ -15,10 +74,79 @@ class VersionResponse(BaseModel):
     """Modelo para resposta de versão."""
     version: str = Field(..., description="Versão da aplicação")
 
+class ResourceLimitsResponse(BaseModel):
+    """Modelo para resposta dos limites de recursos detectados."""
+    cgroup_version: Optional[int] = Field(None, description="Versão do cgroup detectada (1, 2 ou nula fora de cgroups)")
+    host_cpu_count: int = Field(..., description="Núcleos de CPU do host (os.cpu_count)")
+    cpu_quota_cores: Optional[float] = Field(None, description="Quota de CPU do cgroup em núcleos (nula sem limite)")
+    cpuset: Optional[List[int]] = Field(None, description="CPUs permitidas pelo cpuset do cgroup")
+    allowed_cpus: List[int] = Field(..., description="CPUs em que os workers de stress são fixados")
+    effective_cpu_count: int = Field(..., description="Núcleos efetivamente utilizáveis (afinidade, cpuset e quota)")
+    host_memory_bytes: int = Field(..., description="Memória total do host em bytes")
+    memory_limit_bytes: Optional[int] = Field(None, description="Limite de memória do cgroup em bytes (nulo sem limite)")
+    memory_usage_bytes: Optional[int] = Field(None, description="Uso de memória atual do cgroup em bytes")
+    memory_working_set_bytes: Optional[int] = Field(
+        None, description="Uso do cgroup sem o page cache inativo, descontado do teto pelos stress tests"
+    )
+    effective_memory_bytes: int = Field(..., description="Memória efetivamente disponível em bytes")
+    memory_ceiling_mb: float = Field(..., description="Teto de memória respeitado pelos stress tests em MB")
+
+class StartupPhase(BaseModel):
+    """Modelo para uma fase da inicialização do worker."""
+    name: str = Field(..., description="Fase (interpreter, imports, routers, metrics ou lifespan)")
+    offset_seconds: float = Field(..., description="Início da fase em segundos desde o início do processo")
+    duration_seconds: float = Field(..., description="Duração da fase em segundos")
+
+class StartupResponse(BaseModel):
+    """Modelo para resposta dos tempos de inicialização do worker."""
+    process_started_at: Optional[float] = Field(None, description="Início do processo (epoch), nulo se indisponível")
+    time_to_ready_seconds: Optional[float] = Field(None, description="Tempo do início do processo ao fim do lifespan")
+    phases: List[StartupPhase] = Field(..., description="Fases da inicialização na ordem em que terminaram")
+    features: Dict[str, bool] = Field(..., description="Modo de inicialização rápida e subsistemas habilitados")
+    lazy_modules: Dict[str, bool] = Field(..., description="Dependências carregadas sob demanda e se já foram importadas")
+
+class ChildrenUsage(BaseModel):
+    """Modelo para o uso de recursos somado dos processos filhos."""
+    count: int = Field(..., description="Número de processos filhos")
+    cpu_percent: float = Field(..., description="CPU% somado dos filhos (100 = um núcleo)")
+    rss_mb: float = Field(..., description="RSS somado dos filhos em MB")
+
+class TelemetrySample(BaseModel):
+    """Modelo para uma amostra de uso de recursos do processo."""
+    seq: int = Field(..., description="Número de sequência da amostra")
+    timestamp: float = Field(..., description="Timestamp (epoch) da amostra")
+    cpu_percent: float = Field(..., description="CPU% do processo desde a amostra anterior (100 = um núcleo)")
+    rss_mb: float = Field(..., description="Memória residente em MB")
+    vms_mb: float = Field(..., description="Memória virtual em MB")
+    threads: int = Field(..., description="Número de threads")
+    fds: Optional[int] = Field(None, description="Descritores de arquivo abertos")
+    ctx_switches_voluntary: int = Field(..., description="Trocas de contexto voluntárias acumuladas")
+    ctx_switches_involuntary: int = Field(..., description="Trocas de contexto involuntárias acumuladas")
+    io_read_bytes: Optional[int] = Field(None, description="Bytes lidos do armazenamento acumulados")
+    io_write_bytes: Optional[int] = Field(None, description="Bytes escritos no armazenamento acumulados")
+    children: ChildrenUsage = Field(..., description="Uso somado dos processos filhos (ex.: workers de CPU)")
+
+class TelemetryResponse(BaseModel):
+    """Modelo para resposta do buffer de telemetria."""
+    interval_seconds: float = Field(..., description="Intervalo entre amostras")
+    running: bool = Field(..., description="Indica se o sampler está ativo")
+    samples: List[TelemetrySample] = Field(default_factory=list, description="Amostras mais antigas primeiro")
+
 class HealthResponse(BaseModel):
     """Modelo para resposta de health básico."""
     status: str = Field(..., description="Status de saúde da aplicação")
 
+class ReadinessResponse(BaseModel):
+    """Modelo para resposta do readiness probe."""
+    status: str = Field(..., description="'ready' ou 'overloaded'")
+    reason: Optional[str] = Field(None, description="Sinal que excedeu o limite (event_loop_lag, in_flight ou threadpool_queue)")
+    event_loop_lag_ms: float = Field(..., description="Atraso atual do event loop em ms")
+    in_flight: int = Field(..., description="Requisições em andamento no worker")
+    threadpool_busy: int = Field(..., description="Threads ocupadas do threadpool das rotas síncronas")
+    threadpool_size: int = Field(..., description="Tamanho do threadpool das rotas síncronas")
+    threadpool_queue: int = Field(..., description="Tarefas aguardando uma thread livre")
+    limits: Dict[str, float] = Field(..., description="Limites configurados (0 = desabilitado)")
+
 class CPUStressResponse(BaseModel):
     """Modelo para resposta de stress test de CPU."""
     status: str = Field(..., description="Status do teste")
@@ -32,22 +160,212 @@ class MemoryStressResponse(BaseModel):
     items_created_in_list: int = Field(..., description="Número de itens criados na lista")
     memory_allocated_mb: float = Field(..., description="Memória alocada em MB")
 
+class UploadResponse(BaseModel):
+    """Modelo para resposta do teste de upload."""
+    status: str = Field(..., description="Status da operação")
+    bytes_received: int = Field(..., description="Bytes recebidos no corpo da requisição")
+    chunks: int = Field(..., description="Número de chunks recebidos")
+    duration_seconds: float = Field(..., description="Tempo de leitura do corpo em segundos")
+    time_to_first_byte_seconds: Optional[float] = Field(None, description="Tempo até o primeiro byte do corpo")
+    throughput_mb_per_second: float = Field(..., description="Vazão de recebimento em MB/s")
+
+SQSCodec = Literal["none", "gzip", "zlib"]
+
 class MessageRequest(BaseModel):
     """Modelo para requisição de envio de mensagem."""
     message: str = Field(..., description="Mensagem a ser enviada para a fila SQS")
+    codec: Optional[SQSCodec] = Field(None, description="Compressão do corpo (padrão: SQS_CODEC)")
 
 class MessageResponse(BaseModel):
     """Modelo para resposta de envio de mensagem."""
     status: str = Field(..., description="Status do envio")
     message_id: str = Field(..., description="ID da mensagem na fila SQS")
     queue_url: str = Field(..., description="URL da fila SQS utilizada")
+    encoding: str = Field(..., description="Codificação aplicada ao corpo (identity, gzip ou zlib)")
+    raw_bytes: int = Field(..., description="Tamanho do corpo original em bytes")
+    wire_bytes: int = Field(..., description="Bytes enviados ao SQS (corpo codificado e atributos)")
+    compression_ratio: Optional[float] = Field(None, description="raw_bytes / wire_bytes")
+    bytes_saved: int = Field(..., description="Bytes que deixaram de trafegar pelo SQS (raw_bytes - wire_bytes)")
+    offloaded: bool = Field(..., description="Indica se o corpo foi gravado no blob store")
+
+class ReceivedMessage(BaseModel):
+    """Modelo de uma mensagem recebida da fila SQS."""
+    message_id: str = Field(..., description="ID da mensagem recebida")
+    body: str = Field(..., description="Conteúdo da mensagem (já decodificado)")
+    encoding: Optional[str] = Field(None, description="Codificação com que a mensagem trafegou")
+    decode_error: Optional[str] = Field(None, description="Motivo da falha de decodificação; o corpo vem como recebido do SQS")
+
+class DeleteFailure(BaseModel):
+    """Modelo de uma mensagem cuja deleção foi rejeitada."""
+    receipt_handle: str = Field(..., description="Receipt handle da mensagem")
+    code: str = Field(..., description="Código de erro retornado pelo SQS")
+    message: str = Field(..., description="Descrição do erro")
+
+class BatchReceiveResponse(BaseModel):
+    """Modelo para resposta de recebimento de mensagens em lote."""
+    status: str = Field(..., description="Status da operação (success, partial ou empty)")
+    queue_url: str = Field(..., description="URL da fila SQS utilizada")
+    requested: int = Field(..., description="Número de mensagens solicitadas")
+    received: int = Field(..., description="Número de mensagens recebidas e removidas")
+    messages: List[ReceivedMessage] = Field(default_factory=list, description="Mensagens recebidas e removidas")
+    undecodable: List[ReceivedMessage] = Field(
+        default_factory=list, description="Mensagens que não puderam ser decodificadas e permanecem na fila"
+    )
+    delete_failures: List[DeleteFailure] = Field(default_factory=list, description="Mensagens que não puderam ser removidas")
+    receive_calls: int = Field(..., description="Número de chamadas ReceiveMessage realizadas")
+    delete_calls: int = Field(..., description="Número de chamadas DeleteMessageBatch realizadas")
+    duration_seconds: float = Field(..., description="Duração total da operação em segundos")
+
+class BulkSendFailure(BaseModel):
+    """Modelo de uma entrada rejeitada no envio em lote."""
+    index: int = Field(..., description="Posição da mensagem no corpo da requisição")
+    code: str = Field(..., description="Código de erro retornado pelo SQS")
+    message: str = Field(..., description="Descrição do erro")
+
+class BulkSendResponse(BaseModel):
+    """Modelo para resposta de envio de mensagens em lote."""
+    status: str = Field(..., description="Status do envio (success, partial ou failed)")
+    queue_url: str = Field(..., description="URL da fila SQS utilizada")
+    total: int = Field(..., description="Número de mensagens recebidas")
+    successful: int = Field(..., description="Número de mensagens enviadas com sucesso")
+    failed: int = Field(..., description="Número de mensagens rejeitadas")
+    failures: List[BulkSendFailure] = Field(default_factory=list, description="Detalhes das mensagens rejeitadas")
+    batches: int = Field(..., description="Número de chamadas SendMessageBatch realizadas")
+    duration_seconds: float = Field(..., description="Duração total do envio em segundos")
+    throughput_msgs_per_second: float = Field(..., description="Vazão de mensagens enviadas por segundo")
+    compressed: int = Field(0, description="Mensagens enviadas com o corpo comprimido")
+    offloaded: int = Field(0, description="Mensagens enviadas como ponteiro para o blob store")
+    raw_bytes: int = Field(0, description="Bytes dos corpos originais das mensagens enviadas")
+    wire_bytes: int = Field(0, description="Bytes enviados ao SQS (corpos codificados e atributos)")
+    compression_ratio: Optional[float] = Field(None, description="raw_bytes / wire_bytes")
+    bytes_saved: int = Field(0, description="Bytes que deixaram de trafegar pelo SQS (raw_bytes - wire_bytes)")
 
 class ReceiveMessageResponse(BaseModel):
     """Modelo para resposta de recebimento de mensagem."""
     status: str = Field(..., description="Status da operação")
     message_id: Optional[str] = Field(None, description="ID da mensagem recebida")
-    body: Optional[str] = Field(None, description="Conteúdo da mensagem")
+    body: Optional[str] = Field(None, description="Conteúdo da mensagem (já decodificado)")
+    encoding: Optional[str] = Field(None, description="Codificação com que a mensagem trafegou")
+    decode_error: Optional[str] = Field(None, description="Motivo da falha de decodificação; o corpo vem como recebido do SQS")
     queue_url: str = Field(..., description="URL da fila SQS utilizada")
     message: str = Field(..., description="Mensagem descritiva do resultado")
 
+class CodecStatsResponse(BaseModel):
+    """Modelo para resposta de configuração e totais do codec das mensagens SQS."""
+    codec: str = Field(..., description="Compressão padrão (SQS_CODEC)")
+    level: int = Field(..., description="Nível de compressão")
+    min_bytes: int = Field(..., description="Tamanho mínimo de um corpo para ser comprimido")
+    blob_store: Optional[str] = Field(None, description="Blob store dos corpos grandes (None: offload desativado)")
+    blob_threshold_bytes: int = Field(..., description="Tamanho do corpo codificado a partir do qual ele vai para o blob store")
+    encoded: Dict[str, Any] = Field(..., description="Totais das mensagens codificadas, com compression_ratio e bytes_saved")
+    decoded: int = Field(..., description="Mensagens codificadas recebidas e decodificadas")
+
+class CPUJobRequest(BaseModel):
+    """Modelo para requisição de job de stress de CPU."""
+    duration_seconds: int = Field(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)")
+    utilization_percent: float = Field(100.0, gt=0, le=100, description="Utilização alvo de cada núcleo em porcentagem")
+    cores: Optional[int] = Field(None, ge=1, description="Número de núcleos a utilizar (padrão: todos)")
+
+class LoadSegment(BaseModel):
+    """Modelo de um segmento de perfil de carga de CPU."""
+    shape: Literal["flat", "ramp", "step", "sine", "spike"] = Field(..., description="Forma da carga no segmento")
+    duration_seconds: float = Field(..., gt=0, description="Duração do segmento em segundos")
+    utilization_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização constante (flat)")
+    start_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização inicial (ramp)")
+    end_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização final (ramp)")
+    levels_percent: Optional[List[float]] = Field(None, description="Níveis de utilização em degraus de mesma duração (step)")
+    min_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização mínima (sine)")
+    max_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização máxima (sine)")
+    period_seconds: Optional[float] = Field(None, gt=0, description="Período da senoide em segundos (sine)")
+    base_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização fora dos picos (spike)")
+    peak_percent: Optional[float] = Field(None, ge=0, le=100, description="Utilização durante os picos (spike)")
+    spike_seconds: Optional[float] = Field(None, gt=0, description="Duração de cada pico em segundos (spike)")
+    interval_seconds: Optional[float] = Field(None, gt=0, description="Intervalo entre o início dos picos (spike)")
+
+class CPUProfileJobRequest(BaseModel):
+    """Modelo para requisição de job de CPU com perfil de carga variável."""
+    segments: List[LoadSegment] = Field(..., min_length=1, description="Segmentos do perfil, executados em ordem")
+    cores: Optional[int] = Field(None, ge=1, description="Número de núcleos a utilizar (padrão: todos)")
+    sample_interval_seconds: float = Field(1.0, ge=0.1, le=60, description="Intervalo entre amostras de utilização")
+
+class MemoryJobRequest(BaseModel):
+    """Modelo para requisição de job de stress de memória."""
+    duration_seconds: int = Field(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)")
+
+class MemoryTargetJobRequest(BaseModel):
+    """Modelo para requisição de job de memória com tamanho alvo."""
+    target_mb: int = Field(..., ge=1, le=MAX_MEMORY_TARGET_MB, description="Quantidade de memória a alocar em MB")
+    rate_mb_per_second: float = Field(..., gt=0, description="Taxa máxima de alocação em MB/s")
+    hold_seconds: float = Field(0, ge=0, le=MAX_DURATION_SECONDS, description="Tempo em que a memória permanece alocada")
+    release_pattern: Literal["immediate", "linear"] = Field("immediate", description="Forma de liberação da memória")
+    release_seconds: float = Field(0, ge=0, le=MAX_DURATION_SECONDS, description="Duração da liberação no padrão 'linear'")
+    chunk_mb: int = Field(DEFAULT_MEMORY_CHUNK_MB, ge=1, le=1024, description="Tamanho de cada bloco alocado em MB")
+    sample_interval_seconds: float = Field(1.0, ge=0.1, le=60, description="Intervalo entre amostras de RSS")
+
+class MemoryBandwidthJobRequest(BaseModel):
+    """Modelo para requisição de job de banda de memória."""
+    duration_seconds: int = Field(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)")
+    cores: Optional[int] = Field(None, ge=1, description="Número de workers (núcleos) a utilizar (padrão: todos)")
+    buffer_mb: int = Field(DEFAULT_MEMORY_BANDWIDTH_BUFFER_MB, ge=1, le=MAX_MEMORY_BANDWIDTH_BUFFER_MB, description="Tamanho de cada um dos dois buffers de cada worker em MB (maior que o cache L3)")
+    sample_interval_seconds: float = Field(1.0, ge=0.1, le=60, description="Intervalo entre amostras de vazão")
+
+class GCJobRequest(BaseModel):
+    """Modelo para requisição de job de stress do GC."""
+    duration_seconds: int = Field(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)")
+    rate_graphs_per_second: float = Field(0, ge=0, description="Grafos de objetos criados por segundo (0: o mais rápido possível)")
+    graph_size: int = Field(DEFAULT_GC_GRAPH_SIZE, ge=1, le=1_000_000, description="Nós por grafo")
+    cyclic: bool = Field(True, description="Cada nó referencia o pai, gerando lixo cíclico que só o GC libera")
+    retain_graphs: int = Field(DEFAULT_GC_RETAIN_GRAPHS, ge=0, le=100_000, description="Grafos mais recentes mantidos vivos (promovidos às gerações mais velhas)")
+
+class DiskJobRequest(BaseModel):
+    """Modelo para requisição de job de stress de disco."""
+    size_mb: int = Field(..., ge=1, le=MAX_DISK_STRESS_SIZE_MB, description="Tamanho do arquivo temporário em MB")
+    block_kb: int = Field(DEFAULT_DISK_BLOCK_KB, ge=4, le=65536, multiple_of=4, description="Tamanho de cada operação em KB")
+    pattern: Literal["sequential", "random"] = Field("sequential", description="Padrão de acesso aos blocos")
+    operation: Literal["write", "read", "readwrite"] = Field("readwrite", description="Fases executadas em cada passada")
+    io_mode: Literal["buffered", "mmap"] = Field("buffered", description="'buffered' usa pwrite/pread; 'mmap' usa o arquivo mapeado")
+    fsync: Literal["none", "end", "every"] = Field("end", description="fsync nunca, ao fim da escrita ou a cada bloco")
+    drop_cache: bool = Field(True, description="Descarta o page cache do arquivo antes de cada leitura")
+    duration_seconds: float = Field(0, ge=0, le=MAX_DURATION_SECONDS, description="Repete as passadas até este tempo (0: uma passada)")
+
+class StressJobResponse(BaseModel):
+    """Modelo para resposta de estado de um job de stress."""
+    job_id: str = Field(..., description="Identificador do job")
+    kind: str = Field(..., description="Tipo do stress test (cpu, mem, ...)")
+    status: str = Field(..., description="Estado do job: running, completed, failed ou cancelled")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Parâmetros utilizados no job")
+    created_at: float = Field(..., description="Timestamp (epoch) de criação do job")
+    finished_at: Optional[float] = Field(None, description="Timestamp (epoch) de término do job")
+    elapsed_seconds: float = Field(..., description="Tempo decorrido desde o início do job")
+    metrics: Dict[str, Any] = Field(default_factory=dict, description="Métricas parciais atualizadas durante a execução")
+    result: Optional[Dict[str, Any]] = Field(None, description="Resultado final do job")
+    error: Optional[str] = Field(None, description="Mensagem de erro em caso de falha")
+
+class ConsumerStartRequest(BaseModel):
+    """Modelo para requisição de início do consumidor SQS em background."""
+    pollers: int = Field(DEFAULT_SQS_CONSUMER_POLLERS, ge=1, le=64, description="Threads fazendo long polling no SQS")
+    workers: int = Field(DEFAULT_SQS_CONSUMER_WORKERS, ge=1, le=256, description="Threads processando mensagens")
+    prefetch: int = Field(DEFAULT_SQS_CONSUMER_PREFETCH, ge=1, le=10000, description="Capacidade do buffer de prefetch")
+    wait_seconds: int = Field(SQS_MAX_WAIT_SECONDS, ge=0, le=SQS_MAX_WAIT_SECONDS, description="Long polling de cada ReceiveMessage")
+    work_ms: float = Field(0.0, ge=0, le=60000, description="Custo médio simulado de processamento por mensagem em ms")
+    work_jitter_ms: float = Field(0.0, ge=0, le=60000, description="Variação uniforme (+/-) do custo de processamento em ms")
+    work_mode: Literal["sleep", "cpu"] = Field("sleep", description="'sleep' simula I/O; 'cpu' consome CPU")
+    delete_flush_ms: float = Field(
+        DEFAULT_SQS_CONSUMER_DELETE_FLUSH_MS, gt=0, le=10000,
+        description="Tempo máximo que uma confirmação aguarda para formar um lote de deleção"
+    )
+    deleters: int = Field(2, ge=1, le=64, description="Threads confirmando lotes de deleção em paralelo")
 
+class ConsumerStatsResponse(BaseModel):
+    """Modelo para resposta de estado do consumidor SQS."""
+    running: bool = Field(..., description="Indica se o consumidor está em execução")
+    config: Optional[Dict[str, Any]] = Field(None, description="Configuração em uso")
+    started_at: Optional[float] = Field(None, description="Timestamp (epoch) de início")
+    uptime_seconds: float = Field(0.0, description="Tempo de execução em segundos")
+    in_flight: int = Field(0, description="Mensagens em processamento")
+    buffer_depth: int = Field(0, description="Mensagens aguardando no buffer de prefetch")
+    throughput_msgs_per_second: float = Field(0.0, description="Vazão de mensagens processadas por segundo")
+    received: int = Field(0, description="Total de mensagens recebidas")
+    processed: int = Field(0, description="Total de mensagens processadas")
+    deleted: int = Field(0, description="Total de mensagens confirmadas")
+    errors: int = Field(0, description="Total de erros")
@@ -0,0 +1,51 @@
+"""Respostas HTTP pré-serializadas para endpoints de alta frequência.
+
+Endpoints como /healthcheck e /healthcheck/fault são chamados em taxas muito
+altas por load balancers e monitores sintéticos e sempre devolvem os mesmos
+poucos corpos. Em vez de montar um dict e serializá-lo a cada requisição, o
+corpo e os cabeçalhos de cada variação são codificados uma única vez na
+importação e cada requisição apenas cria uma resposta leve apontando para eles.
+"""
+import json
+from typing import Any, Dict, List, Tuple
+
+from starlette.responses import Response
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+class PreEncodedResponse(Response):
+    """Resposta cujo corpo e cabeçalhos já foram codificados.
+
+    Não passa pelo render nem pela montagem de cabeçalhos do Starlette. Uma
+    nova instância é criada por requisição porque o FastAPI atribui as
+    background tasks da requisição ao objeto de resposta retornado.
+    """
+
+    def __init__(self, status_code: int, body: bytes, raw_headers: RawHeaders):
+        self.status_code = status_code
+        self.body = body
+        self.background = None
+        # Cópia rasa: middlewares podem alterar a lista de cabeçalhos enviada
+        self.raw_headers = list(raw_headers)
+
+class PreEncodedJSON:
+    """Corpo JSON fixo codificado uma única vez, com o mesmo formato do JSONResponse.
+
+    Args:
+        content: Conteúdo a ser serializado
+        status_code: Status HTTP da resposta
+    """
+
+    def __init__(self, content: Dict[str, Any], status_code: int = 200):
+        self.status_code = status_code
+        self.body = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        self.raw_headers: RawHeaders = [
+            (b"content-length", str(len(self.body)).encode("latin-1")),
+            (b"content-type", b"application/json"),
+        ]
+
+    def response(self) -> PreEncodedResponse:
+        """Cria a resposta leve para uma requisição."""
+        return PreEncodedResponse(self.status_code, self.body, self.raw_headers)
@@ -0,0 +1,42 @@
+"""Rotas de diagnóstico (expostas apenas com PROFILER_ENABLED)."""
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from ..config import DEFAULT_PROFILE_INTERVAL_MS, MAX_PROFILE_SECONDS
+from ..services.profiler_service import ProfilerBusyError, collect_profile
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+@router.get(
+    "/profile",
+    response_class=PlainTextResponse,
+    summary="Profiling por amostragem",
+    description="Amostra as pilhas de todas as threads durante N segundos e retorna as pilhas no formato collapsed, pronto para flamegraph.pl, speedscope ou inferno",
+    response_description="Uma pilha por linha ('frame;frame;... contagem')"
+)
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=MAX_PROFILE_SECONDS, description="Duração da coleta em segundos"),
+    interval_ms: float = Query(DEFAULT_PROFILE_INTERVAL_MS, ge=1, le=1000, description="Intervalo entre amostras em milissegundos"),
+    group_threads: bool = Query(True, description="Agrupa as threads de um mesmo pool (ex.: 'sqs-io_*') em uma única raiz")
+) -> PlainTextResponse:
+    """Endpoint que coleta um perfil de CPU/espera de todas as threads do processo.
+
+    Cada pilha começa pelo nome da thread, então o event loop ('MainThread'),
+    o threadpool das rotas síncronas e o executor do SQS aparecem separados.
+    O número total de amostras e a duração real vão nos cabeçalhos
+    X-Profile-Samples e X-Profile-Duration-Seconds.
+
+    Raises:
+        HTTPException: 409 se outro perfil já estiver sendo coletado
+    """
+    try:
+        result = await collect_profile(seconds, interval_ms / 1000, group_threads)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return PlainTextResponse(
+        result.collapsed(),
+        headers={
+            "X-Profile-Samples": str(result.samples),
+            "X-Profile-Duration-Seconds": f"{result.duration_seconds:.3f}",
+        }
+    )
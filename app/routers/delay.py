@@ -0,0 +1,66 @@
+"""Rotas de atraso controlado de respostas."""
+import asyncio
+from typing import Annotated, Union
+
+from fastapi import APIRouter, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
+
+from ..models import DelayRequest, DelayResponse
+from ..services.delay_service import sample_delay_seconds, track_in_flight, trickle
+from ..config import MAX_DELAY_CHUNK_BYTES, MAX_DELAY_CHUNKS, MAX_DURATION_SECONDS
+
+router = APIRouter(prefix="/delay", tags=["Latency"])
+
+ChunksQuery = Query(0, ge=0, le=MAX_DELAY_CHUNKS, description="Blocos enviados ao longo do atraso (0: corpo JSON ao final)")
+ChunkBytesQuery = Query(1, ge=1, le=MAX_DELAY_CHUNK_BYTES, description="Tamanho de cada bloco em bytes")
+
+async def _delayed(delay_seconds: float, distribution: str, chunks: int, chunk_bytes: int) -> Union[DelayResponse, StreamingResponse]:
+    """Mantém a requisição aberta pelo atraso informado, opcionalmente gotejando o corpo."""
+    if chunks:
+        return StreamingResponse(trickle(delay_seconds, chunks, chunk_bytes), media_type="text/plain")
+    with track_in_flight():
+        await asyncio.sleep(delay_seconds)
+    return DelayResponse(status="delayed", delay_ms=round(delay_seconds * 1000, 3), distribution=distribution)
+
+@router.get(
+    "/{delay_ms}",
+    response_model=DelayResponse,
+    summary="Atraso fixo",
+    description="Mantém a requisição aberta pelo tempo informado sem ocupar threads; com 'chunks' o corpo é enviado em blocos ao longo do atraso",
+    response_description="Atraso aplicado"
+)
+async def fixed_delay(
+    delay_ms: float = Path(..., ge=0, le=MAX_DURATION_SECONDS * 1000, description="Atraso em milissegundos"),
+    chunks: int = ChunksQuery,
+    chunk_bytes: int = ChunkBytesQuery
+) -> Union[DelayResponse, StreamingResponse]:
+    """Endpoint que responde após um atraso fixo.
+
+    Args:
+        delay_ms: Atraso em milissegundos (até 300 segundos)
+        chunks: Número de blocos do corpo enviados ao longo do atraso
+        chunk_bytes: Tamanho de cada bloco em bytes
+    """
+    return await _delayed(delay_ms / 1000, "fixed", chunks, chunk_bytes)
+
+@router.get(
+    "",
+    response_model=DelayResponse,
+    summary="Atraso sorteado",
+    description="Mantém a requisição aberta por um tempo sorteado da distribuição informada (fixed, uniform, lognormal ou percentiles)",
+    response_description="Atraso aplicado"
+)
+async def sampled_delay(request: Annotated[DelayRequest, Query()]) -> Union[DelayResponse, StreamingResponse]:
+    """Endpoint que responde após um atraso sorteado.
+
+    Os parâmetros da distribuição são os mesmos das regras de fault injection,
+    ex.: ?distribution=percentiles&p50_ms=50&p99_ms=2000
+
+    Raises:
+        HTTPException: 400 se a distribuição for inválida
+    """
+    try:
+        delay_seconds = sample_delay_seconds(request.model_dump(exclude_none=True))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return await _delayed(delay_seconds, request.distribution, request.chunks, request.chunk_bytes)
@@ -1,61 +1,108 @@
 """Rotas de fault injection."""
-import random
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+import asyncio
 
-from ..models import Healthcheck
-from ..config import FAULT_NORMAL_OPTIONS, FAULT_SOFT_WEIGHTS
+from fastapi import APIRouter, HTTPException, status
+
+from ..models import FaultRulesResponse, FaultRulesUpdate, Healthcheck
+from ..responses import PreEncodedResponse
+from ..services.fault_service import FaultRuleNotFoundError, fault_engine
 
 router = APIRouter(tags=["Fault Injection"])
 
+async def _inject(rule_name: str) -> PreEncodedResponse:
+    """Aplica a regra informada: aguarda a latência sorteada e retorna o corpo pré-serializado."""
+    try:
+        body, delay = fault_engine.get(rule_name).decide()
+    except FaultRuleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return body.response()
+
 @router.get(
     "/healthcheck/fault",
     response_model=Healthcheck,
     summary="Fault injection aleatório",
-    description="Endpoint que retorna aleatoriamente status 200 (sucesso) ou 503 (indisponível) com 50% de chance cada",
+    description="Endpoint que retorna aleatoriamente status 200 (sucesso) ou 503 (indisponível) com 50% de chance cada (regra 'normal')",
     response_description="Status aleatório para simulação de falhas"
 )
-def fault() -> JSONResponse:
+async def fault() -> PreEncodedResponse:
     """Endpoint de fault injection que retorna aleatoriamente sucesso ou falha.
-    
-    Retorna:
+
+    Retorna (com a regra 'normal' padrão):
     - 200: Aplicação saudável (50% chance)
     - 503: Serviço indisponível (50% chance)
     """
-    # Seleciona um status aleatoriamente
-    random_status = random.choice(FAULT_NORMAL_OPTIONS)
-    
-    # Monta o corpo da resposta
-    response_body = {
-        "status": random_status,
-        "description": "fault injection"
-    }
-    
-    # Retorna uma resposta JSON com o status code e o corpo definidos dinamicamente
-    return JSONResponse(status_code=random_status, content=response_body)
+    return await _inject("normal")
 
 @router.get(
     "/healthcheck/fault/soft",
     response_model=Healthcheck,
     summary="Fault injection suave",
-    description="Endpoint que retorna majoritariamente status 200 (87.5% chance) e ocasionalmente 503 (12.5% chance)",
+    description="Endpoint que retorna majoritariamente status 200 (87.5% chance) e ocasionalmente 503 (12.5% chance) (regra 'soft')",
     response_description="Status com baixa probabilidade de falha"
 )
-def soft() -> JSONResponse:
+async def soft() -> PreEncodedResponse:
     """Endpoint de fault injection suave com baixa probabilidade de falha.
-    
-    Retorna:
+
+    Retorna (com a regra 'soft' padrão):
     - 200: Aplicação saudável (87.5% chance - 7 em 8)
     - 503: Serviço indisponível (12.5% chance - 1 em 8)
     """
-    # Seleciona um status aleatoriamente com pesos
-    random_status = random.choice(FAULT_SOFT_WEIGHTS)
-    
-    # Monta o corpo da resposta
-    response_body = {
-        "status": random_status,
-        "description": "fault injection"
-    }
-    
-    # Retorna uma resposta JSON com o status code e o corpo definidos dinamicamente
-    return JSONResponse(status_code=random_status, content=response_body)
\ No newline at end of file
+    return await _inject("soft")
+
+@router.get(
+    "/healthcheck/fault/{rule_name}",
+    response_model=Healthcheck,
+    summary="Fault injection por regra",
+    description="Aplica uma regra de fault injection configurada: status sorteado pelos pesos e latência injetada",
+    response_description="Status definido pela regra"
+)
+async def fault_rule(rule_name: str) -> PreEncodedResponse:
+    """Endpoint de fault injection que segue uma regra configurada em /admin/fault-rules.
+
+    Raises:
+        HTTPException: 404 se a regra não existir
+    """
+    return await _inject(rule_name)
+
+@router.get(
+    "/admin/fault-rules",
+    response_model=FaultRulesResponse,
+    summary="Listar regras de fault injection",
+    description="Retorna a semente global e as regras ativas, com probabilidades e número de decisões",
+    response_description="Configuração de fault injection"
+)
+async def get_fault_rules() -> FaultRulesResponse:
+    """Endpoint que retorna a configuração atual de fault injection."""
+    return FaultRulesResponse(**fault_engine.snapshot())
+
+@router.put(
+    "/admin/fault-rules",
+    response_model=FaultRulesResponse,
+    summary="Configurar regras de fault injection",
+    description="Cria ou substitui regras (status com pesos e latência injetada) e opcionalmente redefine a semente, sem reiniciar a aplicação",
+    response_description="Configuração de fault injection resultante"
+)
+async def update_fault_rules(request: FaultRulesUpdate) -> FaultRulesResponse:
+    """Endpoint que reconfigura o fault injection em tempo de execução.
+
+    Raises:
+        HTTPException: 400 se alguma regra for inválida
+    """
+    try:
+        rules = {name: rule.model_dump(exclude_none=True) for name, rule in request.rules.items()}
+        return FaultRulesResponse(**fault_engine.configure(rules, seed=request.seed, replace=request.replace))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete(
+    "/admin/fault-rules",
+    response_model=FaultRulesResponse,
+    summary="Restaurar regras de fault injection",
+    description="Restaura as regras padrão ('normal' e 'soft') e a semente definida em FAULT_SEED",
+    response_description="Configuração de fault injection padrão"
+)
+async def reset_fault_rules() -> FaultRulesResponse:
+    """Endpoint que restaura a configuração padrão de fault injection."""
+    return FaultRulesResponse(**fault_engine.reset())
@@ -1,13 +1,18 @@
 """Rotas de healthcheck."""
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Response, status
 
-from ..models import HealthResponse
+from ..models import HealthResponse, ReadinessResponse
 from ..config import HEALTHTIME_THRESHOLD_SECONDS
+from ..responses import PreEncodedJSON, PreEncodedResponse
+from ..services.load_monitor import load_monitor
 
 router = APIRouter(tags=["Health"])
 
+# Corpos pré-serializados dos endpoints de alta frequência
+HEALTHY_BODY = PreEncodedJSON({"status": "healthy"}, status_code=200)
+ERROR_BODY = PreEncodedJSON({"status": "error"}, status_code=500)
+
 # Tempo de início da aplicação para o endpoint healthtime
 start_time = datetime.now()
 
@@ -18,9 +23,9 @@ start_time = datetime.now()
     description="Endpoint de healthcheck que sempre retorna status saudável (200)",
     response_description="Status de saúde da aplicação"
 )
-def healthcheck() -> JSONResponse:
+async def healthcheck() -> PreEncodedResponse:
     """Endpoint básico de healthcheck que sempre retorna sucesso."""
-    return JSONResponse(content={"status": "healthy"}, status_code=200)
+    return HEALTHY_BODY.response()
 
 @router.get(
     "/healthcheck/error",
@@ -28,9 +33,9 @@ def healthcheck() -> JSONResponse:
     description="Endpoint que sempre retorna erro 500 para simular falhas",
     response_description="Status de erro da aplicação"
 )
-def error() -> JSONResponse:
+async def error() -> PreEncodedResponse:
     """Endpoint que simula uma falha retornando sempre erro 500."""
-    return JSONResponse(content={"status": "error"}, status_code=500)
+    return ERROR_BODY.response()
 
 @router.get(
     "/healthtime",
@@ -49,4 +54,23 @@ def healthtime() -> dict:
     if elapsed_time < timedelta(seconds=HEALTHTIME_THRESHOLD_SECONDS):
         return {"status": "healthy"}
     else:
-        raise HTTPException(status_code=500, detail="Erro no Servidor")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Erro no Servidor")
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness baseado em carga",
+    description="Retorna 200 enquanto o worker aceita requisições e 503 quando o atraso do event loop, as requisições em andamento ou a fila do threadpool excedem os limites configurados",
+    response_description="Estado de prontidão e sinais de carga",
+    responses={503: {"model": ReadinessResponse, "description": "Worker sobrecarregado"}}
+)
+async def ready(response: Response) -> ReadinessResponse:
+    """Endpoint de readiness que reflete a carga real do worker.
+
+    Diferente de /healthcheck (liveness, sempre 200), este endpoint retira o
+    pod do balanceamento enquanto ele estiver sobrecarregado, sem reiniciá-lo.
+    """
+    reason = load_monitor.overload_reason()
+    if reason is not None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(status="overloaded" if reason else "ready", reason=reason, **load_monitor.snapshot())
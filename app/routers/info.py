@@ -2,8 +2,10 @@
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import Response
 
-from ..models import HostnameResponse, VersionResponse
+from ..models import HostnameResponse, ResourceLimitsResponse, StartupResponse, VersionResponse
+from ..services.resource_service import get_memory_ceiling_mb, get_resource_limits
 from ..services.system_service import get_hostname, get_version_from_env
+from ..startup import startup_timings
 
 router = APIRouter(tags=["Info"])
 
@@ -42,4 +44,26 @@ def get_version() -> VersionResponse:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+@router.get(
+    "/resources",
+    response_model=ResourceLimitsResponse,
+    summary="Obter limites de recursos",
+    description="Retorna os limites de CPU (quota CFS e cpuset) e de memória detectados no cgroup do contêiner, usados para dimensionar os stress tests",
+    response_description="Limites de recursos detectados"
+)
+def get_resources() -> ResourceLimitsResponse:
+    """Endpoint que retorna os limites de recursos efetivos do contêiner."""
+    return ResourceLimitsResponse(**get_resource_limits().to_dict(), memory_ceiling_mb=round(get_memory_ceiling_mb(), 1))
+
+@router.get(
+    "/startup",
+    response_model=StartupResponse,
+    summary="Obter tempos de inicialização",
+    description="Retorna a duração das fases de inicialização do worker (interpretador, importações, routers, métricas e lifespan), os subsistemas habilitados e quais dependências pesadas já foram carregadas",
+    response_description="Tempos de inicialização do worker"
+)
+def get_startup() -> StartupResponse:
+    """Endpoint que retorna os tempos de inicialização do worker."""
+    return StartupResponse(**startup_timings.snapshot())
@@ -0,0 +1,242 @@
+"""Rotas de gerenciamento de jobs de stress em background."""
+from typing import List
+
+from fastapi import APIRouter, HTTPException, status
+
+from ..models import (
+    CPUJobRequest, CPUProfileJobRequest, DiskJobRequest, GCJobRequest, MemoryBandwidthJobRequest, MemoryJobRequest,
+    MemoryTargetJobRequest, StressJobResponse
+)
+from ..services.cpu_service import CPUPoolBusyError
+from ..services.job_service import (
+    JobLimitError, JobNotFoundError, job_manager, start_cpu_job, start_cpu_profile_job,
+    start_disk_job, start_gc_job, start_memory_bandwidth_job, start_memory_job, start_memory_target_job
+)
+
+router = APIRouter(prefix="/jobs", tags=["Stress Jobs"])
+
+@router.post(
+    "/cpu",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de stress de CPU",
+    description="Inicia um stress test de CPU em background e retorna imediatamente o ID do job",
+    response_description="Estado inicial do job criado"
+)
+def create_cpu_job(request: CPUJobRequest) -> StressJobResponse:
+    """Inicia um stress test de CPU sem bloquear a aplicação.
+
+    Raises:
+        HTTPException: 409 se outro teste estiver usando o pool de CPU
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+        HTTPException: 500 se não for possível iniciar o teste
+    """
+    try:
+        job = start_cpu_job(request.duration_seconds, request.utilization_percent, request.cores)
+        return StressJobResponse(**job.to_dict())
+    except CPUPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.post(
+    "/cpu/profile",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de CPU com perfil de carga",
+    description="Inicia um stress test de CPU que segue um perfil de carga (ramp, step, sine, spike) e registra a utilização atingida",
+    response_description="Estado inicial do job criado"
+)
+def create_cpu_profile_job(request: CPUProfileJobRequest) -> StressJobResponse:
+    """Inicia um stress test de CPU com carga variável no tempo.
+
+    Raises:
+        HTTPException: 400 se o perfil de carga for inválido
+        HTTPException: 409 se outro teste estiver usando o pool de CPU
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        segments = [segment.model_dump(exclude_none=True) for segment in request.segments]
+        job = start_cpu_profile_job(segments, request.cores, request.sample_interval_seconds)
+        return StressJobResponse(**job.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except CPUPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.post(
+    "/mem",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de stress de memória",
+    description="Inicia um stress test de memória em background e retorna imediatamente o ID do job",
+    response_description="Estado inicial do job criado"
+)
+def create_memory_job(request: MemoryJobRequest) -> StressJobResponse:
+    """Inicia um stress test de memória sem bloquear a aplicação.
+
+    Raises:
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        job = start_memory_job(request.duration_seconds)
+        return StressJobResponse(**job.to_dict())
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.post(
+    "/mem/target",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de memória com tamanho alvo",
+    description="Aloca blocos de memória com páginas tocadas até o tamanho alvo, na taxa definida, mantém e libera conforme o padrão escolhido",
+    response_description="Estado inicial do job criado"
+)
+def create_memory_target_job(request: MemoryTargetJobRequest) -> StressJobResponse:
+    """Inicia um stress test de memória com RSS previsível.
+
+    O alvo é limitado ao espaço livre abaixo do limite de memória do contêiner.
+
+    Raises:
+        HTTPException: 400 se o processo já estiver no teto de memória
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        job = start_memory_target_job(**request.model_dump())
+        return StressJobResponse(**job.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.post(
+    "/mem/bandwidth",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de banda de memória",
+    description="Usa um worker por núcleo para copiar e varrer buffers maiores que o cache do processador e reporta a vazão de memória em GB/s por worker e agregada",
+    response_description="Estado inicial do job criado"
+)
+def create_memory_bandwidth_job(request: MemoryBandwidthJobRequest) -> StressJobResponse:
+    """Inicia um stress test de banda de memória sem bloquear a aplicação.
+
+    O tamanho dos buffers é limitado ao espaço livre abaixo do limite de
+    memória do contêiner.
+
+    Raises:
+        HTTPException: 400 se não houver memória para os buffers
+        HTTPException: 409 se outro teste estiver usando o pool de CPU
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        job = start_memory_bandwidth_job(**request.model_dump())
+        return StressJobResponse(**job.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except CPUPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.post(
+    "/gc",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de stress do GC",
+    description="Cria grafos de objetos (com ciclos de referência opcionais) na taxa e no tamanho definidos, mantendo os mais recentes vivos, e reporta as coletas e pausas do GC por geração",
+    response_description="Estado inicial do job criado"
+)
+def create_gc_job(request: GCJobRequest) -> StressJobResponse:
+    """Inicia um stress test do coletor de lixo cíclico sem bloquear a aplicação.
+
+    As pausas das coletas retêm o GIL e aparecem como latência nas demais
+    requisições; acompanhe o histograma gc_pause_seconds em /metrics.
+
+    Raises:
+        HTTPException: 400 se o número de nós retidos exceder o limite
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        job = start_gc_job(**request.model_dump())
+        return StressJobResponse(**job.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.post(
+    "/disk",
+    response_model=StressJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar job de stress de disco",
+    description="Escreve e/ou lê um arquivo temporário com acesso sequencial ou aleatório, com fsync opcional e modo mmap, e reporta IOPS, MB/s e percentis de latência",
+    response_description="Estado inicial do job criado"
+)
+def create_disk_job(request: DiskJobRequest) -> StressJobResponse:
+    """Inicia um stress test de disco sem bloquear a aplicação.
+
+    O arquivo é criado em DISK_STRESS_DIR (padrão: diretório temporário do
+    sistema) e removido ao final; monte ali o volume que deve ser avaliado.
+
+    Raises:
+        HTTPException: 400 se block_kb for maior que o arquivo ou o diretório não puder recebê-lo
+        HTTPException: 429 se o limite de jobs simultâneos foi atingido
+    """
+    try:
+        job = start_disk_job(**request.model_dump())
+        return StressJobResponse(**job.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+@router.get(
+    "",
+    response_model=List[StressJobResponse],
+    summary="Listar jobs de stress",
+    description="Lista os jobs em execução e os finalizados mais recentes",
+    response_description="Lista de jobs"
+)
+def list_jobs() -> List[StressJobResponse]:
+    """Lista todos os jobs conhecidos."""
+    return [StressJobResponse(**job.to_dict()) for job in job_manager.list()]
+
+@router.get(
+    "/{job_id}",
+    response_model=StressJobResponse,
+    summary="Consultar job de stress",
+    description="Retorna o estado, as métricas parciais e o resultado de um job",
+    response_description="Estado atual do job"
+)
+def get_job(job_id: str) -> StressJobResponse:
+    """Consulta um job pelo seu ID.
+
+    Raises:
+        HTTPException: 404 se o job não existir
+    """
+    try:
+        return StressJobResponse(**job_manager.get(job_id).to_dict())
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.delete(
+    "/{job_id}",
+    response_model=StressJobResponse,
+    summary="Cancelar job de stress",
+    description="Solicita o cancelamento de um job em execução",
+    response_description="Estado do job após o pedido de cancelamento"
+)
+def cancel_job(job_id: str) -> StressJobResponse:
+    """Cancela um job em execução.
+
+    Raises:
+        HTTPException: 404 se o job não existir
+    """
+    try:
+        return StressJobResponse(**job_manager.cancel(job_id).to_dict())
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,9 +1,23 @@
 """Rotas de mensageria."""
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import json
+from typing import Any, AsyncIterator, Optional
 
-from ..models import MessageRequest, MessageResponse, ReceiveMessageResponse
-from ..services.sqs_service import send_message_to_sqs, receive_and_delete_message_from_sqs
-from ..config import get_sqs_queue_url
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from ..models import (
+    BatchReceiveResponse, BulkSendResponse, CodecStatsResponse, ConsumerStartRequest, ConsumerStatsResponse,
+    MessageRequest, MessageResponse, ReceiveMessageResponse, SQSCodec
+)
+from ..services.sqs_codec import get_message_codec
+from ..services.sqs_consumer import ConsumerStateError, get_consumer_stats, start_consumer, stop_consumer
+from ..services.sqs_async import (
+    receive_and_delete_message, receive_and_delete_messages, send_message, send_messages_bulk
+)
+from ..config import (
+    DEFAULT_SQS_BULK_CONCURRENCY, MAX_SQS_BULK_CONCURRENCY, MAX_SQS_RECEIVE_COUNT,
+    MAX_SQS_RECEIVE_TIMEOUT_SECONDS, SQS_MAX_WAIT_SECONDS, get_sqs_queue_url
+)
 
 router = APIRouter(tags=["Messaging"])
 
@@ -14,7 +28,7 @@ router = APIRouter(tags=["Messaging"])
     description="Envia uma mensagem para a fila SQS configurada na variável de ambiente SQS_QUEUE_URL",
     response_description="Confirmação do envio da mensagem com ID gerado"
 )
-def sent_message(request: MessageRequest) -> MessageResponse:
+async def sent_message(request: MessageRequest) -> MessageResponse:
     """Endpoint que envia uma mensagem para a fila SQS.
     
     Args:
@@ -29,12 +43,12 @@ def sent_message(request: MessageRequest) -> MessageResponse:
     """
     try:
         queue_url = get_sqs_queue_url()
-        message_id = send_message_to_sqs(request.message)
+        result = await send_message(request.message, request.codec)
         
         return MessageResponse(
             status="success",
-            message_id=message_id,
-            queue_url=queue_url
+            queue_url=queue_url,
+            **result
         )
         
     except ValueError as e:
@@ -48,6 +62,88 @@ def sent_message(request: MessageRequest) -> MessageResponse:
             detail=str(e)
         )
 
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+def _message_text(item: Any) -> str:
+    """Extrai o texto de uma mensagem do corpo do envio em lote.
+
+    Aceita uma string ou um objeto no formato de MessageRequest ({"message": "..."}).
+    """
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict) and isinstance(item.get("message"), str):
+        return item["message"]
+    raise ValueError("Cada mensagem deve ser uma string ou um objeto {\"message\": \"...\"}")
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[str]:
+    """Lê o corpo NDJSON em streaming, produzindo uma mensagem por linha."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _message_text(json.loads(line))
+    if buffer.strip():
+        yield _message_text(json.loads(buffer))
+
+async def _iter_json_array(request: Request) -> AsyncIterator[str]:
+    """Lê o corpo como um array JSON de mensagens."""
+    items = json.loads(await request.body())
+    if not isinstance(items, list):
+        raise ValueError("O corpo deve ser um array JSON de mensagens")
+    for item in items:
+        yield _message_text(item)
+
+@router.post(
+    "/sent-message/batch",
+    response_model=BulkSendResponse,
+    summary="Enviar mensagens em lote para SQS",
+    description=(
+        "Envia um array JSON ou um corpo NDJSON (application/x-ndjson) de mensagens para a fila SQS, "
+        "agrupando-as em chamadas SendMessageBatch de 10 despachadas concorrentemente"
+    ),
+    response_description="Totais do envio, falhas por entrada e vazão em msgs/s"
+)
+async def sent_message_batch(
+    request: Request,
+    concurrency: int = Query(
+        DEFAULT_SQS_BULK_CONCURRENCY, ge=1, le=MAX_SQS_BULK_CONCURRENCY,
+        description="Número máximo de lotes enviados em paralelo"
+    ),
+    codec: Optional[SQSCodec] = Query(None, description="Compressão dos corpos (padrão: SQS_CODEC)")
+) -> BulkSendResponse:
+    """Endpoint que envia mensagens em massa para a fila SQS.
+
+    O corpo pode ser um array JSON de strings (ou objetos {"message": "..."}) ou
+    NDJSON com uma mensagem por linha; no caso do NDJSON o corpo é processado em
+    streaming e os lotes são enviados enquanto o upload ainda está em andamento.
+    Uma mensagem inválida encontrada depois do envio de algum lote interrompe a
+    leitura e resulta em status 'partial', com a mensagem inválida nas falhas.
+
+    Raises:
+        HTTPException: 400 se a configuração SQS for inválida ou o corpo for
+        inválido antes de qualquer lote ser enviado
+    """
+    try:
+        queue_url = get_sqs_queue_url()
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        messages = _iter_ndjson(request) if content_type in NDJSON_CONTENT_TYPES else _iter_json_array(request)
+        result = await send_messages_bulk(messages, concurrency, codec)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if result["failed"] == 0:
+        result_status = "success"
+    elif result["successful"] > 0:
+        result_status = "partial"
+    else:
+        result_status = "failed"
+    return BulkSendResponse(status=result_status, queue_url=queue_url, **result)
+
 @router.get(
     "/receive-message",
     response_model=ReceiveMessageResponse,
@@ -55,7 +151,7 @@ def sent_message(request: MessageRequest) -> MessageResponse:
     description="Recebe e deleta uma mensagem da fila SQS configurada na variável de ambiente SQS_QUEUE_URL",
     response_description="Mensagem recebida da fila ou indicação de fila vazia"
 )
-def receive_message() -> ReceiveMessageResponse:
+async def receive_message() -> ReceiveMessageResponse:
     """Endpoint que recebe e deleta uma mensagem da fila SQS.
     
     Returns:
@@ -67,7 +163,7 @@ def receive_message() -> ReceiveMessageResponse:
     """
     try:
         queue_url = get_sqs_queue_url()
-        message_data = receive_and_delete_message_from_sqs()
+        message_data = await receive_and_delete_message()
         
         if message_data is None:
             return ReceiveMessageResponse(
@@ -76,10 +172,21 @@ def receive_message() -> ReceiveMessageResponse:
                 message="Nenhuma mensagem disponível na fila"
             )
         
+        if 'decode_error' in message_data:
+            return ReceiveMessageResponse(
+                status="decode_error",
+                message_id=message_data['message_id'],
+                body=message_data['body'],
+                decode_error=message_data['decode_error'],
+                queue_url=queue_url,
+                message="Mensagem recebida mas não decodificada; ela permanece na fila"
+            )
+
         return ReceiveMessageResponse(
             status="success",
             message_id=message_data['message_id'],
             body=message_data['body'],
+            encoding=message_data['encoding'],
             queue_url=queue_url,
             message="Mensagem recebida e removida da fila com sucesso"
         )
@@ -93,4 +200,154 @@ def receive_message() -> ReceiveMessageResponse:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+@router.get(
+    "/receive-message/batch",
+    response_model=BatchReceiveResponse,
+    summary="Receber mensagens do SQS em lote",
+    description=(
+        "Recebe até 'count' mensagens da fila SQS usando long polling de até 10 mensagens por chamada "
+        "e as remove com DeleteMessageBatch, até atingir a quantidade ou o prazo"
+    ),
+    response_description="Mensagens recebidas e número de chamadas à API"
+)
+async def receive_message_batch(
+    count: int = Query(10, ge=1, le=MAX_SQS_RECEIVE_COUNT, description="Número de mensagens desejadas"),
+    wait_seconds: int = Query(
+        SQS_MAX_WAIT_SECONDS, ge=0, le=SQS_MAX_WAIT_SECONDS, description="Long polling de cada ReceiveMessage em segundos"
+    ),
+    timeout_seconds: float = Query(
+        SQS_MAX_WAIT_SECONDS, gt=0, le=MAX_SQS_RECEIVE_TIMEOUT_SECONDS, description="Prazo total da operação em segundos"
+    )
+) -> BatchReceiveResponse:
+    """Endpoint que drena mensagens da fila SQS em lote.
+
+    Returns:
+        BatchReceiveResponse: Mensagens recebidas e estatísticas da operação
+
+    Raises:
+        HTTPException: 500 se houver erro ao receber as mensagens
+        HTTPException: 400 se a configuração SQS estiver inválida
+    """
+    try:
+        queue_url = get_sqs_queue_url()
+        result = await receive_and_delete_messages(count, wait_seconds, timeout_seconds)
+
+        received = len(result['messages'])
+        if received == 0:
+            result_status = "empty"
+        elif received < count:
+            result_status = "partial"
+        else:
+            result_status = "success"
+
+        return BatchReceiveResponse(
+            status=result_status,
+            queue_url=queue_url,
+            requested=count,
+            received=received,
+            **result
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get(
+    "/sqs/codec",
+    response_model=CodecStatsResponse,
+    summary="Estatísticas do codec SQS",
+    description=(
+        "Retorna a configuração do codec das mensagens SQS e os totais acumulados no worker: "
+        "mensagens comprimidas e enviadas ao blob store, bytes originais e enviados, razão de compressão e bytes poupados"
+    ),
+    response_description="Configuração e totais do codec"
+)
+def codec_stats() -> CodecStatsResponse:
+    """Endpoint que retorna as estatísticas do codec das mensagens SQS.
+
+    Raises:
+        HTTPException: 400 se a configuração do codec estiver inválida
+    """
+    try:
+        return CodecStatsResponse(**get_message_codec().stats())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post(
+    "/consumer/start",
+    response_model=ConsumerStatsResponse,
+    summary="Iniciar consumidor SQS",
+    description=(
+        "Inicia o consumidor SQS em background: pollers concorrentes enchem um buffer de prefetch, "
+        "workers simulam o custo de processamento e as mensagens são confirmadas com DeleteMessageBatch"
+    ),
+    response_description="Estado inicial do consumidor"
+)
+def consumer_start(request: ConsumerStartRequest) -> ConsumerStatsResponse:
+    """Endpoint que inicia o consumidor SQS em background.
+
+    Raises:
+        HTTPException: 400 se a configuração SQS estiver inválida
+        HTTPException: 409 se o consumidor já estiver em execução
+    """
+    try:
+        get_sqs_queue_url()
+        return ConsumerStatsResponse(**start_consumer(**request.model_dump()))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ConsumerStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+@router.post(
+    "/consumer/stop",
+    response_model=ConsumerStatsResponse,
+    summary="Parar consumidor SQS",
+    description="Para o consumidor SQS em background, confirmando as mensagens já processadas",
+    response_description="Estatísticas finais do consumidor"
+)
+async def consumer_stop() -> ConsumerStatsResponse:
+    """Endpoint que para o consumidor SQS em background.
+
+    A parada aguarda o fim dos long pollings em andamento, por isso roda em
+    uma thread própria: no executor dedicado ao SQS ela ocuparia por até 20s
+    uma thread dos endpoints de envio e recebimento.
+
+    Raises:
+        HTTPException: 409 se o consumidor não estiver em execução
+    """
+    try:
+        return ConsumerStatsResponse(**await asyncio.to_thread(stop_consumer))
+    except ConsumerStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+@router.get(
+    "/consumer",
+    response_model=ConsumerStatsResponse,
+    summary="Estado do consumidor SQS",
+    description="Retorna configuração, vazão, mensagens em processamento e profundidade do buffer do consumidor",
+    response_description="Estatísticas do consumidor"
+)
+def consumer_stats() -> ConsumerStatsResponse:
+    """Endpoint que retorna as estatísticas do consumidor SQS."""
+    return ConsumerStatsResponse(**get_consumer_stats())
@@ -1,12 +1,18 @@
 """Rotas de performance e stress testing."""
-from fastapi import APIRouter, HTTPException, Path
-from fastapi.responses import JSONResponse
+import asyncio
 
-from ..models import CPUStressResponse, MemoryStressResponse
-from ..services.cpu_service import run_cpu_stress_test
-from ..services.memory_service import run_memory_stress_test
-from ..services.system_service import get_cpu_count
-from ..config import MAX_DURATION_SECONDS
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ..models import CPUStressResponse, MemoryStressResponse, UploadResponse
+from ..services.bandwidth_service import consume_stream, stream_bytes
+from ..services.cpu_service import CPUPoolBusyError
+from ..services.job_service import JOB_FAILED, JobLimitError, start_cpu_job, start_memory_job
+from ..config import (
+    BANDWIDTH_BUFFER_BYTES, DEFAULT_DOWNLOAD_CHUNK_BYTES, MAX_DOWNLOAD_BYTES, MAX_DURATION_SECONDS
+)
 
 router = APIRouter(tags=["Performance"])
 
@@ -18,27 +24,39 @@ router = APIRouter(tags=["Performance"])
     response_description="Status do teste de stress da CPU"
 )
 async def cpu_on_fire(
-    duration_seconds: int = Path(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)")
+    duration_seconds: int = Path(..., ge=1, le=MAX_DURATION_SECONDS, description="Duração em segundos (1-300)"),
+    utilization_percent: float = Query(100.0, gt=0, le=100, description="Utilização alvo de cada núcleo em porcentagem")
 ) -> CPUStressResponse:
     """Endpoint que executa stress test intensivo da CPU.
     
     Args:
         duration_seconds: Duração em segundos para executar o stress test (1-300)
+        utilization_percent: Utilização alvo de cada núcleo (padrão: 100%)
     
     Comportamento:
-    - Cria um processo worker para cada núcleo da CPU disponível
-    - Cada processo executa um loop infinito consumindo 100% do núcleo
+    - Utiliza o pool persistente de workers, um processo por núcleo da CPU
+    - Cada worker mantém a utilização alvo do núcleo através de duty cycle
     - Executa pelo tempo especificado no parâmetro duration_seconds
-    - Finaliza todos os processos e retorna status 'On Fire'
+    - Ao final os workers voltam ao estado ocioso e retorna status 'On Fire'
+    
+    O teste roda como job em background (ver /jobs); este endpoint apenas
+    aguarda sua conclusão sem bloquear o event loop.
     
     Atenção: Este endpoint pode causar alta utilização de CPU no servidor!
     """
     try:
-        cpu_cores = get_cpu_count()
-        run_cpu_stress_test(duration_seconds, cpu_cores)
-        return CPUStressResponse(status="On Fire")
+        job = start_cpu_job(duration_seconds, utilization_percent)
+    except CPUPoolBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except JobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    await asyncio.wrap_future(job.future)
+    if job.status == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    return CPUStressResponse(status="On Fire")
 
 @router.get(
     "/mem/{duration_seconds}",
@@ -61,15 +79,69 @@ async def mem(
     - Executa loop intensivo para consumir CPU
     - Retorna métricas detalhadas do consumo de recursos
     
+    O teste roda como job em background (ver /jobs); este endpoint apenas
+    aguarda sua conclusão sem bloquear o event loop.
+    
     Atenção: Este endpoint pode causar alta utilização de CPU e memória!
     """
-    actual_duration, items_created, memory_allocated = run_memory_stress_test(duration_seconds)
+    try:
+        job = start_memory_job(duration_seconds)
+    except JobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    await asyncio.wrap_future(job.future)
+    if job.status == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
     
     return MemoryStressResponse(
         status="On Fire",
         message="Operação de consumo de recursos concluída.",
         requested_duration_seconds=duration_seconds,
-        actual_duration_seconds=round(actual_duration, 4),
-        items_created_in_list=items_created,
-        memory_allocated_mb=round(memory_allocated, 2)
-    )
\ No newline at end of file
+        **job.result
+    )
+
+@router.get(
+    "/download/{size_bytes}",
+    summary="Teste de banda: download",
+    description="Envia a quantidade de bytes informada em streaming a partir de um buffer pré-alocado, com taxa máxima opcional",
+    response_description="Corpo binário com o tamanho solicitado",
+    response_class=StreamingResponse
+)
+async def download(
+    size_bytes: int = Path(..., ge=0, le=MAX_DOWNLOAD_BYTES, description="Quantidade de bytes a enviar"),
+    chunk_bytes: int = Query(DEFAULT_DOWNLOAD_CHUNK_BYTES, ge=1, le=BANDWIDTH_BUFFER_BYTES, description="Tamanho de cada chunk enviado"),
+    rate_mb_per_second: Optional[float] = Query(None, gt=0, description="Taxa máxima em MB/s (padrão: sem limite)")
+) -> StreamingResponse:
+    """Endpoint que gera tráfego de saída para medir throughput.
+
+    Args:
+        size_bytes: Quantidade total de bytes do corpo
+        chunk_bytes: Tamanho de cada fatia enviada
+        rate_mb_per_second: Limite opcional de taxa de envio
+
+    Comportamento:
+    - Cada chunk é uma fatia (memoryview) do mesmo buffer pré-alocado, sem cópias
+    - O cabeçalho Content-Length é informado para que o cliente meça a vazão
+    """
+    rate = rate_mb_per_second * 1024 ** 2 if rate_mb_per_second else None
+    return StreamingResponse(
+        stream_bytes(size_bytes, chunk_bytes, rate),
+        media_type="application/octet-stream",
+        headers={"Content-Length": str(size_bytes)}
+    )
+
+@router.post(
+    "/upload",
+    response_model=UploadResponse,
+    summary="Teste de banda: upload",
+    description="Consome o corpo da requisição em streaming, sem armazená-lo, e retorna bytes recebidos, duração e MB/s",
+    response_description="Métricas do upload"
+)
+async def upload(request: Request) -> UploadResponse:
+    """Endpoint que absorve tráfego de entrada para medir throughput.
+
+    O corpo é lido chunk a chunk e descartado, portanto o consumo de memória
+    não depende do tamanho do upload.
+    """
+    result = await consume_stream(request.stream())
+    return UploadResponse(status="success", **result)
@@ -0,0 +1,67 @@
+"""Rotas de telemetria de recursos do processo."""
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from ..models import TelemetryResponse
+from ..services.telemetry_service import get_resource_sampler
+
+router = APIRouter(prefix="/telemetry", tags=["Telemetry"])
+
+@router.get(
+    "",
+    response_model=TelemetryResponse,
+    summary="Amostras de recursos",
+    description="Retorna as amostras de CPU%, RSS, threads, FDs, trocas de contexto e I/O mantidas no buffer circular do sampler",
+    response_description="Amostras mais recentes do processo"
+)
+def get_telemetry(
+    since: int = Query(0, ge=0, description="Retorna apenas amostras com sequência maior que este valor"),
+    limit: Optional[int] = Query(None, ge=1, description="Número máximo de amostras (as mais recentes)")
+) -> TelemetryResponse:
+    """Endpoint que retorna o conteúdo do buffer de telemetria."""
+    sampler = get_resource_sampler()
+    sampler.start()
+    return TelemetryResponse(
+        interval_seconds=sampler.interval_seconds,
+        running=sampler.running,
+        samples=sampler.since(since, limit)
+    )
+
+@router.get(
+    "/stream",
+    summary="Stream de amostras (SSE)",
+    description="Transmite cada nova amostra de recursos como um evento Server-Sent Events; reconexões com Last-Event-ID recebem as amostras perdidas que ainda estão no buffer",
+    response_description="Fluxo text/event-stream com eventos 'sample'",
+    response_class=StreamingResponse
+)
+async def stream_telemetry(
+    last_event_id: Optional[int] = Header(None, description="Sequência da última amostra recebida (reconexão)")
+) -> StreamingResponse:
+    """Endpoint que transmite a telemetria ao vivo para dashboards.
+
+    Cada evento traz 'id' (sequência da amostra) e 'data' (amostra em JSON).
+    O stream verifica novas amostras duas vezes por intervalo do sampler; a
+    desconexão do cliente é detectada no envio seguinte e encerra o gerador.
+    """
+    sampler = get_resource_sampler()
+    sampler.start()
+
+    async def events() -> AsyncIterator[str]:
+        latest = sampler.latest()
+        cursor = last_event_id if last_event_id is not None else (latest["seq"] - 1 if latest else 0)
+        yield f"retry: {int(sampler.interval_seconds * 1000)}\n\n"
+        while True:
+            for sample in sampler.since(cursor):
+                cursor = sample["seq"]
+                yield f"id: {cursor}\nevent: sample\ndata: {json.dumps(sample, separators=(',', ':'))}\n\n"
+            await asyncio.sleep(sampler.interval_seconds / 2)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
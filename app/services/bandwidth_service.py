@@ -0,0 +1,82 @@
+"""Serviços de teste de banda HTTP (download e upload).
+
+O download serve fatias (memoryview) de um único buffer pré-alocado, sem
+copiar nem alocar um novo bloco por chunk. O upload consome o corpo da
+requisição como stream, descartando os dados à medida que chegam.
+"""
+import asyncio
+import os
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional
+
+from ..config import BANDWIDTH_BUFFER_BYTES
+
+# Conteúdo aleatório evita que compressão no caminho distorça a medição
+_buffer: Optional[memoryview] = None
+
+def get_buffer() -> memoryview:
+    """Retorna o buffer pré-alocado do download, criando-o na primeira chamada."""
+    global _buffer
+    if _buffer is None:
+        _buffer = memoryview(os.urandom(BANDWIDTH_BUFFER_BYTES))
+    return _buffer
+
+async def stream_bytes(
+    total_bytes: int,
+    chunk_bytes: int,
+    rate_bytes_per_second: Optional[float] = None
+) -> AsyncIterator[memoryview]:
+    """Gera 'total_bytes' bytes em fatias do buffer pré-alocado.
+
+    Com 'rate_bytes_per_second' cada fatia é liberada segundo um cronograma
+    absoluto (início + bytes enviados / taxa), portanto a taxa média não
+    acumula desvios.
+
+    Args:
+        total_bytes: Quantidade de bytes a enviar
+        chunk_bytes: Tamanho de cada fatia (limitado ao tamanho do buffer)
+        rate_bytes_per_second: Taxa máxima opcional
+    """
+    buffer = get_buffer()
+    chunk_bytes = min(chunk_bytes, len(buffer))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    sent = 0
+    offset = 0
+    while sent < total_bytes:
+        size = min(chunk_bytes, total_bytes - sent, len(buffer) - offset)
+        yield buffer[offset:offset + size]
+        sent += size
+        offset = (offset + size) % len(buffer)
+        if rate_bytes_per_second:
+            delay = start + sent / rate_bytes_per_second - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+async def consume_stream(stream: AsyncIterable[bytes]) -> Dict[str, Any]:
+    """Consome um stream de bytes sem armazená-lo e mede a vazão.
+
+    Args:
+        stream: Corpo da requisição em chunks
+
+    Returns:
+        Dict[str, Any]: Bytes recebidos, número de chunks, duração e MB/s
+    """
+    received = 0
+    chunks = 0
+    start = time.perf_counter()
+    first_byte: Optional[float] = None
+    async for chunk in stream:
+        if chunk and first_byte is None:
+            first_byte = time.perf_counter()
+        received += len(chunk)
+        chunks += 1
+    end = time.perf_counter()
+    duration = end - start
+    return {
+        "bytes_received": received,
+        "chunks": chunks,
+        "duration_seconds": round(duration, 6),
+        "time_to_first_byte_seconds": round(first_byte - start, 6) if first_byte is not None else None,
+        "throughput_mb_per_second": round(received / duration / 1024 ** 2, 3) if duration > 0 else 0.0
+    }
@@ -1,54 +1,514 @@
-"""Serviços relacionados ao stress test de CPU."""
+"""Serviços relacionados ao stress test de CPU e de banda de memória."""
+import atexit
+import math
+import os
 import time
+import threading
 import multiprocessing
-from typing import List
-
-def worker(quit_event: multiprocessing.Event) -> None:
-    """Worker que consome 100% de um núcleo da CPU.
-    
-    Esta função será executada em cada processo filho.
-    Ela entra em um loop infinito ('busy-wait') que consome 100% de um núcleo da CPU.
-    O loop continua até que o 'quit_event' seja sinalizado pelo processo principal.
-    
+from typing import Any, Callable, Dict, List, Optional
+
+from .load_profile import LoadSchedule
+from .resource_service import get_allowed_cpus
+from ..config import (
+    DUTY_CYCLE_CONTROLLER_GAIN, JOB_PROGRESS_INTERVAL_SECONDS, MEMORY_BANDWIDTH_BLOCK_BYTES, get_duty_cycle_period_seconds
+)
+
+# Tempo máximo de espera pela inicialização dos workers do pool
+POOL_START_TIMEOUT_SECONDS = 10.0
+
+# Modos de trabalho dos workers do pool
+MODE_CPU = 0
+MODE_MEMORY_BANDWIDTH = 1
+
+# Byte ausente dos buffers de banda: a busca percorre o bloco inteiro sem encontrá-lo
+SCAN_SENTINEL = b"\xff"
+GB = 1000 ** 3
+
+def _stream_block(src: bytearray, dst: memoryview, offset: int, size: int) -> int:
+    """Copia um bloco de 'src' para 'dst' e varre outro bloco de 'src'; retorna os bytes trafegados.
+
+    A cópia entre memoryviews vira um memcpy (lê e escreve 'size' bytes) e
+    bytearray.find com um byte ausente vira um memchr sobre todo o bloco, ambos
+    sem alocar objetos nem executar bytecode por byte. A varredura usa o bloco
+    a meio buffer de distância, que não está no cache: varrer o bloco recém
+    copiado mediria a banda do cache, não a da memória.
+    """
+    dst[offset:offset + size] = memoryview(src)[offset:offset + size]
+    scan_start = (offset + len(src) // 2) % len(src)
+    scan_end = min(scan_start + size, len(src))
+    src.find(SCAN_SENTINEL, scan_start, scan_end)
+    return 2 * size + scan_end - scan_start
+
+def worker(
+    index: int, targets, achieved, ready, stop, period_seconds: float, cpu: Optional[int] = None,
+    modes=None, moved=None, buffer_bytes=None
+) -> None:
+    """Worker persistente que consome uma fração configurável de um núcleo da CPU.
+
+    Esta função será executada em cada processo do pool.
+    A cada período ela fica em 'busy-wait' durante a fração 'duty' do período e
+    dorme no restante. Um controlador integral ajusta o 'duty' comparando o uso
+    de CPU medido (time.process_time) com a utilização alvo, compensando
+    throttling e competição por CPU.
+
+    No modo de banda de memória o worker aloca dois buffers próprios de
+    'buffer_bytes' e copia e varre blocos entre eles continuamente, somando em
+    'moved' os bytes lidos e escritos. Os buffers são liberados quando o worker
+    volta a ficar ocioso.
+
+    A utilização alvo, o modo e o sinal de parada ficam em memória compartilhada
+    sem lock e são lidos apenas uma vez por período (ou por bloco), fora do loop
+    apertado.
+
+    Args:
+        index: Posição do worker no pool
+        targets: Array compartilhado com a utilização alvo (0.0 a 1.0) de cada worker
+        achieved: Array compartilhado onde o worker publica a utilização medida
+        ready: Array compartilhado onde o worker sinaliza que está pronto
+        stop: Valor compartilhado que sinaliza o encerramento do worker
+        period_seconds: Duração de cada ciclo de trabalho/descanso
+        cpu: CPU à qual o worker é fixado (padrão: sem afinidade)
+        modes: Array compartilhado com o modo de cada worker (MODE_CPU ou MODE_MEMORY_BANDWIDTH)
+        moved: Array compartilhado com os bytes trafegados por cada worker no modo de banda
+        buffer_bytes: Valor compartilhado com o tamanho de cada buffer do modo de banda
+    """
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass
+    duty = 0.0
+    last_target = 0.0
+    last_wall = time.perf_counter()
+    last_cpu = time.process_time()
+    ready[index] = 1
+    src: Optional[bytearray] = None
+    dst: Optional[memoryview] = None
+    offset = 0
+
+    while not stop.value:
+        target = targets[index]
+        if target > 0.0 and modes is not None and modes[index] == MODE_MEMORY_BANDWIDTH:
+            size = buffer_bytes.value
+            if src is None or len(src) != size:
+                # Conteúdo escrito de fato: páginas nunca tocadas apontariam para a página zero do kernel
+                src = bytearray(b"\x5a") * size
+                dst = memoryview(bytearray(b"\xa5") * size)
+                offset = 0
+                last_wall = time.perf_counter()
+                last_cpu = time.process_time()
+            block = min(MEMORY_BANDWIDTH_BLOCK_BYTES, size - offset)
+            moved[index] += _stream_block(src, dst, offset, block)
+            offset = (offset + block) % size
+            now_wall = time.perf_counter()
+            if now_wall - last_wall >= period_seconds:
+                now_cpu = time.process_time()
+                achieved[index] = (now_cpu - last_cpu) / (now_wall - last_wall)
+                last_wall, last_cpu = now_wall, now_cpu
+            continue
+        if src is not None:
+            src = dst = None
+            last_target = 0.0
+
+        if target <= 0.0:
+            # Worker ocioso: apenas aguarda novas ordens
+            achieved[index] = 0.0
+            last_target = 0.0
+            time.sleep(period_seconds)
+            last_wall = time.perf_counter()
+            last_cpu = time.process_time()
+            continue
+
+        if target != last_target:
+            duty = target
+            last_target = target
+
+        cycle_start = time.perf_counter()
+        busy_until = cycle_start + period_seconds * duty
+        while time.perf_counter() < busy_until:
+            # Loop apertado que consome CPU
+            pass
+
+        rest = cycle_start + period_seconds - time.perf_counter()
+        if rest > 0:
+            time.sleep(rest)
+
+        now_wall = time.perf_counter()
+        now_cpu = time.process_time()
+        measured = (now_cpu - last_cpu) / max(now_wall - last_wall, 1e-9)
+        last_wall, last_cpu = now_wall, now_cpu
+
+        achieved[index] = measured
+        duty = min(1.0, max(0.0, duty + DUTY_CYCLE_CONTROLLER_GAIN * (target - measured)))
+
+class CPUPoolBusyError(RuntimeError):
+    """Erro lançado ao reservar o pool de CPU enquanto outro teste o utiliza."""
+
+class CPUBurnerPool:
+    """Pool persistente de processos que geram carga de CPU.
+
+    Os processos são criados uma única vez e reutilizados entre requisições;
+    entre os testes permanecem ociosos (dormindo). Cada worker mantém a
+    utilização alvo definida por set_load através de um controlador de duty cycle.
+
+    Args:
+        size: Número de processos worker (normalmente um por núcleo)
+        period_seconds: Duração do ciclo de duty cycle de cada worker
+        cpus: CPUs às quais os workers são fixados, um por CPU (padrão: sem afinidade)
+    """
+
+    def __init__(self, size: int, period_seconds: float, cpus: Optional[List[int]] = None):
+        self.size = size
+        self.period_seconds = period_seconds
+        self.cpus = list(cpus or [])
+        # 'spawn' evita herdar threads e locks do servidor no processo filho
+        self._context = multiprocessing.get_context("spawn")
+        self._targets = self._context.Array("d", size, lock=False)
+        self._achieved = self._context.Array("d", size, lock=False)
+        self._ready = self._context.Array("b", size, lock=False)
+        self._stop = self._context.Value("b", False, lock=False)
+        self._modes = self._context.Array("b", size, lock=False)
+        self._moved = self._context.Array("d", size, lock=False)
+        self._buffer_bytes = self._context.Value("q", 0, lock=False)
+        self._processes: List[multiprocessing.Process] = []
+        self._lease = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Indica se os processos do pool já foram iniciados."""
+        return bool(self._processes)
+
+    def start(self, timeout_seconds: float = POOL_START_TIMEOUT_SECONDS) -> None:
+        """Inicia os processos worker do pool e aguarda que estejam prontos.
+
+        Aguardar a inicialização evita que o tempo de boot dos processos
+        distorça as primeiras amostras de testes curtos.
+        """
+        if self.started:
+            return
+        for i in range(self.size):
+            process = self._context.Process(
+                target=worker,
+                args=(i, self._targets, self._achieved, self._ready, self._stop, self.period_seconds,
+                      self.cpus[i] if i < len(self.cpus) else None, self._modes, self._moved, self._buffer_bytes),
+                name=f"cpu-burner-{i}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+            print(f"Processo worker {i+1} iniciado no PID {process.pid}")
+
+        deadline = time.monotonic() + timeout_seconds
+        while not all(self._ready) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def set_load(self, utilization: float, cores: Optional[int] = None) -> int:
+        """Define a utilização alvo dos workers.
+
+        Args:
+            utilization: Utilização alvo de cada núcleo (0.0 a 1.0)
+            cores: Número de workers que devem gerar carga (padrão: todos)
+
+        Returns:
+            int: Número de workers efetivamente ativos
+        """
+        utilization = min(1.0, max(0.0, utilization))
+        active = self.size if cores is None else min(max(cores, 0), self.size)
+        for i in range(self.size):
+            self._modes[i] = MODE_CPU
+            self._targets[i] = utilization if i < active else 0.0
+        return active
+
+    def set_bandwidth_load(self, buffer_bytes: int, cores: Optional[int] = None) -> int:
+        """Coloca os workers no modo de banda de memória.
+
+        Args:
+            buffer_bytes: Tamanho de cada um dos dois buffers de cada worker
+            cores: Número de workers que devem gerar carga (padrão: todos)
+
+        Returns:
+            int: Número de workers efetivamente ativos
+        """
+        active = self.size if cores is None else min(max(cores, 0), self.size)
+        self._buffer_bytes.value = buffer_bytes
+        for i in range(self.size):
+            self._moved[i] = 0.0
+            self._modes[i] = MODE_MEMORY_BANDWIDTH if i < active else MODE_CPU
+            self._targets[i] = 1.0 if i < active else 0.0
+        return active
+
+    def moved_bytes(self) -> List[float]:
+        """Retorna os bytes trafegados por cada worker desde o último set_bandwidth_load."""
+        return list(self._moved)
+
+    def idle(self) -> None:
+        """Coloca todos os workers em estado ocioso."""
+        self.set_load(0.0)
+
+    def achieved(self) -> List[float]:
+        """Retorna a utilização medida de cada worker (0.0 a 1.0)."""
+        return list(self._achieved)
+
+    def lease(self) -> "PoolLease":
+        """Reserva o pool para uso exclusivo de um teste.
+
+        A reserva é feita na chamada, e não ao entrar no bloco 'with'. Assim
+        quem inicia um job pode reservar o pool na requisição e entregar a
+        reserva à thread do job.
+
+        Raises:
+            CPUPoolBusyError: Se o pool já estiver sendo utilizado por outro teste
+        """
+        if not self._lease.acquire(blocking=False):
+            raise CPUPoolBusyError("O pool de CPU já está sendo utilizado por outro stress test")
+        return PoolLease(self)
+
+    def shutdown(self) -> None:
+        """Encerra todos os processos do pool."""
+        self._stop.value = True
+        for process in self._processes:
+            process.join(timeout=self.period_seconds * 10)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        for i in range(self.size):
+            self._ready[i] = 0
+        self._stop.value = False
+
+class PoolLease:
+    """Reserva exclusiva do pool de CPU.
+
+    Ao entrar no bloco 'with' os workers são iniciados, se necessário; ao sair,
+    ou ao chamar release(), eles voltam ao estado ocioso e a reserva é liberada.
+
     Args:
-        quit_event: Evento para sinalizar quando parar o worker
+        pool: Pool já reservado
+    """
+
+    def __init__(self, pool: CPUBurnerPool):
+        self.pool = pool
+        self._released = False
+
+    def __enter__(self) -> CPUBurnerPool:
+        self.pool.start()
+        return self.pool
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """Libera a reserva (chamadas repetidas são ignoradas)."""
+        if self._released:
+            return
+        self._released = True
+        try:
+            self.pool.idle()
+        finally:
+            self.pool._lease.release()
+
+_pool: Optional[CPUBurnerPool] = None
+_pool_lock = threading.Lock()
+
+def get_burner_pool() -> CPUBurnerPool:
+    """Retorna o pool global de workers de CPU, criando-o na primeira chamada.
+
+    O pool tem um worker por CPU efetivamente disponível no contêiner (cpuset
+    e quota CFS), cada um fixado à sua CPU.
     """
-    while not quit_event.is_set():
-        # A instrução 'pass' aqui cria um loop apertado que consome CPU
-        pass
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            cpus = get_allowed_cpus()
+            _pool = CPUBurnerPool(size=len(cpus), period_seconds=get_duty_cycle_period_seconds(), cpus=cpus)
+            atexit.register(_pool.shutdown)
+        return _pool
+
+def shutdown_burner_pool() -> None:
+    """Encerra o pool global de workers de CPU, se existir."""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
 
-def run_cpu_stress_test(duration_seconds: int, cpu_cores: int) -> None:
+def run_cpu_stress_test(
+    duration_seconds: int,
+    cpu_cores: int,
+    utilization: float = 1.0,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    lease: Optional[PoolLease] = None
+) -> List[Dict[str, Any]]:
     """Executa stress test de CPU por um tempo determinado.
-    
+
     Args:
         duration_seconds: Duração do teste em segundos
         cpu_cores: Número de núcleos de CPU para usar
+        utilization: Utilização alvo de cada núcleo (0.0 a 1.0)
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe métricas parciais do teste
+        lease: Reserva do pool já obtida por quem iniciou o teste (padrão: reserva aqui)
+
+    Returns:
+        List[Dict[str, Any]]: Amostras de utilização alvo e atingida
+
+    Raises:
+        CPUPoolBusyError: Se o pool de CPU já estiver em uso e nenhuma reserva for informada
     """
-    print(f"Iniciando stress test em {cpu_cores} núcleo(s) da CPU...")
-    
-    # Criar evento para controlar os workers
-    quit_event = multiprocessing.Event()
-    processes: List[multiprocessing.Process] = []
-    
-    try:
-        # Iniciar um processo worker para cada núcleo da CPU
-        for i in range(cpu_cores):
-            process = multiprocessing.Process(target=worker, args=(quit_event,))
-            processes.append(process)
-            process.start()
-            print(f"Processo worker {i+1} iniciado no PID {process.pid}")
-        
-        # Esperar pela duração especificada
-        time.sleep(duration_seconds)
-        
-    finally:
-        # Sinalizar para todos os processos pararem
-        print("Enviando sinal para parar os processos workers...")
-        quit_event.set()
-        
-        # Esperar que todos os processos terminem
-        for process in processes:
-            process.join()
-        
-        print("Stress test concluído.")
+    return run_cpu_profile_test(
+        LoadSchedule.flat(duration_seconds, utilization), cpu_cores,
+        stop_event=stop_event, on_progress=on_progress, lease=lease
+    )
+
+def run_cpu_profile_test(
+    schedule: LoadSchedule,
+    cpu_cores: int,
+    sample_interval_seconds: float = JOB_PROGRESS_INTERVAL_SECONDS,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    lease: Optional[PoolLease] = None
+) -> List[Dict[str, Any]]:
+    """Executa stress test de CPU seguindo um perfil de carga variável no tempo.
+
+    A utilização alvo do perfil é aplicada ao pool a cada intervalo de
+    amostragem e também em cada borda do perfil (início de segmento, degrau
+    de 'step', início e fim de 'spike'). A cada intervalo a utilização
+    efetivamente atingida pelos workers é registrada junto ao alvo vigente,
+    permitindo comparar a curva solicitada com a entregue pelo nó.
+
+    Args:
+        schedule: Perfil de carga a ser seguido
+        cpu_cores: Número de núcleos de CPU para usar
+        sample_interval_seconds: Intervalo entre atualizações do alvo e amostras
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe a amostra mais recente
+        lease: Reserva do pool já obtida por quem iniciou o teste (padrão: reserva aqui)
+
+    Returns:
+        List[Dict[str, Any]]: Amostras com tempo decorrido, timestamp (epoch),
+        utilização alvo e utilização atingida, em porcentagem
+
+    Raises:
+        CPUPoolBusyError: Se o pool de CPU já estiver em uso e nenhuma reserva for informada
+    """
+    print(f"Iniciando stress test em {cpu_cores} núcleo(s) da CPU por {schedule.total_seconds:.0f} segundo(s)...")
+    stop_event = stop_event or threading.Event()
+    samples: List[Dict[str, Any]] = []
+
+    with lease or get_burner_pool().lease() as pool:
+        start_time = time.monotonic()
+        elapsed = 0.0
+        next_sample = sample_interval_seconds
+        target = schedule.utilization_at(0.0)
+        active = pool.set_load(target, cpu_cores)
+
+        # Acorda em instantes absolutos: nas amostras (início + k * intervalo) e
+        # nas bordas do perfil, para que degraus e picos curtos não atrasem nem
+        # se percam entre duas amostras
+        while elapsed < schedule.total_seconds:
+            wake_at = min(next_sample, schedule.next_change(elapsed), schedule.total_seconds)
+            if stop_event.wait(max(0.0, wake_at - (time.monotonic() - start_time))):
+                break
+            elapsed = time.monotonic() - start_time
+            if elapsed >= min(next_sample, schedule.total_seconds):
+                achieved = pool.achieved()[:active]
+                sample = {
+                    "elapsed_seconds": round(elapsed, 3),
+                    "timestamp": time.time(),
+                    "target_utilization_percent": round(target * 100, 1),
+                    "achieved_utilization_percent": round(100 * sum(achieved) / max(active, 1), 1),
+                    "workers": active
+                }
+                samples.append(sample)
+                if on_progress is not None:
+                    on_progress(sample)
+                next_sample = (math.floor(elapsed / sample_interval_seconds) + 1) * sample_interval_seconds
+            target = schedule.utilization_at(elapsed)
+            pool.set_load(target, cpu_cores)
+
+    print("Stress test concluído.")
+    return samples
+
+def run_memory_bandwidth_test(
+    duration_seconds: int,
+    cpu_cores: int,
+    buffer_mb: int,
+    sample_interval_seconds: float = JOB_PROGRESS_INTERVAL_SECONDS,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    lease: Optional[PoolLease] = None
+) -> Dict[str, Any]:
+    """Executa stress test de banda de memória com um worker por núcleo.
+
+    Cada worker do pool de CPU copia e varre blocos entre dois buffers próprios
+    de 'buffer_mb' (maiores que o cache do processador, para que o tráfego vá à
+    DRAM). A vazão conta os bytes lidos e escritos pela cópia e os lidos pela
+    varredura, feita sobre um bloco que não acabou de ser copiado. A medição começa quando todos os workers terminam de preencher
+    os buffers. Workers com vazão bem menor que os demais, ou uma vazão
+    agregada que não cresce com o número de núcleos, indicam banda de memória
+    disputada mesmo com a CPU em 100%.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+        cpu_cores: Número de workers (núcleos) a utilizar
+        buffer_mb: Tamanho de cada um dos dois buffers de cada worker em MB
+        sample_interval_seconds: Intervalo entre amostras de vazão
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe a amostra mais recente
+        lease: Reserva do pool já obtida por quem iniciou o teste (padrão: reserva aqui)
+
+    Returns:
+        Dict[str, Any]: Vazão agregada e por worker em GB/s e as amostras
+
+    Raises:
+        CPUPoolBusyError: Se o pool de CPU já estiver em uso e nenhuma reserva for informada
+    """
+    print(f"Iniciando stress de banda de memória em {cpu_cores} núcleo(s) por {duration_seconds} segundo(s)...")
+    stop_event = stop_event or threading.Event()
+    samples: List[Dict[str, Any]] = []
+
+    with lease or get_burner_pool().lease() as pool:
+        active = pool.set_bandwidth_load(buffer_mb * 1024 * 1024, cpu_cores)
+        # Aguarda a alocação e o preenchimento dos buffers de todos os workers
+        deadline = time.monotonic() + POOL_START_TIMEOUT_SECONDS
+        while not all(pool.moved_bytes()[:active]) and time.monotonic() < deadline:
+            if stop_event.wait(0.01):
+                break
+
+        start_time = last_time = time.monotonic()
+        first = last = pool.moved_bytes()[:active]
+        elapsed = 0.0
+        while elapsed < duration_seconds:
+            if stop_event.wait(min(duration_seconds - elapsed, sample_interval_seconds)):
+                break
+            now = time.monotonic()
+            moved = pool.moved_bytes()[:active]
+            interval = max(now - last_time, 1e-9)
+            per_worker = [(current - previous) / interval / GB for current, previous in zip(moved, last)]
+            achieved = pool.achieved()[:active]
+            elapsed = now - start_time
+            sample = {
+                "elapsed_seconds": round(elapsed, 3),
+                "timestamp": time.time(),
+                "aggregate_gb_per_second": round(sum(per_worker), 3),
+                "per_worker_gb_per_second": [round(value, 3) for value in per_worker],
+                "cpu_utilization_percent": round(100 * sum(achieved) / max(active, 1), 1),
+                "workers": active
+            }
+            samples.append(sample)
+            if on_progress is not None:
+                on_progress(sample)
+            last, last_time = moved, now
+
+        elapsed = max(last_time - start_time, 1e-9)
+        totals = [(current - initial) / elapsed / GB for current, initial in zip(last, first)]
 
+    print("Stress de banda de memória concluído.")
+    return {
+        "workers": active,
+        "buffer_mb": buffer_mb,
+        "measured_seconds": round(elapsed, 3),
+        "aggregate_gb_per_second": round(sum(totals), 3),
+        "per_worker_gb_per_second": [round(value, 3) for value in totals],
+        "min_worker_gb_per_second": round(min(totals), 3) if totals else None,
+        "max_worker_gb_per_second": round(max(totals), 3) if totals else None,
+        "samples": samples
+    }
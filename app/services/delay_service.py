@@ -0,0 +1,64 @@
+"""Serviços de atraso controlado de respostas.
+
+As esperas usam apenas asyncio.sleep: uma requisição atrasada não ocupa
+thread nem CPU, somente um socket e uma corrotina, de modo que um único
+worker sustenta dezenas de milhares de conexões lentas simultâneas.
+"""
+import asyncio
+import random
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator
+
+from prometheus_client import Gauge
+
+from .fault_service import latency_sampler
+
+# Métrica de conexões mantidas abertas pelos endpoints /delay
+DELAY_IN_FLIGHT = Gauge("delay_requests_in_flight", "Requisições aguardando nos endpoints /delay", multiprocess_mode="livesum")
+
+_rng = random.Random()
+
+def sample_delay_seconds(latency: Dict[str, Any]) -> float:
+    """Sorteia uma duração de atraso a partir de uma especificação de latência.
+
+    Aceita as mesmas distribuições das regras de fault injection
+    (none, fixed, uniform, lognormal e percentiles).
+
+    Raises:
+        ValueError: Se a especificação for inválida
+    """
+    sampler = latency_sampler(latency)
+    return sampler(_rng) if sampler is not None else 0.0
+
+@contextmanager
+def track_in_flight() -> Iterator[None]:
+    """Contabiliza uma requisição atrasada na métrica de conexões abertas."""
+    DELAY_IN_FLIGHT.inc()
+    try:
+        yield
+    finally:
+        DELAY_IN_FLIGHT.dec()
+
+async def trickle(delay_seconds: float, chunks: int, chunk_bytes: int) -> AsyncIterator[bytes]:
+    """Gera o corpo da resposta em blocos distribuídos ao longo do atraso.
+
+    O primeiro bloco é enviado imediatamente (o cliente recebe os cabeçalhos
+    logo no início) e os demais em intervalos regulares, com prazos absolutos
+    para que a duração total não acumule desvios. A conexão permanece aberta
+    até o fim do atraso.
+
+    Args:
+        delay_seconds: Duração total da resposta
+        chunks: Número de blocos enviados
+        chunk_bytes: Tamanho de cada bloco em bytes
+    """
+    with track_in_flight():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        block = b"." * (chunk_bytes - 1) + b"\n"
+        interval = delay_seconds / max(chunks - 1, 1)
+        for i in range(chunks):
+            if i:
+                await asyncio.sleep(max(0.0, start + interval * i - loop.time()))
+            yield block
+        await asyncio.sleep(max(0.0, start + delay_seconds - loop.time()))
@@ -0,0 +1,281 @@
+"""Serviços relacionados ao stress test de disco.
+
+O teste escreve e/ou lê um arquivo temporário com acesso sequencial ou
+aleatório e mede cada operação individualmente, reportando IOPS, MB/s e
+percentis de latência por fase. No modo 'mmap' o arquivo é mapeado em memória
+e as operações viram cópias de/para o mapeamento (page faults e writeback do
+kernel), em vez de chamadas pwrite/pread.
+"""
+import math
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Optional
+
+from ..config import JOB_PROGRESS_INTERVAL_SECONDS, get_disk_stress_dir
+
+MB = 1024 * 1024
+PATTERNS = ("sequential", "random")
+OPERATIONS = ("write", "read", "readwrite")
+IO_MODES = ("buffered", "mmap")
+FSYNC_MODES = ("none", "end", "every")
+
+class LatencyHistogram:
+    """Histograma de latências com buckets em escala logarítmica.
+
+    Usa memória constante independente do número de operações; os percentis
+    têm erro relativo máximo de 'growth' (2%).
+    """
+
+    def __init__(self, min_seconds: float = 1e-7, max_seconds: float = 100.0, growth: float = 1.02):
+        self.min_seconds = min_seconds
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.counts = array("Q", [0]) * (int(math.log(max_seconds / min_seconds) / self._log_growth) + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Registra a latência de uma operação."""
+        index = int(math.log(seconds / self.min_seconds) / self._log_growth) + 1 if seconds > self.min_seconds else 0
+        self.counts[min(index, len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Retorna a latência (em segundos) abaixo da qual está a fração informada das operações."""
+        rank = fraction * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                # Ponto médio geométrico do bucket, limitado ao máximo observado
+                return min(self.min_seconds * self.growth ** (index - 0.5), self.max) if index else self.min_seconds
+        return self.max
+
+    def summary_ms(self) -> Dict[str, float]:
+        """Resumo em milissegundos: média, p50, p90, p99, p99.9 e máximo."""
+        if not self.count:
+            return {}
+        return {
+            "mean": round(self.total / self.count * 1000, 4),
+            "p50": round(self.percentile(0.50) * 1000, 4),
+            "p90": round(self.percentile(0.90) * 1000, 4),
+            "p99": round(self.percentile(0.99) * 1000, 4),
+            "p999": round(self.percentile(0.999) * 1000, 4),
+            "max": round(self.max * 1000, 4),
+        }
+
+def ensure_disk_space(size_mb: int, block_kb: int) -> str:
+    """Valida o arquivo e os blocos pedidos e retorna o diretório utilizado.
+
+    Chamada ao criar o job, para que parâmetros inválidos e um diretório sem
+    espaço ou sem permissão de escrita sejam recusados antes de o job começar.
+
+    Raises:
+        ValueError: Se os tamanhos forem inválidos, o diretório não puder ser
+            escrito ou não houver espaço livre suficiente
+    """
+    if size_mb <= 0 or block_kb <= 0 or block_kb % 4:
+        raise ValueError("size_mb deve ser maior que zero e block_kb um múltiplo de 4")
+    if block_kb * 1024 > size_mb * MB:
+        raise ValueError("block_kb não pode ser maior que o arquivo")
+
+    directory = get_disk_stress_dir()
+    try:
+        free = shutil.disk_usage(directory).free
+    except OSError as e:
+        raise ValueError(f"Diretório de stress de disco '{directory}' inacessível: {e.strerror or e}") from e
+    if not os.access(directory, os.W_OK | os.X_OK):
+        raise ValueError(f"Sem permissão de escrita no diretório de stress de disco '{directory}'")
+    if free < size_mb * MB:
+        raise ValueError(f"Espaço livre insuficiente em '{directory}' para um arquivo de {size_mb} MB")
+    return directory
+
+def _drop_page_cache(fd: int) -> None:
+    """Descarta as páginas do arquivo do page cache para que a leitura vá ao disco."""
+    os.fsync(fd)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+def run_disk_stress_test(
+    size_mb: int,
+    block_kb: int,
+    pattern: str = "sequential",
+    operation: str = "readwrite",
+    io_mode: str = "buffered",
+    fsync: str = "end",
+    drop_cache: bool = True,
+    duration_seconds: float = 0.0,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Executa stress test de disco em um arquivo temporário.
+
+    Cada passada escreve (fase 'write') e/ou lê (fase 'read') todos os blocos
+    do arquivo uma vez, em ordem sequencial ou em uma permutação aleatória.
+    Com 'duration_seconds' as passadas se repetem até o tempo se esgotar,
+    mantendo carga contínua no volume (útil para testes de noisy neighbour).
+
+    Args:
+        size_mb: Tamanho do arquivo em MB
+        block_kb: Tamanho de cada operação em KB (múltiplo de 4)
+        pattern: Padrão de acesso ('sequential' ou 'random')
+        operation: Fases executadas ('write', 'read' ou 'readwrite')
+        io_mode: 'buffered' usa pwrite/pread; 'mmap' usa o arquivo mapeado em memória
+        fsync: 'none', 'end' (uma vez ao fim da escrita) ou 'every' (a cada bloco)
+        drop_cache: Descarta o page cache do arquivo antes de cada leitura
+        duration_seconds: Tempo mínimo de execução (0 executa uma única passada)
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe métricas parciais do teste
+
+    Returns:
+        Dict[str, Any]: Configuração, diretório utilizado e, por fase,
+        operações, bytes, IOPS, MB/s e percentis de latência em ms
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou não houver espaço em disco
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Padrão de acesso inválido. Opções: {', '.join(PATTERNS)}")
+    if operation not in OPERATIONS:
+        raise ValueError(f"Operação inválida. Opções: {', '.join(OPERATIONS)}")
+    if io_mode not in IO_MODES:
+        raise ValueError(f"Modo de I/O inválido. Opções: {', '.join(IO_MODES)}")
+    if fsync not in FSYNC_MODES:
+        raise ValueError(f"Modo de fsync inválido. Opções: {', '.join(FSYNC_MODES)}")
+    directory = ensure_disk_space(size_mb, block_kb)
+
+    block_size = block_kb * 1024
+    file_size = size_mb * MB
+
+    stop_event = stop_event or threading.Event()
+    blocks = file_size // block_size
+    offsets = [i * block_size for i in range(blocks)]
+    phases = ["write", "read"] if operation == "readwrite" else [operation]
+    data = os.urandom(block_size)
+    buffer = bytearray(block_size)
+    stats = {
+        phase: {"operations": 0, "bytes": 0, "duration_seconds": 0.0, "latencies": LatencyHistogram()}
+        for phase in phases
+    }
+
+    fd, path = tempfile.mkstemp(prefix="disk-stress-", dir=directory)
+    mapping: Optional[mmap.mmap] = None
+    view: Optional[memoryview] = None
+    start_time = time.monotonic()
+    last_progress = start_time
+    passes = 0
+    print(f"Iniciando stress test de disco em {path}: {size_mb} MB, blocos de {block_kb} KB, {pattern}, {io_mode}...")
+
+    try:
+        os.ftruncate(fd, file_size)
+        if io_mode == "mmap":
+            mapping = mmap.mmap(fd, file_size)
+            view = memoryview(mapping)
+        if "write" not in phases:
+            # Leitura pura: o arquivo precisa existir com conteúdo real
+            for offset in offsets:
+                os.pwrite(fd, data, offset)
+            os.fsync(fd)
+
+        while not stop_event.is_set():
+            for phase in phases:
+                if pattern == "random":
+                    random.shuffle(offsets)
+                if phase == "read" and drop_cache:
+                    if mapping is not None:
+                        mapping.flush()
+                        if hasattr(mmap, "MADV_DONTNEED"):
+                            mapping.madvise(mmap.MADV_DONTNEED)
+                    _drop_page_cache(fd)
+
+                phase_stats = stats[phase]
+                latencies = phase_stats["latencies"]
+                phase_start = time.perf_counter()
+                for offset in offsets:
+                    op_start = time.perf_counter()
+                    if phase == "write":
+                        if view is not None:
+                            view[offset:offset + block_size] = data
+                            if fsync == "every":
+                                mapping.flush(offset, block_size)
+                        else:
+                            os.pwrite(fd, data, offset)
+                            if fsync == "every":
+                                os.fsync(fd)
+                    elif view is not None:
+                        buffer[:] = view[offset:offset + block_size]
+                    else:
+                        os.preadv(fd, [buffer], offset)
+                    latencies.record(time.perf_counter() - op_start)
+
+                    if stop_event.is_set():
+                        break
+                    if on_progress is not None and time.monotonic() - last_progress >= JOB_PROGRESS_INTERVAL_SECONDS:
+                        last_progress = time.monotonic()
+                        done = latencies.count - phase_stats["operations"]
+                        elapsed = time.perf_counter() - phase_start
+                        on_progress({
+                            "elapsed_seconds": round(time.monotonic() - start_time, 2),
+                            "pass": passes + 1,
+                            "phase": phase,
+                            "operations": latencies.count,
+                            "throughput_mb_per_second": round(done * block_size / elapsed / MB, 2) if elapsed else 0.0,
+                        })
+
+                if phase == "write" and fsync == "end":
+                    if mapping is not None:
+                        mapping.flush()
+                    os.fsync(fd)
+                completed = latencies.count - phase_stats["operations"]
+                phase_stats["operations"] = latencies.count
+                phase_stats["bytes"] += completed * block_size
+                phase_stats["duration_seconds"] += time.perf_counter() - phase_start
+                if stop_event.is_set():
+                    break
+            else:
+                passes += 1
+            if time.monotonic() - start_time >= duration_seconds:
+                break
+    finally:
+        if view is not None:
+            view.release()
+        if mapping is not None:
+            mapping.close()
+        os.close(fd)
+        os.unlink(path)
+
+    results: Dict[str, Any] = {}
+    for phase, phase_stats in stats.items():
+        duration = phase_stats["duration_seconds"]
+        results[phase] = {
+            "operations": phase_stats["operations"],
+            "bytes": phase_stats["bytes"],
+            "duration_seconds": round(duration, 4),
+            "iops": round(phase_stats["operations"] / duration, 1) if duration > 0 else 0.0,
+            "throughput_mb_per_second": round(phase_stats["bytes"] / duration / MB, 2) if duration > 0 else 0.0,
+            "latency_ms": phase_stats["latencies"].summary_ms(),
+        }
+
+    print("Stress test de disco concluído.")
+    return {
+        "directory": directory,
+        "size_mb": size_mb,
+        "block_kb": block_kb,
+        "pattern": pattern,
+        "operation": operation,
+        "io_mode": io_mode,
+        "fsync": fsync,
+        "passes": passes,
+        "elapsed_seconds": round(time.monotonic() - start_time, 3),
+        "phases": results,
+    }
@@ -0,0 +1,264 @@
+"""Motor de regras de fault injection.
+
+Cada regra define uma mistura arbitrária de status HTTP com pesos e uma
+distribuição de latência injetada. O sorteio do status usa uma tabela de alias
+(método de Vose), com custo O(1) por requisição independente do número de
+status, e os corpos de resposta de cada status são pré-serializados na
+compilação da regra.
+
+Cada regra possui seu próprio gerador pseudoaleatório derivado da semente
+global e do nome da regra. Com uma semente definida, a sequência de decisões
+de cada rota é reproduzível entre execuções.
+"""
+import math
+import random
+import re
+import threading
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import FAULT_BODYLESS_STATUSES, FAULT_MAX_LATENCY_MS, FAULT_NORMAL_WEIGHTS, FAULT_SOFT_WEIGHTS, get_fault_seed
+from ..responses import PreEncodedJSON
+
+DISTRIBUTIONS = ("none", "fixed", "uniform", "lognormal", "percentiles")
+RULE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Quantil 99 da normal padrão, usado para converter p50/p99 em uma lognormal
+Z_P99 = NormalDist().inv_cdf(0.99)
+
+class FaultRuleNotFoundError(LookupError):
+    """Erro lançado quando uma regra de fault injection não existe."""
+
+class AliasTable:
+    """Tabela de alias para sorteio ponderado em tempo constante (método de Vose).
+
+    Args:
+        weights: Pesos relativos (positivos) de cada opção
+    """
+
+    def __init__(self, weights: List[float]):
+        if not weights or any(weight <= 0 for weight in weights):
+            raise ValueError("Os pesos devem ser positivos e a lista não pode ser vazia")
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        self.probability = [1.0] * size
+        self.alias = list(range(size))
+
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Sobras de arredondamento ficam com probabilidade 1.0
+
+    def sample(self, rng: random.Random) -> int:
+        """Sorteia o índice de uma opção."""
+        column = int(rng.random() * len(self.probability))
+        return column if rng.random() < self.probability[column] else self.alias[column]
+
+def _latency_ms(latency: Dict[str, Any], key: str) -> float:
+    """Lê um campo de latência obrigatório, em milissegundos."""
+    value = latency.get(key)
+    if value is None:
+        raise ValueError(f"Distribuição '{latency.get('distribution')}' requer o campo '{key}'")
+    if not 0 <= value <= FAULT_MAX_LATENCY_MS:
+        raise ValueError(f"Campo '{key}' deve estar entre 0 e {FAULT_MAX_LATENCY_MS} ms")
+    return float(value)
+
+def latency_sampler(latency: Dict[str, Any]) -> Optional[Callable[[random.Random], float]]:
+    """Compila uma especificação de latência em uma função de amostragem.
+
+    Args:
+        latency: Especificação com 'distribution' e os parâmetros da distribuição
+
+    Returns:
+        Função que recebe o gerador da regra e retorna a latência em segundos,
+        ou None quando a regra não injeta latência
+
+    Raises:
+        ValueError: Se a especificação for inválida
+    """
+    distribution = latency.get("distribution", "none")
+    cap_ms = latency.get("cap_ms") or FAULT_MAX_LATENCY_MS
+
+    if distribution == "none":
+        return None
+
+    if distribution == "fixed":
+        seconds = _latency_ms(latency, "ms") / 1000
+        return lambda rng: seconds
+
+    if distribution == "uniform":
+        low, high = _latency_ms(latency, "min_ms"), _latency_ms(latency, "max_ms")
+        if low > high:
+            raise ValueError("'min_ms' deve ser menor ou igual a 'max_ms'")
+        return lambda rng: rng.uniform(low, high) / 1000
+
+    if distribution in ("lognormal", "percentiles"):
+        if distribution == "lognormal":
+            median = _latency_ms(latency, "median_ms")
+            sigma = latency.get("sigma")
+            if sigma is None or sigma < 0:
+                raise ValueError("Distribuição 'lognormal' requer o campo 'sigma' maior ou igual a zero")
+        else:
+            median, p99 = _latency_ms(latency, "p50_ms"), _latency_ms(latency, "p99_ms")
+            if p99 < median:
+                raise ValueError("'p99_ms' deve ser maior ou igual a 'p50_ms'")
+            sigma = math.log(p99 / median) / Z_P99 if median > 0 else 0.0
+        if median <= 0:
+            return lambda rng: 0.0
+        mu = math.log(median)
+        return lambda rng: min(rng.lognormvariate(mu, sigma), cap_ms) / 1000
+
+    raise ValueError(f"Distribuição de latência desconhecida: '{distribution}'. Opções: {', '.join(DISTRIBUTIONS)}")
+
+class FaultRule:
+    """Regra compilada de fault injection.
+
+    Args:
+        name: Nome da regra, usado na rota /healthcheck/fault/{name}
+        spec: Definição com 'outcomes' ([{'status', 'weight'}]), 'latency' e 'description'
+        seed: Semente global; None usa uma semente aleatória
+
+    Raises:
+        ValueError: Se a definição for inválida
+    """
+
+    def __init__(self, name: str, spec: Dict[str, Any], seed: Optional[int]):
+        if not RULE_NAME_PATTERN.match(name):
+            raise ValueError(f"Nome de regra inválido: '{name}'. Use letras, números, '_' ou '-' (até 64)")
+        outcomes = spec.get("outcomes") or []
+        if not outcomes:
+            raise ValueError(f"A regra '{name}' deve ter pelo menos um status em 'outcomes'")
+        for outcome in outcomes:
+            if not 200 <= outcome["status"] <= 599 or outcome["status"] in FAULT_BODYLESS_STATUSES:
+                raise ValueError("Os status devem estar entre 200 e 599, exceto 204, 205 e 304 (sem corpo)")
+
+        self.name = name
+        self.spec = spec
+        self.decisions = 0
+        self._table = AliasTable([outcome["weight"] for outcome in outcomes])
+        self._bodies = [
+            PreEncodedJSON({"status": outcome["status"], "description": "fault injection"}, status_code=outcome["status"])
+            for outcome in outcomes
+        ]
+        self._latency = latency_sampler(spec.get("latency") or {})
+        self._rng = random.Random(f"{seed}:{name}") if seed is not None else random.Random()
+
+    def decide(self) -> Tuple[PreEncodedJSON, float]:
+        """Sorteia a resposta e a latência (em segundos) de uma requisição."""
+        self.decisions += 1
+        body = self._bodies[self._table.sample(self._rng)]
+        delay = self._latency(self._rng) if self._latency is not None else 0.0
+        return body, delay
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retorna a definição da regra com as probabilidades normalizadas."""
+        total = sum(outcome["weight"] for outcome in self.spec["outcomes"])
+        return {
+            "description": self.spec.get("description"),
+            "outcomes": [
+                dict(outcome, probability=round(outcome["weight"] / total, 6)) for outcome in self.spec["outcomes"]
+            ],
+            "latency": self.spec.get("latency") or {"distribution": "none"},
+            "decisions": self.decisions,
+        }
+
+def _weights_to_outcomes(weights: Dict[int, float]) -> List[Dict[str, Any]]:
+    return [{"status": status, "weight": weight} for status, weight in weights.items()]
+
+# Regras padrão servidas por /healthcheck/fault e /healthcheck/fault/soft: nunca são removidas
+DEFAULT_RULES: Dict[str, Dict[str, Any]] = {
+    "normal": {
+        "description": "200 ou 503 com 50% de chance cada",
+        "outcomes": _weights_to_outcomes(FAULT_NORMAL_WEIGHTS),
+    },
+    "soft": {
+        "description": "200 com 87.5% de chance e 503 com 12.5%",
+        "outcomes": _weights_to_outcomes(FAULT_SOFT_WEIGHTS),
+    },
+}
+
+class FaultEngine:
+    """Conjunto de regras de fault injection reconfigurável em tempo de execução.
+
+    As regras são substituídas de forma atômica (copy-on-write), portanto as
+    requisições em andamento nunca observam uma configuração parcial.
+
+    Args:
+        seed: Semente global inicial; None usa sementes aleatórias
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._rules: Dict[str, FaultRule] = {
+            name: FaultRule(name, spec, seed) for name, spec in DEFAULT_RULES.items()
+        }
+
+    def get(self, name: str) -> FaultRule:
+        """Retorna a regra com o nome informado.
+
+        Raises:
+            FaultRuleNotFoundError: Se a regra não existir
+        """
+        rule = self._rules.get(name)
+        if rule is None:
+            raise FaultRuleNotFoundError(f"Regra de fault injection '{name}' não encontrada")
+        return rule
+
+    def configure(
+        self,
+        rules: Dict[str, Dict[str, Any]],
+        seed: Optional[int] = None,
+        replace: bool = False
+    ) -> Dict[str, Any]:
+        """Cria ou atualiza regras sem reiniciar a aplicação.
+
+        Args:
+            rules: Definições das regras, por nome
+            seed: Nova semente global; quando informada todas as regras são
+                recriadas para reproduzir a sequência desde o início
+            replace: Remove as regras que não estiverem em 'rules', exceto as
+                padrão ('normal' e 'soft'), que apenas podem ser redefinidas
+
+        Returns:
+            Dict[str, Any]: Configuração resultante
+
+        Raises:
+            ValueError: Se alguma regra for inválida (nenhuma alteração é aplicada)
+        """
+        with self._lock:
+            effective_seed = self.seed if seed is None else seed
+            if replace:
+                updated = {name: rule for name, rule in self._rules.items() if name in DEFAULT_RULES}
+            else:
+                updated = dict(self._rules)
+            if seed is not None:
+                # As regras em uso pelas requisições nunca são alteradas: todas são recriadas com a nova semente
+                updated = {
+                    name: FaultRule(name, rule.spec, effective_seed) for name, rule in updated.items() if name not in rules
+                }
+            updated.update((name, FaultRule(name, spec, effective_seed)) for name, spec in rules.items())
+            self.seed = effective_seed
+            self._rules = updated
+            return self.snapshot()
+
+    def reset(self) -> Dict[str, Any]:
+        """Restaura as regras padrão e a semente definida em FAULT_SEED."""
+        with self._lock:
+            self.seed = get_fault_seed()
+            self._rules = {name: FaultRule(name, spec, self.seed) for name, spec in DEFAULT_RULES.items()}
+            return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna a semente e as regras atuais."""
+        rules = self._rules
+        return {"seed": self.seed, "rules": {name: rule.to_dict() for name, rule in rules.items()}}
+
+# Instância global usada pelas rotas de fault injection
+fault_engine = FaultEngine(seed=get_fault_seed())
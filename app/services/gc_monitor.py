@@ -0,0 +1,179 @@
+"""Instrumentação das pausas do coletor de lixo cíclico via gc.callbacks.
+
+O callback é chamado pelo interpretador no início e no fim de cada coleta,
+na thread que a disparou e com o GIL retido: enquanto ele roda, nenhuma
+outra thread Python (incluindo o event loop) avança. Por isso o callback só
+mede a duração e acrescenta um evento às filas inscritas, sem locks. Chamar
+as métricas do prometheus_client ali poderia travar o processo: uma coleta
+disparada por uma alocação feita com o lock de uma métrica retido tentaria
+adquirir o mesmo lock. Uma thread própria drena a fila e atualiza as
+métricas a cada intervalo.
+"""
+import gc
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+
+from ..config import GC_MONITOR_FLUSH_INTERVAL_SECONDS
+
+# Pausas de geração 0 ficam na faixa de microssegundos; coletas completas podem passar de 1s
+GC_PAUSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+GENERATIONS = ("0", "1", "2")
+# Pausas mantidas por geração para os percentis dos resumos
+GC_PAUSE_SAMPLE_SIZE = 10000
+
+GC_PAUSE = Histogram(
+    "gc_pause_seconds", "Duração das coletas do GC cíclico por geração (o _count é o número de coletas)",
+    ["generation"], buckets=GC_PAUSE_BUCKETS
+)
+GC_COLLECTED = Counter("gc_collected_objects_total", "Objetos inalcançáveis liberados pelo GC por geração", ["generation"])
+GC_UNCOLLECTABLE = Counter("gc_uncollectable_objects_total", "Objetos que o GC não conseguiu liberar por geração", ["generation"])
+
+# (geração, duração em segundos, objetos coletados, objetos não coletáveis)
+GCEvent = Tuple[int, float, int, int]
+
+class GCMonitor:
+    """Mede as pausas do GC e as publica como métricas Prometheus.
+
+    Args:
+        flush_interval_seconds: Intervalo de atualização das métricas
+    """
+
+    def __init__(self, flush_interval_seconds: float = GC_MONITOR_FLUSH_INTERVAL_SECONDS):
+        self.flush_interval_seconds = flush_interval_seconds
+        self._started_at: Optional[float] = None
+        # Tupla substituída por inteiro ao inscrever ou remover filas: o callback nunca vê uma lista pela metade
+        self._sinks: Tuple[Any, ...] = ()
+        self._pending: Optional[Deque[GCEvent]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _callback(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._started_at = time.perf_counter()
+            return
+        started_at = self._started_at
+        if started_at is None:
+            return
+        self._started_at = None
+        now = time.perf_counter()
+        event = (info["generation"], now - started_at, info["collected"], info["uncollectable"])
+        for sink in self._sinks:
+            sink.append(event)
+
+    @property
+    def installed(self) -> bool:
+        """Indica se o callback está registrado em gc.callbacks."""
+        return self._callback in gc.callbacks
+
+    def subscribe(self) -> Deque[GCEvent]:
+        """Registra o callback, se necessário, e retorna uma fila que recebe cada coleta."""
+        sink: Deque[GCEvent] = deque()
+        with self._lock:
+            self._sinks = self._sinks + (sink,)
+            if not self.installed:
+                gc.callbacks.append(self._callback)
+        return sink
+
+    def unsubscribe(self, sink: Deque[GCEvent]) -> None:
+        """Deixa de enviar coletas para a fila."""
+        with self._lock:
+            self._sinks = tuple(s for s in self._sinks if s is not sink)
+
+    def start(self) -> None:
+        """Registra o callback e inicia a thread que publica as métricas."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+        self._pending = self.subscribe()
+        self._thread = threading.Thread(target=self._run, name="gc-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Remove o callback, publica as coletas pendentes e encerra a thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.flush_interval_seconds * 2 + 1)
+            self._thread = None
+        with self._lock:
+            if self.installed:
+                gc.callbacks.remove(self._callback)
+            self._sinks = ()
+        self.flush()
+        self._pending = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """Publica nas métricas as coletas registradas desde a última chamada."""
+        pending = self._pending
+        if pending is None:
+            return
+        while True:
+            try:
+                generation, duration, collected, uncollectable = pending.popleft()
+            except IndexError:
+                return
+            label = GENERATIONS[generation]
+            GC_PAUSE.labels(label).observe(duration)
+            if collected:
+                GC_COLLECTED.labels(label).inc(collected)
+            if uncollectable:
+                GC_UNCOLLECTABLE.labels(label).inc(uncollectable)
+
+class PauseStats:
+    """Acumula as coletas drenadas de uma fila inscrita, por geração.
+
+    Contagens, totais e máximos são exatos; os percentis usam as últimas
+    'sample_size' pausas de cada geração.
+    """
+
+    def __init__(self, sample_size: int = GC_PAUSE_SAMPLE_SIZE):
+        self._collections = [0, 0, 0]
+        self._collected = [0, 0, 0]
+        self._total = [0.0, 0.0, 0.0]
+        self._max = [0.0, 0.0, 0.0]
+        self._pauses: List[Deque[float]] = [deque(maxlen=sample_size) for _ in GENERATIONS]
+
+    def drain(self, sink: Deque[GCEvent]) -> None:
+        """Consome as coletas registradas na fila."""
+        while True:
+            try:
+                generation, duration, collected, _ = sink.popleft()
+            except IndexError:
+                return
+            self._collections[generation] += 1
+            self._collected[generation] += collected
+            self._total[generation] += duration
+            self._max[generation] = max(self._max[generation], duration)
+            self._pauses[generation].append(duration)
+
+    @property
+    def total_pause_seconds(self) -> float:
+        return sum(self._total)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Resume as coletas por geração: quantidade, objetos liberados e pausas em ms."""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for index, label in enumerate(GENERATIONS):
+            pauses = sorted(self._pauses[index])
+            count = len(pauses)
+            summary[label] = {
+                "collections": self._collections[index],
+                "collected_objects": self._collected[index],
+                "pause_total_ms": round(self._total[index] * 1000, 3),
+                "pause_p50_ms": round(pauses[(count - 1) // 2] * 1000, 3) if count else None,
+                "pause_p99_ms": round(pauses[max(0, int(count * 0.99) - 1)] * 1000, 3) if count else None,
+                "pause_max_ms": round(self._max[index] * 1000, 3) if count else None,
+            }
+        return summary
+
+# Instância global do monitor do GC
+gc_monitor = GCMonitor()
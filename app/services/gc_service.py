@@ -0,0 +1,130 @@
+"""Stress test do coletor de lixo cíclico.
+
+O teste cria grafos de objetos (árvores de nós) em uma taxa configurável e
+mantém apenas os últimos 'retain_graphs' grafos vivos. Os grafos retidos
+sobrevivem às coletas de geração 0 e são promovidos às gerações 1 e 2,
+encarecendo as coletas dessas gerações. Com 'cyclic', cada nó referencia o pai
+e o grafo descartado vira lixo cíclico, que só o GC consegue liberar. Sem
+'cyclic' a contagem de referências libera os grafos imediatamente e o GC só
+percorre os objetos.
+
+As coletas param todas as threads Python enquanto duram, então as pausas
+medidas pelo gc_monitor aparecem como latência nas requisições atendidas
+durante o teste.
+"""
+import gc
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .gc_monitor import PauseStats, gc_monitor
+from ..config import JOB_PROGRESS_INTERVAL_SECONDS, MAX_GC_RETAINED_OBJECTS
+
+# Filhos por nó: árvores largas e rasas, como payloads JSON desserializados
+NODE_FANOUT = 4
+
+class _Node:
+    __slots__ = ("parent", "children", "payload")
+
+    def __init__(self, parent: Optional["_Node"], payload: Any):
+        self.parent = parent
+        self.children: List["_Node"] = []
+        self.payload = payload
+
+def build_graph(size: int, cyclic: bool) -> _Node:
+    """Cria uma árvore de 'size' nós; com 'cyclic' cada filho referencia o pai."""
+    root = _Node(None, {"id": 0})
+    frontier: Deque[_Node] = deque([root])
+    for index in range(1, size):
+        parent = frontier[0]
+        node = _Node(parent if cyclic else None, {"id": index})
+        parent.children.append(node)
+        frontier.append(node)
+        if len(parent.children) >= NODE_FANOUT:
+            frontier.popleft()
+    return root
+
+def run_gc_stress_test(
+    duration_seconds: float,
+    rate_graphs_per_second: float = 0.0,
+    graph_size: int = 1000,
+    cyclic: bool = True,
+    retain_graphs: int = 10,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Executa o stress do GC e resume as coletas ocorridas durante o teste.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+        rate_graphs_per_second: Grafos criados por segundo (0: o mais rápido possível)
+        graph_size: Nós por grafo (cada nó tem ainda um dict de payload)
+        cyclic: Cria referências de cada nó para o pai (lixo cíclico)
+        retain_graphs: Grafos mais recentes mantidos vivos
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe métricas parciais do teste
+
+    Returns:
+        Dict[str, Any]: Grafos criados, taxa atingida e coletas por geração
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos
+    """
+    if graph_size < 1 or rate_graphs_per_second < 0 or retain_graphs < 0:
+        raise ValueError("graph_size deve ser maior que zero; rate_graphs_per_second e retain_graphs não podem ser negativos")
+    if retain_graphs * graph_size > MAX_GC_RETAINED_OBJECTS:
+        raise ValueError(f"retain_graphs * graph_size não pode exceder {MAX_GC_RETAINED_OBJECTS} nós")
+
+    stop_event = stop_event or threading.Event()
+    retained: Deque[_Node] = deque(maxlen=retain_graphs or None)
+    events = gc_monitor.subscribe()
+    stats = PauseStats()
+    graphs = 0
+    print(f"Iniciando stress do GC por {duration_seconds} segundo(s) (grafos de {graph_size} nós, cyclic={cyclic})...")
+
+    start = time.monotonic()
+    deadline = start + duration_seconds
+    last_progress = start
+    try:
+        while True:
+            now = time.monotonic()
+            if now >= deadline or stop_event.is_set():
+                break
+            if rate_graphs_per_second > 0:
+                # Cronograma absoluto: atrasos não acumulam desvio na taxa média
+                due = start + graphs / rate_graphs_per_second
+                if due > now:
+                    if stop_event.wait(min(due, deadline) - now):
+                        break
+                    continue
+            graph = build_graph(graph_size, cyclic)
+            if retain_graphs:
+                retained.append(graph)
+            del graph
+            graphs += 1
+            if now - last_progress >= JOB_PROGRESS_INTERVAL_SECONDS:
+                last_progress = now
+                stats.drain(events)
+                if on_progress is not None:
+                    on_progress({
+                        "elapsed_seconds": round(now - start, 2),
+                        "graphs_created": graphs,
+                        "gc_counts": list(gc.get_count()),
+                        "gc": stats.summary(),
+                    })
+    finally:
+        retained.clear()
+        gc_monitor.unsubscribe(events)
+        stats.drain(events)
+
+    actual_duration = time.monotonic() - start
+    print(f"Operação concluída em {actual_duration:.2f} segundos.")
+    return {
+        "actual_duration_seconds": round(actual_duration, 4),
+        "graphs_created": graphs,
+        "nodes_created": graphs * graph_size,
+        "achieved_graphs_per_second": round(graphs / actual_duration, 2) if actual_duration > 0 else None,
+        "gc_pause_total_ms": round(stats.total_pause_seconds * 1000, 3),
+        "gc": stats.summary(),
+    }
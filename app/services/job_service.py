@@ -0,0 +1,453 @@
+"""Serviços de execução de stress tests como jobs em background.
+
+Os stress tests são bloqueantes (loops intensivos e esperas), portanto são
+executados em threads dedicadas fora do event loop. Assim o uvicorn continua
+respondendo a /healthcheck e /metrics durante toda a execução do teste.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .cpu_service import (
+    PoolLease, get_burner_pool, run_cpu_profile_test, run_cpu_stress_test, run_memory_bandwidth_test
+)
+from .disk_service import ensure_disk_space, run_disk_stress_test
+from .gc_service import run_gc_stress_test
+from .load_profile import LoadSchedule
+from .memory_service import run_memory_stress_test, run_memory_target_test
+from .resource_service import cap_memory_target_mb, get_effective_cpu_count, get_memory_headroom_mb
+from .telemetry_service import get_rss_mb
+from ..config import (
+    DEFAULT_GC_GRAPH_SIZE, DEFAULT_GC_RETAIN_GRAPHS, DEFAULT_MEMORY_BANDWIDTH_BUFFER_MB, DEFAULT_MEMORY_CHUNK_MB, JOB_HISTORY_SIZE,
+    JOB_PROGRESS_INTERVAL_SECONDS, MAX_DURATION_SECONDS,
+    MAX_GC_RETAINED_OBJECTS, get_max_concurrent_jobs
+)
+
+# Estados possíveis de um job
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+class JobLimitError(RuntimeError):
+    """Erro lançado quando o limite de jobs simultâneos é atingido."""
+
+class JobNotFoundError(LookupError):
+    """Erro lançado quando o job solicitado não existe."""
+
+@dataclass
+class StressJob:
+    """Estado de um stress test executado em background."""
+    kind: str
+    params: Dict[str, Any]
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_RUNNING
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    stop_event: threading.Event = field(default_factory=threading.Event)
+    future: Optional[Future] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Tempo decorrido desde a criação do job (ou até seu término)."""
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - self.created_at
+
+    def report(self, metrics: Dict[str, Any]) -> None:
+        """Publica métricas parciais do job (chamado pela thread do stress test)."""
+        self.metrics = dict(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável do job."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "params": self.params,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "metrics": self.metrics,
+            "result": self.result,
+            "error": self.error,
+        }
+
+class JobManager:
+    """Gerencia a execução, consulta e cancelamento de jobs de stress.
+
+    Args:
+        max_concurrent: Número máximo de jobs executando ao mesmo tempo
+        history_size: Quantidade de jobs finalizados mantidos para consulta
+    """
+
+    def __init__(self, max_concurrent: int, history_size: int = JOB_HISTORY_SIZE):
+        self.max_concurrent = max_concurrent
+        self.history_size = history_size
+        self._jobs: "OrderedDict[str, StressJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="stress-job")
+
+    def running_count(self) -> int:
+        """Retorna a quantidade de jobs em execução."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status == JOB_RUNNING)
+
+    def submit(self, kind: str, params: Dict[str, Any], target: Callable[[StressJob], Optional[Dict[str, Any]]]) -> StressJob:
+        """Inicia um novo job em background.
+
+        Args:
+            kind: Tipo do stress test
+            params: Parâmetros do teste (apenas para exibição)
+            target: Função que executa o teste recebendo o próprio job
+
+        Returns:
+            StressJob: Job criado, já em execução
+
+        Raises:
+            JobLimitError: Se o limite de jobs simultâneos foi atingido
+        """
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == JOB_RUNNING)
+            if running >= self.max_concurrent:
+                raise JobLimitError(
+                    f"Limite de {self.max_concurrent} job(s) de stress simultâneo(s) atingido"
+                )
+            job = StressJob(kind=kind, params=params)
+            self._jobs[job.job_id] = job
+            self._trim_history()
+            job.future = self._executor.submit(self._run, job, target)
+        return job
+
+    def get(self, job_id: str) -> StressJob:
+        """Retorna um job pelo seu ID.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job '{job_id}' não encontrado")
+        return job
+
+    def list(self) -> List[StressJob]:
+        """Retorna todos os jobs conhecidos, do mais antigo para o mais recente."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> StressJob:
+        """Solicita o cancelamento de um job em execução.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        job = self.get(job_id)
+        job.stop_event.set()
+        return job
+
+    def cancel_all(self) -> None:
+        """Solicita o cancelamento de todos os jobs em execução."""
+        for job in self.list():
+            job.stop_event.set()
+
+    def _run(self, job: StressJob, target: Callable[[StressJob], Optional[Dict[str, Any]]]) -> StressJob:
+        try:
+            job.result = target(job)
+            job.status = JOB_CANCELLED if job.stop_event.is_set() else JOB_COMPLETED
+        except Exception as e:
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+        return job
+
+    def _trim_history(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.status != JOB_RUNNING]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self._jobs[job_id]
+
+# Instância global do gerenciador de jobs
+job_manager = JobManager(max_concurrent=get_max_concurrent_jobs())
+
+def _submit_burner_job(
+    kind: str, params: Dict[str, Any], target: Callable[[StressJob, PoolLease], Optional[Dict[str, Any]]]
+) -> StressJob:
+    """Reserva o pool de CPU e submete um job que o utiliza.
+
+    A reserva é feita na requisição: um segundo job que precise do pool é
+    recusado na hora, em vez de ser aceito e falhar na thread do job. A
+    thread do job recebe a reserva e a libera ao terminar.
+
+    Raises:
+        CPUPoolBusyError: Se outro teste estiver usando o pool
+        JobLimitError: Se o limite de jobs simultâneos foi atingido
+    """
+    lease = get_burner_pool().lease()
+
+    def run(job: StressJob) -> Optional[Dict[str, Any]]:
+        try:
+            return target(job, lease)
+        finally:
+            lease.release()
+
+    try:
+        return job_manager.submit(kind, params, run)
+    except BaseException:
+        lease.release()
+        raise
+
+def start_cpu_job(duration_seconds: int, utilization_percent: float = 100.0, cores: Optional[int] = None) -> StressJob:
+    """Inicia um stress test de CPU em background.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+        utilization_percent: Utilização alvo de cada núcleo em porcentagem
+        cores: Número de núcleos a utilizar (padrão: todos os disponíveis no contêiner)
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        CPUPoolBusyError: Se outro teste estiver usando o pool de CPU
+    """
+    available = get_effective_cpu_count()
+    cpu_cores = min(cores or available, available)
+    params = {"duration_seconds": duration_seconds, "cpu_cores": cpu_cores, "utilization_percent": utilization_percent}
+
+    def target(job: StressJob, lease: PoolLease) -> Dict[str, Any]:
+        samples = run_cpu_stress_test(
+            duration_seconds, cpu_cores, utilization=utilization_percent / 100,
+            stop_event=job.stop_event, on_progress=job.report, lease=lease
+        )
+        return {"status": "On Fire", **params, "samples": samples}
+
+    return _submit_burner_job("cpu", params, target)
+
+def start_cpu_profile_job(
+    segments: List[Dict[str, Any]],
+    cores: Optional[int] = None,
+    sample_interval_seconds: float = 1.0
+) -> StressJob:
+    """Inicia um stress test de CPU com perfil de carga variável em background.
+
+    Args:
+        segments: Segmentos do perfil de carga (ver load_profile)
+        cores: Número de núcleos a utilizar (padrão: todos os disponíveis no contêiner)
+        sample_interval_seconds: Intervalo entre amostras de utilização
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        ValueError: Se o perfil for inválido ou exceder a duração máxima
+        CPUPoolBusyError: Se outro teste estiver usando o pool de CPU
+    """
+    schedule = LoadSchedule(segments)
+    if schedule.total_seconds > MAX_DURATION_SECONDS:
+        raise ValueError(f"A duração total do perfil não pode exceder {MAX_DURATION_SECONDS} segundos")
+    available = get_effective_cpu_count()
+    cpu_cores = min(cores or available, available)
+    params = {"segments": segments, "cpu_cores": cpu_cores, "total_seconds": schedule.total_seconds}
+
+    def target(job: StressJob, lease: PoolLease) -> Dict[str, Any]:
+        samples = run_cpu_profile_test(
+            schedule, cpu_cores, sample_interval_seconds,
+            stop_event=job.stop_event, on_progress=job.report, lease=lease
+        )
+        errors = [abs(s["target_utilization_percent"] - s["achieved_utilization_percent"]) for s in samples]
+        return {
+            "cpu_cores": cpu_cores,
+            "mean_abs_error_percent": round(sum(errors) / len(errors), 2) if errors else None,
+            "samples": samples
+        }
+
+    return _submit_burner_job("cpu-profile", params, target)
+
+def start_memory_job(duration_seconds: int) -> StressJob:
+    """Inicia um stress test de memória em background.
+
+    O teste é interrompido antes do fim se o uso de memória atingir o teto
+    abaixo do limite do contêiner. O espaço livre é medido no início contra o
+    uso do contêiner inteiro e vira um teto para o RSS deste processo.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+
+    Returns:
+        StressJob: Job criado
+    """
+    rss_mb = get_rss_mb(JOB_PROGRESS_INTERVAL_SECONDS)
+    max_rss_mb = rss_mb + max(0.0, get_memory_headroom_mb(rss_mb))
+
+    def target(job: StressJob) -> Dict[str, Any]:
+        actual_duration, items_created, memory_allocated = run_memory_stress_test(
+            duration_seconds, stop_event=job.stop_event, on_progress=job.report, max_rss_mb=max_rss_mb
+        )
+        return {
+            "actual_duration_seconds": round(actual_duration, 4),
+            "items_created_in_list": items_created,
+            "memory_allocated_mb": round(memory_allocated, 2),
+        }
+
+    params = {"duration_seconds": duration_seconds, "max_rss_mb": round(max_rss_mb, 1)}
+    return job_manager.submit("mem", params, target)
+
+def start_memory_target_job(
+    target_mb: int,
+    rate_mb_per_second: float,
+    hold_seconds: float = 0.0,
+    release_pattern: str = "immediate",
+    release_seconds: float = 0.0,
+    chunk_mb: int = DEFAULT_MEMORY_CHUNK_MB,
+    sample_interval_seconds: float = 1.0
+) -> StressJob:
+    """Inicia um stress test de memória com tamanho alvo em background.
+
+    O alvo é reduzido, se necessário, para que o processo fique abaixo do teto
+    de memória do contêiner (limite do cgroup menos MEMORY_LIMIT_HEADROOM_PERCENT).
+
+    Args:
+        target_mb: Quantidade de memória a alocar em MB
+        rate_mb_per_second: Taxa máxima de alocação em MB/s
+        hold_seconds: Tempo em que a memória permanece alocada
+        release_pattern: Forma de liberação ('immediate' ou 'linear')
+        release_seconds: Duração da liberação no padrão 'linear'
+        chunk_mb: Tamanho de cada bloco alocado em MB
+        sample_interval_seconds: Intervalo entre amostras de RSS
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        ValueError: Se o processo já estiver no teto de memória
+    """
+    params = {
+        "requested_target_mb": target_mb,
+        "target_mb": cap_memory_target_mb(target_mb, get_rss_mb(JOB_PROGRESS_INTERVAL_SECONDS)),
+        "rate_mb_per_second": rate_mb_per_second,
+        "hold_seconds": hold_seconds,
+        "release_pattern": release_pattern,
+        "release_seconds": release_seconds,
+        "chunk_mb": chunk_mb
+    }
+
+    def target(job: StressJob) -> Dict[str, Any]:
+        return run_memory_target_test(
+            params["target_mb"], rate_mb_per_second, hold_seconds, release_pattern, release_seconds, chunk_mb,
+            sample_interval_seconds=sample_interval_seconds,
+            stop_event=job.stop_event,
+            on_progress=job.report
+        )
+
+    return job_manager.submit("mem-target", params, target)
+
+def start_memory_bandwidth_job(
+    duration_seconds: int,
+    cores: Optional[int] = None,
+    buffer_mb: int = DEFAULT_MEMORY_BANDWIDTH_BUFFER_MB,
+    sample_interval_seconds: float = 1.0
+) -> StressJob:
+    """Inicia um stress test de banda de memória em background.
+
+    Cada worker usa dois buffers de 'buffer_mb'; o tamanho é reduzido, se
+    necessário, para que os buffers de todos os workers caibam abaixo do teto
+    de memória do contêiner.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+        cores: Número de workers (núcleos) a utilizar (padrão: todos os disponíveis no contêiner)
+        buffer_mb: Tamanho de cada buffer em MB
+        sample_interval_seconds: Intervalo entre amostras de vazão
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        ValueError: Se os buffers não couberem abaixo do teto de memória
+        CPUPoolBusyError: Se outro teste estiver usando o pool de CPU
+    """
+    available = get_effective_cpu_count()
+    cpu_cores = min(cores or available, available)
+    buffers = 2 * cpu_cores
+    capped_mb = cap_memory_target_mb(buffers * buffer_mb, get_rss_mb(JOB_PROGRESS_INTERVAL_SECONDS)) // buffers
+    if capped_mb < 1:
+        raise ValueError("Não há memória abaixo do teto do contêiner para os buffers de todos os workers")
+    params = {
+        "duration_seconds": duration_seconds,
+        "cpu_cores": cpu_cores,
+        "requested_buffer_mb": buffer_mb,
+        "buffer_mb": capped_mb
+    }
+
+    def target(job: StressJob, lease: PoolLease) -> Dict[str, Any]:
+        return run_memory_bandwidth_test(
+            duration_seconds, cpu_cores, capped_mb, sample_interval_seconds,
+            stop_event=job.stop_event, on_progress=job.report, lease=lease
+        )
+
+    return _submit_burner_job("mem-bandwidth", params, target)
+
+def start_disk_job(**params: Any) -> StressJob:
+    """Inicia um stress test de disco em background.
+
+    Args:
+        **params: Parâmetros de run_disk_stress_test (size_mb, block_kb,
+            pattern, operation, io_mode, fsync, drop_cache, duration_seconds)
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        ValueError: Se os tamanhos forem inválidos ou o diretório não puder
+            receber o arquivo temporário (sem permissão ou sem espaço livre)
+    """
+    ensure_disk_space(params["size_mb"], params["block_kb"])
+
+    def target(job: StressJob) -> Dict[str, Any]:
+        return run_disk_stress_test(stop_event=job.stop_event, on_progress=job.report, **params)
+
+    return job_manager.submit("disk", params, target)
+
+def start_gc_job(
+    duration_seconds: int,
+    rate_graphs_per_second: float = 0.0,
+    graph_size: int = DEFAULT_GC_GRAPH_SIZE,
+    cyclic: bool = True,
+    retain_graphs: int = DEFAULT_GC_RETAIN_GRAPHS
+) -> StressJob:
+    """Inicia um stress test do GC cíclico em background.
+
+    Args:
+        duration_seconds: Duração do teste em segundos
+        rate_graphs_per_second: Grafos criados por segundo (0: o mais rápido possível)
+        graph_size: Nós por grafo
+        cyclic: Cria referências de cada nó para o pai (lixo cíclico)
+        retain_graphs: Grafos mais recentes mantidos vivos
+
+    Returns:
+        StressJob: Job criado
+
+    Raises:
+        ValueError: Se o número de nós retidos exceder o limite
+    """
+    if retain_graphs * graph_size > MAX_GC_RETAINED_OBJECTS:
+        raise ValueError(f"retain_graphs * graph_size não pode exceder {MAX_GC_RETAINED_OBJECTS} nós")
+    params = {
+        "duration_seconds": duration_seconds,
+        "rate_graphs_per_second": rate_graphs_per_second,
+        "graph_size": graph_size,
+        "cyclic": cyclic,
+        "retain_graphs": retain_graphs
+    }
+
+    def target(job: StressJob) -> Dict[str, Any]:
+        return run_gc_stress_test(stop_event=job.stop_event, on_progress=job.report, **params)
+
+    return job_manager.submit("gc", params, target)
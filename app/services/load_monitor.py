@@ -0,0 +1,141 @@
+"""Monitor de carga do worker: atraso do event loop, requisições em andamento e threadpool.
+
+Uma tarefa assíncrona acorda a cada intervalo e mede quanto o event loop
+atrasou o despertar (lag), além de ler a ocupação e a fila de espera do
+threadpool padrão do AnyIO, usado pelas rotas síncronas do FastAPI. O
+contador de requisições em andamento é mantido pelo middleware de load
+shedding. Todos os sinais são exportados como métricas Prometheus e usados
+para decidir se o worker deve recusar novas requisições.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import anyio.to_thread
+from prometheus_client import Counter, Gauge
+
+from ..config import (
+    LOAD_MONITOR_INTERVAL_SECONDS, get_load_shed_max_in_flight, get_load_shed_max_lag_ms,
+    get_load_shed_max_threadpool_queue
+)
+
+EVENT_LOOP_LAG = Gauge("event_loop_lag_seconds", "Atraso do event loop medido no último intervalo", multiprocess_mode="livemax")
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "Requisições HTTP em andamento", multiprocess_mode="livesum")
+THREADPOOL_BUSY = Gauge("threadpool_busy_threads", "Threads ocupadas do threadpool das rotas síncronas", multiprocess_mode="livesum")
+THREADPOOL_QUEUE = Gauge("threadpool_queue_depth", "Tarefas aguardando uma thread livre do threadpool", multiprocess_mode="livesum")
+REQUESTS_SHED = Counter("http_requests_shed_total", "Requisições recusadas com 503 por sobrecarga", ["reason"])
+OVERLOADED = Gauge("load_overloaded", "1 se o worker está recusando requisições por sobrecarga", multiprocess_mode="livemax")
+
+REASON_EVENT_LOOP_LAG = "event_loop_lag"
+REASON_IN_FLIGHT = "in_flight"
+REASON_THREADPOOL_QUEUE = "threadpool_queue"
+
+@dataclass
+class LoadLimits:
+    """Limites de admissão; 0 desabilita o limite correspondente."""
+
+    max_lag_seconds: float
+    max_in_flight: int
+    max_threadpool_queue: int
+
+class LoadMonitor:
+    """Acompanha os sinais de carga do worker e decide sobre a admissão.
+
+    Args:
+        limits: Limites de admissão
+        interval_seconds: Intervalo de medição do lag e do threadpool
+    """
+
+    def __init__(self, limits: LoadLimits, interval_seconds: float = LOAD_MONITOR_INTERVAL_SECONDS):
+        self.limits = limits
+        self.interval_seconds = interval_seconds
+        self.in_flight = 0
+        self.lag_seconds = 0.0
+        self.threadpool_busy = 0
+        self.threadpool_size = 0
+        self.threadpool_queue = 0
+        self._next_wakeup: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Inicia a tarefa de medição no event loop atual."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="load-monitor")
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de medição."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._next_wakeup = None
+
+    async def _run(self) -> None:
+        while True:
+            self._next_wakeup = time.monotonic() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.lag_seconds = max(0.0, time.monotonic() - self._next_wakeup)
+            limiter = anyio.to_thread.current_default_thread_limiter()
+            statistics = limiter.statistics()
+            self.threadpool_busy = statistics.borrowed_tokens
+            self.threadpool_size = int(statistics.total_tokens)
+            self.threadpool_queue = statistics.tasks_waiting
+            EVENT_LOOP_LAG.set(self.lag_seconds)
+            THREADPOOL_BUSY.set(self.threadpool_busy)
+            THREADPOOL_QUEUE.set(self.threadpool_queue)
+            OVERLOADED.set(1 if self.overload_reason() else 0)
+
+    def current_lag(self) -> float:
+        """Lag atual: o último medido ou, se a medição está atrasada agora, esse atraso."""
+        if self._next_wakeup is None:
+            return self.lag_seconds
+        return max(self.lag_seconds, time.monotonic() - self._next_wakeup)
+
+    def overload_reason(self) -> Optional[str]:
+        """Retorna o motivo da sobrecarga, ou None se o worker pode aceitar requisições."""
+        limits = self.limits
+        if limits.max_lag_seconds and self.current_lag() > limits.max_lag_seconds:
+            return REASON_EVENT_LOOP_LAG
+        if limits.max_in_flight and self.in_flight >= limits.max_in_flight:
+            return REASON_IN_FLIGHT
+        if limits.max_threadpool_queue and self.threadpool_queue >= limits.max_threadpool_queue:
+            return REASON_THREADPOOL_QUEUE
+        return None
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        REQUESTS_IN_FLIGHT.inc()
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+        REQUESTS_IN_FLIGHT.dec()
+
+    def shed(self, reason: str) -> None:
+        """Contabiliza uma requisição recusada."""
+        REQUESTS_SHED.labels(reason=reason).inc()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna os sinais de carga atuais e os limites configurados."""
+        return {
+            "event_loop_lag_ms": round(self.current_lag() * 1000, 3),
+            "in_flight": self.in_flight,
+            "threadpool_busy": self.threadpool_busy,
+            "threadpool_size": self.threadpool_size,
+            "threadpool_queue": self.threadpool_queue,
+            "limits": {
+                "max_event_loop_lag_ms": self.limits.max_lag_seconds * 1000,
+                "max_in_flight": self.limits.max_in_flight,
+                "max_threadpool_queue": self.limits.max_threadpool_queue,
+            },
+        }
+
+# Instância global do monitor de carga
+load_monitor = LoadMonitor(LoadLimits(
+    max_lag_seconds=get_load_shed_max_lag_ms() / 1000,
+    max_in_flight=get_load_shed_max_in_flight(),
+    max_threadpool_queue=get_load_shed_max_threadpool_queue()
+))
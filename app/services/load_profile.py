@@ -0,0 +1,151 @@
+"""Perfis de carga variáveis no tempo para o stress test de CPU.
+
+Um perfil é uma sequência de segmentos executados em ordem. Cada segmento tem
+uma forma (flat, ramp, step, sine ou spike) e uma duração, e define a
+utilização alvo (0.0 a 1.0) em função do tempo decorrido dentro do segmento.
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+SHAPES = ("flat", "ramp", "step", "sine", "spike")
+
+def _percent(segment: Dict[str, Any], key: str, default: Optional[float] = None) -> float:
+    """Lê um campo percentual do segmento e o converte para fração."""
+    value = segment.get(key)
+    if value is None:
+        if default is None:
+            raise ValueError(f"Segmento '{segment.get('shape')}' requer o campo '{key}'")
+        value = default
+    if not 0 <= value <= 100:
+        raise ValueError(f"Campo '{key}' deve estar entre 0 e 100")
+    return value / 100
+
+def segment_utilization(segment: Dict[str, Any], t: float) -> float:
+    """Calcula a utilização alvo de um segmento no instante t.
+
+    Args:
+        segment: Definição do segmento
+        t: Tempo decorrido desde o início do segmento, em segundos
+
+    Returns:
+        float: Utilização alvo entre 0.0 e 1.0
+    """
+    shape = segment["shape"]
+    duration = segment["duration_seconds"]
+
+    if shape == "flat":
+        return _percent(segment, "utilization_percent", 100.0)
+
+    if shape == "ramp":
+        start = _percent(segment, "start_percent", 0.0)
+        end = _percent(segment, "end_percent", 100.0)
+        return start + (end - start) * min(t / duration, 1.0)
+
+    if shape == "step":
+        levels = segment.get("levels_percent") or []
+        if not levels:
+            raise ValueError("Segmento 'step' requer o campo 'levels_percent'")
+        if any(not 0 <= level <= 100 for level in levels):
+            raise ValueError("Campo 'levels_percent' deve conter valores entre 0 e 100")
+        index = min(int(t / (duration / len(levels))), len(levels) - 1)
+        return levels[index] / 100
+
+    if shape == "sine":
+        low = _percent(segment, "min_percent", 0.0)
+        high = _percent(segment, "max_percent", 100.0)
+        period = segment.get("period_seconds") or duration
+        return low + (high - low) * (1 - math.cos(2 * math.pi * t / period)) / 2
+
+    if shape == "spike":
+        base = _percent(segment, "base_percent", 0.0)
+        peak = _percent(segment, "peak_percent", 100.0)
+        spike = segment.get("spike_seconds") or 1.0
+        interval = segment.get("interval_seconds") or duration
+        return peak if (t % interval) < spike else base
+
+    raise ValueError(f"Forma de carga desconhecida: '{shape}'. Opções: {', '.join(SHAPES)}")
+
+def segment_next_edge(segment: Dict[str, Any], t: float) -> Optional[float]:
+    """Retorna o próximo instante após t em que a utilização do segmento muda de forma abrupta.
+
+    Apenas as formas 'step' e 'spike' têm bordas; nas demais a utilização
+    varia continuamente e None é retornado.
+
+    Args:
+        segment: Definição do segmento
+        t: Tempo decorrido desde o início do segmento, em segundos
+
+    Returns:
+        Optional[float]: Instante da borda, relativo ao início do segmento, ou
+        None se não houver borda antes do fim do segmento
+    """
+    shape = segment["shape"]
+    duration = segment["duration_seconds"]
+    if shape == "step":
+        width = duration / len(segment["levels_percent"])
+        edge = (math.floor(t / width) + 1) * width
+    elif shape == "spike":
+        spike = segment.get("spike_seconds") or 1.0
+        interval = segment.get("interval_seconds") or duration
+        cycle_start = t - t % interval
+        edge = cycle_start + spike if t - cycle_start < spike else cycle_start + interval
+    else:
+        return None
+    return edge if edge < duration else None
+
+class LoadSchedule:
+    """Sequência de segmentos de carga seguida pelo stress test de CPU.
+
+    Args:
+        segments: Lista de segmentos, cada um com 'shape', 'duration_seconds'
+            e os parâmetros específicos da forma
+
+    Raises:
+        ValueError: Se algum segmento for inválido
+    """
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        if not segments:
+            raise ValueError("O perfil de carga deve ter pelo menos um segmento")
+        self.segments = segments
+        self._boundaries: List[Tuple[float, Dict[str, Any]]] = []
+        elapsed = 0.0
+        for segment in segments:
+            if segment.get("duration_seconds", 0) <= 0:
+                raise ValueError("Cada segmento deve ter 'duration_seconds' maior que zero")
+            # Valida os parâmetros do segmento antecipadamente
+            segment_utilization(segment, 0.0)
+            self._boundaries.append((elapsed, segment))
+            elapsed += segment["duration_seconds"]
+        self.total_seconds = elapsed
+
+    @classmethod
+    def flat(cls, duration_seconds: float, utilization: float) -> "LoadSchedule":
+        """Cria um perfil de carga constante."""
+        return cls([{
+            "shape": "flat",
+            "duration_seconds": duration_seconds,
+            "utilization_percent": utilization * 100
+        }])
+
+    def _segment_at(self, t: float) -> Tuple[float, Dict[str, Any]]:
+        """Retorna o instante de início e a definição do segmento vigente em t."""
+        start, segment = self._boundaries[0]
+        for boundary in self._boundaries:
+            if boundary[0] > t:
+                break
+            start, segment = boundary
+        return start, segment
+
+    def utilization_at(self, t: float) -> float:
+        """Retorna a utilização alvo no instante t desde o início do perfil."""
+        start, segment = self._segment_at(t)
+        return segment_utilization(segment, t - start)
+
+    def next_change(self, t: float) -> float:
+        """Retorna o próximo instante após t com mudança abrupta do alvo (borda ou fim de segmento)."""
+        start, segment = self._segment_at(t)
+        edge = segment_next_edge(segment, t - start)
+        if edge is not None:
+            return start + edge
+        return min(start + segment["duration_seconds"], self.total_seconds)
@@ -1,13 +1,34 @@
 """Serviços relacionados ao stress test de memória."""
+import mmap
 import time
-from typing import Tuple, List
+import threading
+from typing import Any, Callable, Dict, Tuple, List, Optional
 from .system_service import get_memory_usage_mb
+from .telemetry_service import get_rss_mb
+from ..config import DEFAULT_MEMORY_CHUNK_MB, JOB_PROGRESS_INTERVAL_SECONDS
 
-def run_memory_stress_test(duration_seconds: int) -> Tuple[float, int, float]:
+# Quantidade de itens criados entre verificações de cancelamento/progresso
+CHECK_EVERY_ITEMS = 100_000
+# Idade máxima da amostra de RSS usada no teto: o teste aloca cerca de 150 MB/s
+RSS_CEILING_MAX_AGE_SECONDS = 0.1
+
+MB = 1024 * 1024
+PAGE_SIZE = mmap.PAGESIZE
+RELEASE_PATTERNS = ("immediate", "linear")
+
+def run_memory_stress_test(
+    duration_seconds: int,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    max_rss_mb: Optional[float] = None
+) -> Tuple[float, int, float]:
     """Executa stress test de memória e CPU por um tempo determinado.
     
     Args:
         duration_seconds: Duração do teste em segundos
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe métricas parciais do teste
+        max_rss_mb: Teto de RSS em MB; ao atingi-lo o teste para de alocar
         
     Returns:
         Tuple contendo:
@@ -22,12 +43,26 @@ def run_memory_stress_test(duration_seconds: int) -> Tuple[float, int, float]:
     start_time = time.monotonic()
     s: List[int] = []
     soma_atual = 0
+    last_progress = start_time
     
     # Loop que executa e consome recursos pela duração especificada
     while (time.monotonic() - start_time) < duration_seconds:
         soma_atual += 1
         s.append(soma_atual)
         # Este loop mantém a CPU ocupada e a memória crescendo
+        if soma_atual % CHECK_EVERY_ITEMS == 0:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if max_rss_mb is not None and get_rss_mb(RSS_CEILING_MAX_AGE_SECONDS) >= max_rss_mb:
+                print(f"Teto de memória de {max_rss_mb:.0f} MB atingido; encerrando a alocação")
+                break
+            if on_progress is not None and time.monotonic() - last_progress >= JOB_PROGRESS_INTERVAL_SECONDS:
+                last_progress = time.monotonic()
+                on_progress({
+                    "elapsed_seconds": round(time.monotonic() - start_time, 2),
+                    "items_created": soma_atual,
+                    "memory_usage_mb": round(get_rss_mb(JOB_PROGRESS_INTERVAL_SECONDS), 2)
+                })
     
     end_time = time.monotonic()
     actual_duration = end_time - start_time
@@ -36,4 +71,151 @@ def run_memory_stress_test(duration_seconds: int) -> Tuple[float, int, float]:
     print(f"Operação concluída em {actual_duration:.2f} segundos.")
     print(f"Uso de memória depois: {mem_after:.2f} MB")
     
-    return actual_duration, len(s), mem_after - mem_before
\ No newline at end of file
+    return actual_duration, len(s), mem_after - mem_before
+
+def _allocate_chunk(size_bytes: int) -> mmap.mmap:
+    """Aloca um bloco anônimo via mmap e toca todas as suas páginas.
+
+    Escrever um byte em cada página força o kernel a materializá-las, de modo
+    que o RSS cresce exatamente o tamanho do bloco. Ao fechar o mmap a memória
+    é devolvida imediatamente ao sistema operacional.
+    """
+    chunk = mmap.mmap(-1, size_bytes)
+    pages = (size_bytes + PAGE_SIZE - 1) // PAGE_SIZE
+    chunk[::PAGE_SIZE] = b"\x01" * pages
+    return chunk
+
+def run_memory_target_test(
+    target_mb: int,
+    rate_mb_per_second: float,
+    hold_seconds: float,
+    release_pattern: str = "immediate",
+    release_seconds: float = 0.0,
+    chunk_mb: int = DEFAULT_MEMORY_CHUNK_MB,
+    sample_interval_seconds: float = JOB_PROGRESS_INTERVAL_SECONDS,
+    stop_event: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Executa stress test de memória com tamanho alvo e taxa de alocação controlada.
+
+    O teste passa pelas fases:
+    - allocate: aloca blocos de 'chunk_mb' até 'target_mb', limitado a 'rate_mb_per_second'
+    - hold: mantém a memória alocada por 'hold_seconds'
+    - release: libera a memória de uma vez ('immediate') ou gradualmente
+      ao longo de 'release_seconds' ('linear')
+
+    Args:
+        target_mb: Quantidade de memória a alocar em MB
+        rate_mb_per_second: Taxa máxima de alocação em MB/s
+        hold_seconds: Tempo em que a memória permanece alocada
+        release_pattern: Forma de liberação ('immediate' ou 'linear')
+        release_seconds: Duração da liberação no padrão 'linear'
+        chunk_mb: Tamanho de cada bloco alocado em MB
+        sample_interval_seconds: Intervalo entre amostras de RSS
+        stop_event: Evento opcional para cancelar o teste antes do fim
+        on_progress: Callback opcional que recebe a amostra mais recente
+
+    Returns:
+        Dict[str, Any]: Resumo do teste e curva de RSS ao longo do tempo
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos
+    """
+    if target_mb <= 0 or rate_mb_per_second <= 0 or chunk_mb <= 0:
+        raise ValueError("target_mb, rate_mb_per_second e chunk_mb devem ser maiores que zero")
+    if release_pattern not in RELEASE_PATTERNS:
+        raise ValueError(f"Padrão de liberação inválido. Opções: {', '.join(RELEASE_PATTERNS)}")
+
+    stop_event = stop_event or threading.Event()
+    chunk_bytes = chunk_mb * MB
+    target_bytes = target_mb * MB
+    chunks: List[mmap.mmap] = []
+    samples: List[Dict[str, Any]] = []
+    allocated_bytes = 0
+
+    mem_before = get_memory_usage_mb()
+    start_time = time.monotonic()
+    next_sample = start_time
+    print(f"Iniciando alocação de {target_mb} MB a {rate_mb_per_second} MB/s...")
+
+    def sample(phase: str, rss_mb: Optional[float] = None) -> None:
+        """Registra um ponto da curva; com rss_mb informado o ponto é sempre registrado."""
+        nonlocal next_sample
+        now = time.monotonic()
+        if rss_mb is None and now < next_sample:
+            return
+        next_sample = now + sample_interval_seconds
+        point = {
+            "elapsed_seconds": round(now - start_time, 3),
+            "phase": phase,
+            "allocated_mb": round(allocated_bytes / MB, 2),
+            "rss_mb": round(rss_mb if rss_mb is not None else get_rss_mb(sample_interval_seconds), 2)
+        }
+        samples.append(point)
+        if on_progress is not None:
+            on_progress(point)
+
+    def wait(phase: str, seconds: float) -> bool:
+        """Aguarda amostrando o RSS; retorna True se o teste foi cancelado."""
+        deadline = time.monotonic() + seconds
+        while True:
+            sample(phase)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if stop_event.wait(min(remaining, max(next_sample - time.monotonic(), 0.0))):
+                return True
+
+    try:
+        # Fase de alocação: cada bloco só é criado quando a taxa permite
+        alloc_start = time.monotonic()
+        cancelled = False
+        while allocated_bytes < target_bytes and not cancelled:
+            size = min(chunk_bytes, target_bytes - allocated_bytes)
+            chunks.append(_allocate_chunk(size))
+            allocated_bytes += size
+            due = alloc_start + (allocated_bytes / MB) / rate_mb_per_second
+            cancelled = wait("allocate", due - time.monotonic())
+        alloc_seconds = time.monotonic() - alloc_start
+        allocated_mb = allocated_bytes / MB
+        # Leitura direta: uma amostra do sampler pode ser anterior aos últimos blocos alocados
+        peak_rss = get_memory_usage_mb()
+
+        # Fase de retenção
+        if not cancelled:
+            cancelled = wait("hold", hold_seconds)
+
+        # Fase de liberação
+        if release_pattern == "linear" and release_seconds > 0 and not cancelled:
+            release_start = time.monotonic()
+            total = len(chunks)
+            while chunks:
+                chunk = chunks.pop()
+                allocated_bytes -= len(chunk)
+                chunk.close()
+                due = release_start + release_seconds * (total - len(chunks)) / total
+                if wait("release", due - time.monotonic()):
+                    break
+    finally:
+        for chunk in chunks:
+            chunk.close()
+        chunks.clear()
+        allocated_bytes = 0
+
+    # Leitura direta: a amostra do sampler pode ser anterior ao fechamento dos blocos
+    rss_after = get_memory_usage_mb()
+    sample("released", rss_after)
+    actual_duration = time.monotonic() - start_time
+    print(f"Operação concluída em {actual_duration:.2f} segundos.")
+
+    return {
+        "target_mb": target_mb,
+        "allocated_mb": round(allocated_mb, 2),
+        "actual_duration_seconds": round(actual_duration, 4),
+        "allocation_seconds": round(alloc_seconds, 4),
+        "achieved_rate_mb_per_second": round(allocated_mb / alloc_seconds, 2) if alloc_seconds > 0 else None,
+        "rss_before_mb": round(mem_before, 2),
+        "rss_peak_mb": round(max([peak_rss] + [point["rss_mb"] for point in samples]), 2),
+        "rss_after_mb": round(rss_after, 2),
+        "samples": samples
+    }
@@ -0,0 +1,158 @@
+"""Profiler por amostragem de pilhas de todas as threads do processo.
+
+Uma thread dedicada lê periodicamente sys._current_frames() e conta cada
+pilha observada, do frame raiz até o frame em execução. O resultado sai no
+formato 'collapsed' (uma pilha por linha, frames separados por ';' e o número
+de amostras ao final), aceito por flamegraph.pl, speedscope e inferno.
+
+A thread de amostragem só existe enquanto um perfil está sendo coletado, então
+o profiler ocioso não tem custo algum. Durante a coleta o custo é o de
+percorrer as pilhas a cada intervalo, com os nomes dos frames em cache.
+"""
+import asyncio
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType
+from typing import Dict, Optional, Tuple
+
+# Números no nome das threads (ex.: 'sqs-io_3') viram '*' para agrupar pools
+THREAD_NUMBER_PATTERN = re.compile(r"\d+")
+
+class ProfilerBusyError(RuntimeError):
+    """Erro lançado quando já existe um perfil sendo coletado."""
+
+@dataclass
+class Profile:
+    """Resultado de uma coleta de perfil."""
+
+    stacks: Counter
+    samples: int
+    duration_seconds: float
+    interval_seconds: float
+
+    def collapsed(self) -> str:
+        """Pilhas no formato collapsed, das mais frequentes para as menos frequentes."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class StackSampler:
+    """Coleta amostras das pilhas de todas as threads, exceto a própria.
+
+    Args:
+        interval_seconds: Intervalo entre amostras
+        group_threads: Agrupa threads de um mesmo pool trocando números do nome por '*'
+    """
+
+    def __init__(self, interval_seconds: float, group_threads: bool = True):
+        self.interval_seconds = interval_seconds
+        self.group_threads = group_threads
+        self._labels: Dict[Tuple[CodeType, int], str] = {}
+        self._thread_names: Dict[int, str] = {}
+
+    def _label(self, code: CodeType, lineno: int) -> str:
+        key = (code, lineno)
+        label = self._labels.get(key)
+        if label is None:
+            filename = code.co_filename
+            # Caminho a partir do pacote (ex.: app/services/x.py ou site-packages/...)
+            for marker in ("site-packages/", "/app/", "/lib/python"):
+                index = filename.rfind(marker)
+                if index >= 0:
+                    filename = filename[index + 1 if marker[0] == "/" else index:]
+                    break
+            label = f"{code.co_name} ({filename}:{lineno})".replace(";", ",")
+            self._labels[key] = label
+        return label
+
+    def _thread_name(self, ident: int) -> str:
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {
+                thread.ident: THREAD_NUMBER_PATTERN.sub("*", thread.name) if self.group_threads else thread.name
+                for thread in threading.enumerate() if thread.ident is not None
+            }
+            name = self._thread_names.get(ident, f"thread {ident}")
+        return name.replace(";", ",")
+
+    def sample(self, stacks: Counter) -> None:
+        """Registra uma amostra da pilha de cada thread em 'stacks'."""
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(self._label(frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+            labels.append(self._thread_name(ident))
+            labels.reverse()
+            stacks[";".join(labels)] += 1
+
+    def run(self, duration_seconds: float, stop_event: Optional[threading.Event] = None) -> Profile:
+        """Coleta amostras durante 'duration_seconds' na thread atual.
+
+        As amostras seguem uma grade de tempo absoluta; se uma amostra atrasa,
+        as seguintes não são compensadas em rajada.
+        """
+        stop_event = stop_event or threading.Event()
+        stacks: Counter = Counter()
+        samples = 0
+        start = time.perf_counter()
+        deadline = start + duration_seconds
+        next_tick = start
+        while True:
+            self.sample(stacks)
+            samples += 1
+            now = time.perf_counter()
+            next_tick = max(next_tick + self.interval_seconds, now)
+            if next_tick >= deadline or stop_event.wait(next_tick - now):
+                break
+        return Profile(stacks, samples, time.perf_counter() - start, self.interval_seconds)
+
+_busy = threading.Lock()
+
+async def collect_profile(duration_seconds: float, interval_seconds: float, group_threads: bool = True) -> Profile:
+    """Coleta um perfil de todas as threads sem bloquear o event loop.
+
+    A amostragem roda em uma thread própria, e não no threadpool padrão, para
+    não ocupar uma vaga das rotas síncronas durante a coleta. Apenas um perfil
+    é coletado por vez.
+
+    Args:
+        duration_seconds: Duração da coleta
+        interval_seconds: Intervalo entre amostras
+        group_threads: Agrupa threads de um mesmo pool pelo nome
+
+    Returns:
+        Profile: Pilhas contadas, número de amostras e duração real
+
+    Raises:
+        ProfilerBusyError: Se outro perfil já estiver em andamento
+    """
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusyError("Já existe um perfil sendo coletado")
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[Profile]" = loop.create_future()
+
+    def deliver(result: Profile) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    def fail(error: BaseException) -> None:
+        if not future.done():
+            future.set_exception(error)
+
+    def run() -> None:
+        try:
+            result = StackSampler(interval_seconds, group_threads).run(duration_seconds)
+            loop.call_soon_threadsafe(deliver, result)
+        except BaseException as e:
+            loop.call_soon_threadsafe(fail, e)
+        finally:
+            _busy.release()
+
+    threading.Thread(target=run, name="stack-sampler", daemon=True).start()
+    return await future
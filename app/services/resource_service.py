@@ -0,0 +1,266 @@
+"""Detecção dos limites de CPU e memória do contêiner (cgroup v1 e v2).
+
+os.cpu_count() e a memória total do psutil enxergam o host inteiro. Em um
+contêiner com 'limits.cpu: 2' em um nó de 64 núcleos, dimensionar o stress
+por esses números cria 64 processos disputando a quota de 2 CPUs. Este
+módulo lê a quota CFS (cpu.max ou cpu.cfs_quota_us), o cpuset e o limite de
+memória (memory.max ou memory.limit_in_bytes) do cgroup do processo, e os
+serviços de stress usam o resultado para dimensionar e fixar os workers e
+limitar os alvos de memória.
+
+A raiz do sistema de arquivos do cgroup é configurável (CGROUP_ROOT), o que
+permite apontar a detecção para uma árvore de arquivos falsa.
+"""
+import math
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from ..config import get_cgroup_root, get_memory_limit_headroom_percent
+
+PROC_SELF_CGROUP = "/proc/self/cgroup"
+MB = 1024 * 1024
+# Valores acima deste limite no cgroup v1 significam "sem limite" (PAGE_COUNTER_MAX)
+CGROUP_V1_UNLIMITED_BYTES = 1 << 62
+
+@dataclass
+class ResourceLimits:
+    """Limites de recursos detectados para o processo."""
+
+    cgroup_version: Optional[int]
+    host_cpu_count: int
+    cpu_quota_cores: Optional[float]
+    cpuset: Optional[List[int]]
+    allowed_cpus: List[int]
+    effective_cpu_count: int
+    host_memory_bytes: int
+    memory_limit_bytes: Optional[int]
+    memory_usage_bytes: Optional[int]
+    memory_working_set_bytes: Optional[int]
+    effective_memory_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def parse_cpu_list(text: str) -> List[int]:
+    """Converte uma lista de CPUs no formato do kernel ('0-3,8,10-11') em IDs."""
+    cpus: List[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+class CgroupReader:
+    """Lê os arquivos de controle do cgroup do processo.
+
+    Os arquivos são procurados primeiro no cgroup do processo indicado em
+    /proc/self/cgroup (quando o diretório existe sob a raiz) e depois na
+    própria raiz, que é o que o processo enxerga com cgroup namespaces.
+
+    Args:
+        root: Raiz do sistema de arquivos do cgroup (padrão: CGROUP_ROOT ou /sys/fs/cgroup)
+        proc_cgroup: Arquivo com os cgroups do processo
+    """
+
+    def __init__(self, root: Optional[str] = None, proc_cgroup: str = PROC_SELF_CGROUP):
+        self.root = root or get_cgroup_root()
+        self.version: Optional[int] = None
+        if os.path.exists(os.path.join(self.root, "cgroup.controllers")):
+            self.version = 2
+        elif os.path.isdir(os.path.join(self.root, "cpu")) or os.path.isdir(os.path.join(self.root, "memory")):
+            self.version = 1
+        self._paths = self._read_proc_cgroup(proc_cgroup)
+
+    @staticmethod
+    def _read_proc_cgroup(proc_cgroup: str) -> Dict[str, str]:
+        """Mapeia cada controlador (ou '' no cgroup v2) para o caminho do cgroup do processo."""
+        paths: Dict[str, str] = {}
+        try:
+            with open(proc_cgroup) as f:
+                for line in f:
+                    _, controllers, path = line.rstrip("\n").split(":", 2)
+                    for controller in controllers.split(",") if controllers else [""]:
+                        paths[controller] = path.lstrip("/")
+        except (OSError, ValueError):
+            pass
+        return paths
+
+    def read(self, controller: str, filename: str) -> Optional[str]:
+        """Retorna o conteúdo de um arquivo de controle, ou None se não existir."""
+        if self.version == 2:
+            bases = [os.path.join(self.root, self._paths.get("", "")), self.root]
+        else:
+            base = os.path.join(self.root, controller)
+            bases = [os.path.join(base, self._paths.get(controller, "")), base]
+        for base in bases:
+            try:
+                with open(os.path.join(base, filename)) as f:
+                    return f.read().strip()
+            except OSError:
+                continue
+        return None
+
+    def cpu_quota_cores(self) -> Optional[float]:
+        """Quota de CPU em núcleos (cpu.max ou cfs_quota/cfs_period), ou None sem limite."""
+        try:
+            if self.version == 2:
+                value = self.read("cpu", "cpu.max")
+                if value is None:
+                    return None
+                quota, period = value.split()[:2]
+                return None if quota == "max" else int(quota) / int(period)
+            quota = self.read("cpu", "cpu.cfs_quota_us")
+            period = self.read("cpu", "cpu.cfs_period_us")
+            if quota is None or period is None or int(quota) <= 0 or int(period) <= 0:
+                return None
+            return int(quota) / int(period)
+        except ValueError:
+            return None
+
+    def cpuset(self) -> Optional[List[int]]:
+        """CPUs permitidas pelo cpuset do cgroup, ou None se não houver restrição legível."""
+        value = self.read("cpuset", "cpuset.cpus.effective" if self.version == 2 else "cpuset.effective_cpus")
+        if not value:
+            value = self.read("cpuset", "cpuset.cpus")
+        try:
+            return parse_cpu_list(value) if value else None
+        except ValueError:
+            return None
+
+    def memory_limit_bytes(self) -> Optional[int]:
+        """Limite de memória do cgroup em bytes, ou None sem limite."""
+        value = self.read("memory", "memory.max" if self.version == 2 else "memory.limit_in_bytes")
+        if value is None or value == "max":
+            return None
+        try:
+            limit = int(value)
+        except ValueError:
+            return None
+        return limit if 0 < limit < CGROUP_V1_UNLIMITED_BYTES else None
+
+    def memory_usage_bytes(self) -> Optional[int]:
+        """Uso de memória atual do cgroup em bytes (inclui page cache)."""
+        value = self.read("memory", "memory.current" if self.version == 2 else "memory.usage_in_bytes")
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def memory_working_set_bytes(self) -> Optional[int]:
+        """Uso de memória do cgroup sem o page cache inativo, que o kernel recupera antes do OOM.
+
+        É a mesma medida que o kubelet usa para decidir despejos (working set).
+        """
+        usage = self.memory_usage_bytes()
+        if usage is None:
+            return None
+        stat = self.read("memory", "memory.stat") or ""
+        key = "inactive_file" if self.version == 2 else "total_inactive_file"
+        for line in stat.splitlines():
+            name, _, value = line.partition(" ")
+            if name == key:
+                try:
+                    return max(0, usage - int(value))
+                except ValueError:
+                    break
+        return usage
+
+def _process_affinity() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def get_resource_limits(root: Optional[str] = None, proc_cgroup: str = PROC_SELF_CGROUP) -> ResourceLimits:
+    """Detecta os limites de CPU e memória efetivos do processo.
+
+    Os núcleos efetivos são a interseção da afinidade do processo com o
+    cpuset, limitada pela quota CFS arredondada para cima. A memória efetiva
+    é o menor valor entre o limite do cgroup e a memória total do host.
+
+    Args:
+        root: Raiz do sistema de arquivos do cgroup (padrão: CGROUP_ROOT)
+        proc_cgroup: Arquivo com os cgroups do processo
+
+    Returns:
+        ResourceLimits: Limites detectados
+    """
+    reader = CgroupReader(root, proc_cgroup)
+    quota = reader.cpu_quota_cores()
+    cpuset = reader.cpuset()
+    allowed = _process_affinity()
+    if cpuset is not None:
+        permitted = set(cpuset)
+        allowed = [cpu for cpu in allowed if cpu in permitted] or allowed
+    effective_cpus = len(allowed)
+    if quota is not None:
+        effective_cpus = min(effective_cpus, max(1, math.ceil(quota)))
+
+    import psutil
+
+    host_memory = psutil.virtual_memory().total
+    memory_limit = reader.memory_limit_bytes()
+    return ResourceLimits(
+        cgroup_version=reader.version,
+        host_cpu_count=os.cpu_count() or len(allowed),
+        cpu_quota_cores=quota,
+        cpuset=cpuset,
+        allowed_cpus=allowed[:effective_cpus],
+        effective_cpu_count=effective_cpus,
+        host_memory_bytes=host_memory,
+        memory_limit_bytes=memory_limit,
+        memory_usage_bytes=reader.memory_usage_bytes(),
+        memory_working_set_bytes=reader.memory_working_set_bytes(),
+        effective_memory_bytes=min(memory_limit, host_memory) if memory_limit else host_memory,
+    )
+
+def get_effective_cpu_count() -> int:
+    """Retorna quantos núcleos o processo pode de fato usar (afinidade, cpuset e quota)."""
+    return get_resource_limits().effective_cpu_count
+
+def get_allowed_cpus() -> List[int]:
+    """Retorna os IDs das CPUs em que os workers de stress devem ser fixados."""
+    return get_resource_limits().allowed_cpus
+
+def get_memory_ceiling_mb(limits: Optional[ResourceLimits] = None) -> float:
+    """Retorna o teto de memória (em MB) que os stress tests podem atingir.
+
+    O teto fica MEMORY_LIMIT_HEADROOM_PERCENT abaixo da memória efetiva, para
+    que o teste pressione o limite sem acionar o OOM killer do cgroup.
+    """
+    limits = limits or get_resource_limits()
+    return limits.effective_memory_bytes * (1 - get_memory_limit_headroom_percent() / 100) / MB
+
+def get_memory_headroom_mb(process_rss_mb: float) -> float:
+    """Retorna quantos MB ainda podem ser alocados antes de atingir o teto de memória.
+
+    O teto vale para o contêiner inteiro. Por isso, dentro de um cgroup, o uso
+    descontado é o working set do cgroup, que soma todos os workers do launcher
+    e os processos do pool de CPU. O RSS do processo só é usado fora de cgroups.
+
+    Args:
+        process_rss_mb: RSS atual do processo em MB, usado sem cgroup legível
+    """
+    limits = get_resource_limits()
+    working_set = limits.memory_working_set_bytes
+    used_mb = working_set / MB if working_set is not None else process_rss_mb
+    return get_memory_ceiling_mb(limits) - used_mb
+
+def cap_memory_target_mb(target_mb: int, current_mb: float) -> int:
+    """Limita um alvo de alocação adicional ao espaço livre abaixo do teto de memória.
+
+    Args:
+        target_mb: Memória adicional solicitada em MB
+        current_mb: RSS atual do processo em MB (usado apenas fora de cgroups)
+
+    Returns:
+        int: Alvo ajustado em MB
+
+    Raises:
+        ValueError: Se já não houver espaço abaixo do teto
+    """
+    available = int(get_memory_headroom_mb(current_mb))
+    if available < 1:
+        raise ValueError("Uso de memória já está no teto permitido pelo limite do contêiner")
+    return min(target_mb, available)
@@ -0,0 +1,157 @@
+"""Camada assíncrona de acesso ao Amazon SQS.
+
+As chamadas do boto3 são bloqueantes. Em vez de ocupar o threadpool padrão do
+Starlette (compartilhado por todas as rotas síncronas), cada chamada é
+executada em um executor dedicado e limitado ao I/O de fila. Assim um long
+polling de vários segundos não consome capacidade de atendimento das demais
+rotas, como / e /version, e os handlers de mensageria podem ser 'async def'.
+"""
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .sqs_codec import CodecTotals
+from .sqs_service import (
+    receive_and_delete_message_from_sqs, receive_and_delete_messages_from_sqs,
+    send_message_batch_to_sqs, send_message_to_sqs
+)
+from ..config import SQS_MAX_BATCH_SIZE, get_sqs_executor_max_workers
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_sqs_executor() -> ThreadPoolExecutor:
+    """Retorna o executor dedicado às chamadas ao SQS, criando-o na primeira chamada."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_sqs_executor_max_workers(),
+                thread_name_prefix="sqs-io"
+            )
+        return _executor
+
+def shutdown_sqs_executor() -> None:
+    """Encerra o executor dedicado ao SQS, se existir."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+async def run_sqs_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Executa uma função bloqueante de I/O de fila no executor dedicado."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_sqs_executor(), functools.partial(func, *args, **kwargs))
+
+async def send_message(message: str, codec: Optional[str] = None) -> Dict[str, Any]:
+    """Versão assíncrona de send_message_to_sqs."""
+    return await run_sqs_io(send_message_to_sqs, message, codec)
+
+async def receive_and_delete_message() -> Optional[Dict[str, Any]]:
+    """Versão assíncrona de receive_and_delete_message_from_sqs."""
+    return await run_sqs_io(receive_and_delete_message_from_sqs)
+
+async def receive_and_delete_messages(count: int, wait_seconds: int, timeout_seconds: float) -> Dict[str, Any]:
+    """Versão assíncrona de receive_and_delete_messages_from_sqs."""
+    return await run_sqs_io(receive_and_delete_messages_from_sqs, count, wait_seconds, timeout_seconds)
+
+async def send_messages_bulk(
+    messages: AsyncIterator[str], concurrency: int, codec: Optional[str] = None
+) -> Dict[str, Any]:
+    """Envia um fluxo de mensagens em lotes SendMessageBatch despachados concorrentemente.
+
+    As mensagens são agrupadas em lotes de SQS_MAX_BATCH_SIZE à medida que
+    chegam, sem exigir o corpo completo em memória. No máximo 'concurrency'
+    lotes ficam em voo ao mesmo tempo no executor dedicado ao SQS; um lote
+    cujas mensagens codificadas passam de 256 KiB é enviado em mais de uma chamada.
+
+    Se uma mensagem inválida aparece depois que algum lote já foi enviado, a
+    leitura para ali: as mensagens anteriores são enviadas e a inválida entra
+    nas falhas com seu índice, para que o cliente saiba exatamente o que já
+    está na fila antes de reenviar.
+
+    Args:
+        messages: Iterador assíncrono com as mensagens a enviar
+        concurrency: Número máximo de lotes enviados em paralelo
+        codec: Compressão usada nas mensagens (padrão: SQS_CODEC)
+
+    Returns:
+        Dict[str, Any]: Totais, falhas por entrada, duração, vazão em msgs/s e
+        bytes das mensagens enviadas antes e depois da codificação
+
+    Raises:
+        ValueError: Se uma mensagem for inválida antes de qualquer lote ser enviado
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: List[asyncio.Task] = []
+    start_time = time.perf_counter()
+    total = 0
+    read_error: Optional[Dict[str, Any]] = None
+
+    async def dispatch(batch: List[str], first_index: int) -> Tuple[int, List[Dict[str, Any]], CodecTotals, int]:
+        try:
+            return await run_sqs_io(send_message_batch_to_sqs, batch, first_index, codec)
+        except RuntimeError as e:
+            failures = [{"index": first_index + i, "code": "BatchError", "message": str(e)} for i in range(len(batch))]
+            return 0, failures, CodecTotals(), 0
+        finally:
+            semaphore.release()
+
+    batch: List[str] = []
+    try:
+        async for message in messages:
+            batch.append(message)
+            total += 1
+            if len(batch) == SQS_MAX_BATCH_SIZE:
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(dispatch(batch, total - len(batch))))
+                batch = []
+    except ValueError as e:
+        if not tasks:
+            # Nada foi enviado ainda: o corpo inteiro é rejeitado e o reenvio é seguro
+            raise
+        read_error = {"index": total, "code": "InvalidMessage", "message": f"Leitura interrompida: {e}"}
+    except BaseException:
+        # Aguarda os lotes já despachados antes de propagar o erro de leitura
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    if batch:
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(dispatch(batch, total - len(batch))))
+
+    successful = 0
+    failures: List[Dict[str, Any]] = []
+    totals = CodecTotals()
+    calls = 0
+    for sent, failed, batch_totals, batch_calls in await asyncio.gather(*tasks):
+        successful += sent
+        failures.extend(failed)
+        totals.merge(batch_totals)
+        calls += batch_calls
+    if read_error is not None:
+        failures.append(read_error)
+        total += 1
+    sizes = totals.summary()
+    duration = time.perf_counter() - start_time
+
+    return {
+        "total": total,
+        "successful": successful,
+        "failed": len(failures),
+        "failures": sorted(failures, key=lambda failure: failure["index"]),
+        "batches": calls,
+        "duration_seconds": round(duration, 4),
+        "throughput_msgs_per_second": round(successful / duration, 2) if duration > 0 else 0.0,
+        "compressed": sizes["compressed"],
+        "offloaded": sizes["offloaded"],
+        "raw_bytes": sizes["raw_bytes"],
+        "wire_bytes": sizes["wire_bytes"],
+        "compression_ratio": sizes["compression_ratio"],
+        "bytes_saved": sizes["bytes_saved"]
+    }
@@ -0,0 +1,374 @@
+"""Codificação dos corpos das mensagens SQS: compressão e offload para blob store.
+
+O SQS só aceita texto no corpo e limita cada mensagem a 256 KiB (corpo e
+atributos). O codec comprime o corpo (gzip ou zlib) e o envia em base64,
+marcando a codificação no atributo 'content-encoding'. Corpos que, já
+codificados, ainda passam de 'blob_threshold_bytes' são gravados em um blob
+store e a mensagem leva apenas um ponteiro JSON, marcado pelo atributo
+'blob-store'. No recebimento o processo inverso é aplicado de forma
+transparente a partir dos atributos; mensagens sem eles passam intactas, de
+modo que produtores sem o codec continuam compatíveis.
+
+Corpos menores que 'min_bytes', ou que não diminuem ao serem comprimidos,
+seguem sem compressão: o base64 aumenta o corpo em 33% e só compensa quando
+a compressão ganha mais que isso.
+"""
+import base64
+import gzip
+import json
+import os
+import re
+import threading
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from prometheus_client import Counter
+
+from ..config import (
+    SQS_CODECS, get_sqs_blob_dir, get_sqs_blob_store, get_sqs_blob_threshold_bytes, get_sqs_codec,
+    get_sqs_codec_level, get_sqs_codec_min_bytes
+)
+
+ENCODING_ATTRIBUTE = "content-encoding"
+BLOB_ATTRIBUTE = "blob-store"
+MESSAGE_ATTRIBUTE_NAMES = [ENCODING_ATTRIBUTE, BLOB_ATTRIBUTE]
+IDENTITY = "identity"
+
+# Métricas Prometheus do codec
+CODEC_MESSAGES = Counter("sqs_codec_messages_total", "Mensagens codificadas por forma de envio", ["outcome"])
+CODEC_BYTES = Counter(
+    "sqs_codec_bytes_total",
+    "Bytes das mensagens codificadas: corpo original (raw), enviado ao SQS (wire) e gravado no blob store (blob)",
+    ["kind"]
+)
+
+class CodecError(ValueError):
+    """Erro lançado quando um corpo recebido não pode ser decodificado."""
+
+def _compress(codec: str, data: bytes, level: int) -> bytes:
+    if codec == "gzip":
+        # mtime fixo: o mesmo corpo gera sempre os mesmos bytes
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    return zlib.compress(data, level)
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    try:
+        if codec == "gzip":
+            return gzip.decompress(data)
+        if codec == "zlib":
+            return zlib.decompress(data)
+    except (OSError, EOFError, zlib.error) as e:
+        raise CodecError(f"Corpo {codec} inválido: {e}")
+    raise CodecError(f"Codificação desconhecida: {codec}")
+
+class BlobStore(ABC):
+    """Interface dos blob stores que recebem os corpos grandes demais para o SQS."""
+
+    name = ""
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Grava o corpo e retorna a chave que o identifica."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """Lê o corpo gravado com a chave.
+
+        Raises:
+            CodecError: Se a chave for inválida, não existir ou não puder ser lida
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove o corpo gravado com a chave, se existir."""
+
+class LocalBlobStore(BlobStore):
+    """Blob store em um diretório local, para testes em uma única máquina ou volume compartilhado.
+
+    Args:
+        directory: Diretório onde os corpos são gravados (criado se necessário)
+    """
+
+    name = "local"
+    # As chaves chegam no corpo das mensagens: só nomes gerados por put() são aceitos
+    _KEY_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        if not self._KEY_PATTERN.fullmatch(key):
+            raise CodecError(f"Chave de blob inválida: {key!r}")
+        return os.path.join(self.directory, key)
+
+    def put(self, data: bytes) -> str:
+        key = uuid.uuid4().hex
+        path = self._path(key)
+        # Grava em um arquivo temporário e renomeia: leitores nunca veem um blob pela metade
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as blob:
+            blob.write(data)
+        os.replace(temp_path, path)
+        return key
+
+    def get(self, key: str) -> bytes:
+        try:
+            with open(self._path(key), "rb") as blob:
+                return blob.read()
+        except FileNotFoundError:
+            raise CodecError(f"Blob {key} não encontrado no store local")
+        except OSError as e:
+            raise CodecError(f"Erro ao ler o blob {key} do store local: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+# Backends disponíveis, indexados pelo valor de SQS_BLOB_STORE
+BLOB_STORES: Dict[str, Callable[[], BlobStore]] = {
+    "local": lambda: LocalBlobStore(get_sqs_blob_dir()),
+}
+
+@dataclass
+class EncodedMessage:
+    """Mensagem pronta para o envio e os tamanhos usados nos relatórios."""
+    body: str
+    attributes: Dict[str, Dict[str, str]]
+    encoding: str
+    raw_bytes: int
+    wire_bytes: int
+    blob_key: Optional[str] = None
+    blob_bytes: int = 0
+
+@dataclass
+class CodecTotals:
+    """Totais de um conjunto de mensagens codificadas."""
+    messages: int = 0
+    compressed: int = 0
+    offloaded: int = 0
+    raw_bytes: int = 0
+    wire_bytes: int = 0
+    blob_bytes: int = 0
+
+    def add(self, encoded: EncodedMessage) -> None:
+        self.messages += 1
+        self.compressed += encoded.encoding != IDENTITY
+        self.offloaded += encoded.blob_key is not None
+        self.raw_bytes += encoded.raw_bytes
+        self.wire_bytes += encoded.wire_bytes
+        self.blob_bytes += encoded.blob_bytes
+
+    def merge(self, other: "CodecTotals") -> None:
+        self.messages += other.messages
+        self.compressed += other.compressed
+        self.offloaded += other.offloaded
+        self.raw_bytes += other.raw_bytes
+        self.wire_bytes += other.wire_bytes
+        self.blob_bytes += other.blob_bytes
+
+    def summary(self) -> Dict[str, Any]:
+        """Retorna os totais com a razão de compressão e os bytes poupados no SQS."""
+        return {
+            "messages": self.messages,
+            "compressed": self.compressed,
+            "offloaded": self.offloaded,
+            "raw_bytes": self.raw_bytes,
+            "wire_bytes": self.wire_bytes,
+            "blob_bytes": self.blob_bytes,
+            "compression_ratio": round(self.raw_bytes / self.wire_bytes, 3) if self.wire_bytes else None,
+            "bytes_saved": self.raw_bytes - self.wire_bytes,
+        }
+
+@dataclass
+class MessageCodec:
+    """Codifica e decodifica os corpos das mensagens SQS.
+
+    Args:
+        codec: Compressão aplicada ('none', 'gzip' ou 'zlib')
+        level: Nível de compressão (1-9)
+        min_bytes: Corpos menores que isso não são comprimidos
+        blob_store: Blob store dos corpos grandes (None desativa o offload)
+        blob_threshold_bytes: Tamanho do corpo codificado a partir do qual ele vai para o blob store
+    """
+    codec: str = "none"
+    level: int = 6
+    min_bytes: int = 1024
+    blob_store: Optional[BlobStore] = None
+    blob_threshold_bytes: int = 200 * 1024
+    totals: CodecTotals = field(default_factory=CodecTotals)
+    decoded: int = 0
+
+    def __post_init__(self) -> None:
+        if self.codec not in SQS_CODECS:
+            raise ValueError(f"Codec SQS inválido: {self.codec}. Opções: {', '.join(SQS_CODECS)}")
+        if not 1 <= self.level <= 9:
+            raise ValueError("O nível de compressão deve estar entre 1 e 9")
+        self._lock = threading.Lock()
+
+    def with_codec(self, codec: Optional[str]) -> "MessageCodec":
+        """Retorna um codec com outra compressão, compartilhando o blob store e os totais."""
+        if codec is None or codec == self.codec:
+            return self
+        other = MessageCodec(codec, self.level, self.min_bytes, self.blob_store, self.blob_threshold_bytes, self.totals)
+        other._lock = self._lock
+        return other
+
+    def encode(self, message: str) -> EncodedMessage:
+        """Codifica o corpo de uma mensagem para envio.
+
+        Raises:
+            OSError: Se o blob store não conseguir gravar o corpo
+        """
+        raw = message.encode("utf-8")
+        encoding, body, payload = IDENTITY, message, raw
+        if self.codec != "none" and len(raw) >= self.min_bytes:
+            compressed = _compress(self.codec, raw, self.level)
+            encoded_body = base64.b64encode(compressed).decode("ascii")
+            # O atributo de codificação também conta no tamanho da mensagem
+            overhead = len(ENCODING_ATTRIBUTE) + len("String") + len(self.codec)
+            if len(encoded_body) + overhead < len(raw):
+                encoding, body, payload = self.codec, encoded_body, compressed
+
+        attributes: Dict[str, Dict[str, str]] = {}
+        if encoding != IDENTITY:
+            attributes[ENCODING_ATTRIBUTE] = {"DataType": "String", "StringValue": encoding}
+        blob_key = None
+        blob_bytes = 0
+        if self.blob_store is not None and len(body.encode("utf-8")) > self.blob_threshold_bytes:
+            # O blob guarda os bytes comprimidos, sem o base64
+            blob_key = self.blob_store.put(payload)
+            blob_bytes = len(payload)
+            body = json.dumps({"store": self.blob_store.name, "key": blob_key, "bytes": blob_bytes})
+            attributes[BLOB_ATTRIBUTE] = {"DataType": "String", "StringValue": self.blob_store.name}
+
+        wire_bytes = len(body.encode("utf-8")) + sum(
+            len(name) + len(value["DataType"]) + len(value["StringValue"]) for name, value in attributes.items()
+        )
+        encoded = EncodedMessage(body, attributes, encoding, len(raw), wire_bytes, blob_key, blob_bytes)
+        with self._lock:
+            self.totals.add(encoded)
+        outcome = "offloaded" if blob_key else ("compressed" if encoding != IDENTITY else "identity")
+        CODEC_MESSAGES.labels(outcome).inc()
+        CODEC_BYTES.labels("raw").inc(encoded.raw_bytes)
+        CODEC_BYTES.labels("wire").inc(wire_bytes)
+        if blob_bytes:
+            CODEC_BYTES.labels("blob").inc(blob_bytes)
+        return encoded
+
+    def discard(self, encoded: Iterable[EncodedMessage]) -> None:
+        """Remove os blobs de mensagens que não chegaram a ser enviadas."""
+        self.release(message.blob_key for message in encoded)
+
+    def decode(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Decodifica uma mensagem recebida do SQS.
+
+        Returns:
+            Dict[str, Any]: 'body' original, 'encoding' aplicada e 'blob_key'
+            (se o corpo veio do blob store)
+
+        Raises:
+            CodecError: Se o corpo ou o blob referenciado forem inválidos
+        """
+        attributes = message.get("MessageAttributes") or {}
+        encoding = attributes.get(ENCODING_ATTRIBUTE, {}).get("StringValue", IDENTITY)
+        store_name = attributes.get(BLOB_ATTRIBUTE, {}).get("StringValue")
+        body = message["Body"]
+        blob_key = None
+        if store_name is None and encoding == IDENTITY:
+            return {"body": body, "encoding": encoding, "blob_key": None}
+
+        if store_name is not None:
+            if self.blob_store is None or store_name != self.blob_store.name:
+                raise CodecError(f"Mensagem no blob store '{store_name}', que não está configurado")
+            try:
+                blob_key = json.loads(body)["key"]
+            except (ValueError, KeyError, TypeError):
+                raise CodecError("Ponteiro de blob inválido no corpo da mensagem")
+            payload = self.blob_store.get(blob_key)
+        else:
+            try:
+                payload = base64.b64decode(body, validate=True)
+            except ValueError as e:
+                raise CodecError(f"Corpo base64 inválido: {e}")
+
+        if encoding != IDENTITY:
+            payload = _decompress(encoding, payload)
+        try:
+            text = payload.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CodecError(f"Corpo decodificado não é UTF-8: {e}")
+        with self._lock:
+            self.decoded += 1
+        return {"body": text, "encoding": encoding, "blob_key": blob_key}
+
+    def release(self, blob_keys: Iterable[Optional[str]]) -> None:
+        """Remove do blob store os corpos de mensagens já removidas da fila."""
+        if self.blob_store is None:
+            return
+        for key in blob_keys:
+            if key is not None:
+                self.blob_store.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna a configuração e os totais acumulados do codec."""
+        with self._lock:
+            totals = self.totals.summary()
+            decoded = self.decoded
+        return {
+            "codec": self.codec,
+            "level": self.level,
+            "min_bytes": self.min_bytes,
+            "blob_store": self.blob_store.name if self.blob_store is not None else None,
+            "blob_threshold_bytes": self.blob_threshold_bytes,
+            "encoded": totals,
+            "decoded": decoded,
+        }
+
+_codec: Optional[MessageCodec] = None
+_codec_lock = threading.Lock()
+
+def get_message_codec() -> MessageCodec:
+    """Retorna o codec do processo, criado na primeira chamada a partir das variáveis de ambiente.
+
+    Raises:
+        ValueError: Se a configuração do codec ou do blob store for inválida
+    """
+    global _codec
+    with _codec_lock:
+        if _codec is None:
+            store_name = get_sqs_blob_store()
+            if store_name and store_name not in BLOB_STORES:
+                raise ValueError(f"Blob store inválido: {store_name}. Opções: {', '.join(BLOB_STORES)}")
+            _codec = MessageCodec(
+                codec=get_sqs_codec(),
+                level=get_sqs_codec_level(),
+                min_bytes=get_sqs_codec_min_bytes(),
+                blob_store=BLOB_STORES[store_name]() if store_name else None,
+                blob_threshold_bytes=get_sqs_blob_threshold_bytes(),
+            )
+        return _codec
+
+def decode_received(codec: MessageCodec, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Converte mensagens do ReceiveMessage no formato retornado pelos serviços, decodificando os corpos.
+
+    Uma mensagem que não pode ser decodificada é retornada com o corpo como
+    veio do SQS e o motivo em 'decode_error', sem afetar as demais.
+    """
+    received = []
+    for message in messages:
+        entry = {
+            "message_id": message["MessageId"],
+            "receipt_handle": message["ReceiptHandle"],
+        }
+        try:
+            entry.update(codec.decode(message))
+        except CodecError as e:
+            entry.update({"body": message["Body"], "encoding": None, "blob_key": None, "decode_error": str(e)})
+        received.append(entry)
+    return received
@@ -0,0 +1,315 @@
+"""Consumidor SQS em background com pool de pollers, buffer de prefetch e deleção em lote.
+
+O pipeline é composto por três estágios executados em threads:
+- pollers: fazem long polling no SQS e enchem um buffer limitado (prefetch)
+- workers: retiram mensagens do buffer e simulam o custo de processamento
+- deleter: agrupa as mensagens processadas e as confirma com DeleteMessageBatch
+
+Com isso a aplicação se comporta como um workload realista de consumo de fila,
+útil para testes de escalonamento orientados a backlog (ex.: KEDA).
+"""
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge
+
+from .sqs_codec import get_message_codec
+from .sqs_service import delete_message_batch_from_sqs, receive_messages_from_sqs
+from ..config import SQS_MAX_BATCH_SIZE
+
+WORK_MODES = ("sleep", "cpu")
+
+# Métricas Prometheus do consumidor (gauges agregados entre workers no modo multiprocess)
+CONSUMER_RECEIVED = Counter("sqs_consumer_messages_received_total", "Mensagens recebidas pelos pollers")
+CONSUMER_PROCESSED = Counter("sqs_consumer_messages_processed_total", "Mensagens processadas pelos workers")
+CONSUMER_DELETED = Counter("sqs_consumer_messages_deleted_total", "Mensagens confirmadas via DeleteMessageBatch")
+CONSUMER_ERRORS = Counter("sqs_consumer_errors_total", "Erros por estágio do consumidor", ["stage"])
+CONSUMER_IN_FLIGHT = Gauge("sqs_consumer_in_flight", "Mensagens em processamento pelos workers", multiprocess_mode="livesum")
+CONSUMER_BUFFER_DEPTH = Gauge("sqs_consumer_buffer_depth", "Mensagens aguardando no buffer de prefetch", multiprocess_mode="livesum")
+CONSUMER_THROUGHPUT = Gauge("sqs_consumer_throughput_msgs_per_second", "Vazão de mensagens processadas por segundo", multiprocess_mode="livesum")
+CONSUMER_RUNNING = Gauge("sqs_consumer_running", "Indica se o consumidor está em execução", multiprocess_mode="livemax")
+
+# Intervalo de atualização das métricas de vazão e profundidade do buffer
+STATS_INTERVAL_SECONDS = 1.0
+# Tempo de espera das threads em operações bloqueantes antes de verificar a parada
+QUEUE_POLL_SECONDS = 0.2
+
+class ConsumerStateError(RuntimeError):
+    """Erro lançado ao iniciar um consumidor já ativo ou parar um inativo."""
+
+class SQSConsumerPool:
+    """Pool de consumo de mensagens SQS executado em threads.
+
+    Args:
+        pollers: Número de threads fazendo long polling no SQS
+        workers: Número de threads processando mensagens
+        prefetch: Capacidade do buffer entre pollers e workers
+        wait_seconds: Long polling de cada ReceiveMessage (0-20)
+        work_ms: Custo médio simulado de processamento por mensagem
+        work_jitter_ms: Variação uniforme (+/-) do custo de processamento
+        work_mode: 'sleep' simula I/O; 'cpu' consome CPU (busy-wait)
+        delete_flush_ms: Tempo máximo que uma confirmação aguarda para formar um lote
+        deleters: Número de threads confirmando lotes em paralelo
+    """
+
+    def __init__(
+        self,
+        pollers: int,
+        workers: int,
+        prefetch: int,
+        wait_seconds: int,
+        work_ms: float,
+        work_jitter_ms: float = 0.0,
+        work_mode: str = "sleep",
+        delete_flush_ms: float = 100.0,
+        deleters: int = 1
+    ):
+        if work_mode not in WORK_MODES:
+            raise ValueError(f"Modo de processamento inválido. Opções: {', '.join(WORK_MODES)}")
+        self.pollers = pollers
+        self.workers = workers
+        self.prefetch = prefetch
+        self.wait_seconds = wait_seconds
+        self.work_ms = work_ms
+        self.work_jitter_ms = work_jitter_ms
+        self.work_mode = work_mode
+        self.delete_flush_ms = delete_flush_ms
+        self.deleters = deleters
+
+        self._buffer: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=prefetch)
+        self._acks: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._pipeline_done = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._counts = {"received": 0, "processed": 0, "deleted": 0, "errors": 0}
+        self._in_flight = 0
+        self._throughput = 0.0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Inicia todas as threads do pipeline."""
+        self.started_at = time.time()
+        specs = (
+            [("poller", self._poll_loop)] * self.pollers
+            + [("worker", self._work_loop)] * self.workers
+            + [("deleter", self._delete_loop)] * self.deleters
+            + [("stats", self._stats_loop)]
+        )
+        for i, (name, target) in enumerate(specs):
+            thread = threading.Thread(target=target, name=f"sqs-consumer-{name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        CONSUMER_RUNNING.set(1)
+
+    def stop(self, timeout_seconds: float = 30.0) -> None:
+        """Para o pipeline, confirmando as mensagens já processadas.
+
+        Mensagens que ainda estavam no buffer não são confirmadas e voltam a
+        ficar visíveis na fila após o visibility timeout.
+        """
+        self._stop.set()
+        deadline = time.monotonic() + timeout_seconds
+        for thread in self._threads:
+            if thread.name.startswith(("sqs-consumer-poller", "sqs-consumer-worker")):
+                thread.join(max(0.0, deadline - time.monotonic()))
+        # Só depois que os workers terminaram o deleter pode esvaziar a fila de confirmações
+        self._pipeline_done.set()
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self.stopped_at = time.time()
+        CONSUMER_RUNNING.set(0)
+        CONSUMER_IN_FLIGHT.set(0)
+        CONSUMER_BUFFER_DEPTH.set(0)
+        CONSUMER_THROUGHPUT.set(0)
+
+    @property
+    def running(self) -> bool:
+        """Indica se o consumidor está em execução."""
+        return bool(self._threads) and not self._stop.is_set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna a configuração e as estatísticas atuais do consumidor."""
+        end = self.stopped_at or time.time()
+        with self._lock:
+            counts = dict(self._counts)
+            in_flight = self._in_flight
+        return {
+            "running": self.running,
+            "config": {
+                "pollers": self.pollers,
+                "workers": self.workers,
+                "prefetch": self.prefetch,
+                "wait_seconds": self.wait_seconds,
+                "work_ms": self.work_ms,
+                "work_jitter_ms": self.work_jitter_ms,
+                "work_mode": self.work_mode,
+                "delete_flush_ms": self.delete_flush_ms,
+                "deleters": self.deleters,
+            },
+            "started_at": self.started_at,
+            "uptime_seconds": round(end - self.started_at, 3) if self.started_at else 0.0,
+            "in_flight": in_flight,
+            "buffer_depth": self._buffer.qsize(),
+            "throughput_msgs_per_second": round(self._throughput, 2),
+            **counts,
+        }
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[key] += amount
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            free = self.prefetch - self._buffer.qsize()
+            if free <= 0:
+                # Buffer cheio: aplica backpressure em vez de buscar mais mensagens
+                self._stop.wait(QUEUE_POLL_SECONDS)
+                continue
+            try:
+                messages = receive_messages_from_sqs(min(free, SQS_MAX_BATCH_SIZE), self.wait_seconds)
+            except RuntimeError:
+                CONSUMER_ERRORS.labels(stage="receive").inc()
+                self._count("errors")
+                self._stop.wait(1.0)
+                continue
+            self._count("received", len(messages))
+            CONSUMER_RECEIVED.inc(len(messages))
+            for message in messages:
+                if "decode_error" in message:
+                    # Sem o corpo original não há o que processar: a mensagem
+                    # fica na fila e volta a ficar visível após o visibility timeout
+                    CONSUMER_ERRORS.labels(stage="decode").inc()
+                    self._count("errors")
+                    continue
+                # Se o consumidor parar com mensagens em mãos, elas voltam a
+                # ficar visíveis na fila após o visibility timeout
+                while not self._stop.is_set():
+                    try:
+                        self._buffer.put(message, timeout=QUEUE_POLL_SECONDS)
+                        break
+                    except queue.Full:
+                        continue
+
+    def _work_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                message = self._buffer.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            with self._lock:
+                self._in_flight += 1
+            CONSUMER_IN_FLIGHT.inc()
+            try:
+                self._simulate_work()
+                self._acks.put(message)
+                self._count("processed")
+                CONSUMER_PROCESSED.inc()
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                CONSUMER_IN_FLIGHT.dec()
+
+    def _simulate_work(self) -> None:
+        cost_ms = self.work_ms
+        if self.work_jitter_ms:
+            cost_ms += random.uniform(-self.work_jitter_ms, self.work_jitter_ms)
+        cost_seconds = max(cost_ms, 0.0) / 1000
+        if self.work_mode == "sleep":
+            time.sleep(cost_seconds)
+        else:
+            until = time.perf_counter() + cost_seconds
+            while time.perf_counter() < until:
+                pass
+
+    def _delete_loop(self) -> None:
+        pending: List[Dict[str, Any]] = []
+        flush_seconds = self.delete_flush_ms / 1000
+        oldest = 0.0
+        while True:
+            try:
+                message = self._acks.get(timeout=min(flush_seconds, QUEUE_POLL_SECONDS))
+                if not pending:
+                    oldest = time.monotonic()
+                pending.append(message)
+            except queue.Empty:
+                if self._pipeline_done.is_set() and not pending:
+                    return
+            if pending and (len(pending) >= SQS_MAX_BATCH_SIZE or time.monotonic() - oldest >= flush_seconds
+                            or self._pipeline_done.is_set()):
+                batch, pending = pending[:SQS_MAX_BATCH_SIZE], pending[SQS_MAX_BATCH_SIZE:]
+                try:
+                    failures = delete_message_batch_from_sqs([m["receipt_handle"] for m in batch])
+                except RuntimeError:
+                    CONSUMER_ERRORS.labels(stage="delete").inc()
+                    self._count("errors")
+                    continue
+                deleted = len(batch) - len(failures)
+                # Corpos no blob store só são removidos depois que a mensagem saiu da fila
+                failed_handles = {failure["receipt_handle"] for failure in failures}
+                get_message_codec().release(m.get("blob_key") for m in batch if m["receipt_handle"] not in failed_handles)
+                self._count("deleted", deleted)
+                CONSUMER_DELETED.inc(deleted)
+                if failures:
+                    CONSUMER_ERRORS.labels(stage="delete").inc(len(failures))
+                    self._count("errors", len(failures))
+                oldest = time.monotonic()
+
+    def _stats_loop(self) -> None:
+        last_processed = 0
+        last_time = time.monotonic()
+        while not self._stop.wait(STATS_INTERVAL_SECONDS):
+            now = time.monotonic()
+            with self._lock:
+                processed = self._counts["processed"]
+            self._throughput = (processed - last_processed) / (now - last_time)
+            last_processed, last_time = processed, now
+            CONSUMER_THROUGHPUT.set(self._throughput)
+            CONSUMER_BUFFER_DEPTH.set(self._buffer.qsize())
+
+_consumer: Optional[SQSConsumerPool] = None
+_consumer_lock = threading.Lock()
+
+def start_consumer(**settings: Any) -> Dict[str, Any]:
+    """Inicia o consumidor global com as configurações informadas.
+
+    Raises:
+        ConsumerStateError: Se o consumidor já estiver em execução
+        ValueError: Se as configurações forem inválidas
+    """
+    global _consumer
+    with _consumer_lock:
+        if _consumer is not None and _consumer.running:
+            raise ConsumerStateError("O consumidor SQS já está em execução")
+        _consumer = SQSConsumerPool(**settings)
+        _consumer.start()
+        return _consumer.stats()
+
+def stop_consumer() -> Dict[str, Any]:
+    """Para o consumidor global e retorna suas estatísticas finais.
+
+    Raises:
+        ConsumerStateError: Se o consumidor não estiver em execução
+    """
+    with _consumer_lock:
+        if _consumer is None or not _consumer.running:
+            raise ConsumerStateError("O consumidor SQS não está em execução")
+        _consumer.stop()
+        return _consumer.stats()
+
+def get_consumer_stats() -> Dict[str, Any]:
+    """Retorna as estatísticas do consumidor global (ou da última execução)."""
+    with _consumer_lock:
+        if _consumer is None:
+            return {"running": False}
+        return _consumer.stats()
+
+def shutdown_consumer() -> None:
+    """Para o consumidor global, se estiver em execução."""
+    with _consumer_lock:
+        if _consumer is not None and _consumer.running:
+            _consumer.stop()
@@ -1,76 +1,395 @@
 """Serviços relacionados ao Amazon SQS."""
-import boto3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
 from botocore.exceptions import ClientError
-from ..config import get_sqs_queue_url
+from .sqs_codec import MESSAGE_ATTRIBUTE_NAMES, CodecTotals, EncodedMessage, decode_received, get_message_codec
+from ..config import (
+    SQS_MAX_BATCH_SIZE, SQS_MAX_MESSAGE_BYTES, SQS_MAX_WAIT_SECONDS, get_sqs_queue_url, get_sqs_region, get_sqs_endpoint_url, get_sqs_max_pool_connections,
+    get_sqs_max_attempts, get_sqs_retry_mode, get_sqs_connect_timeout, get_sqs_read_timeout
+)
+
+# Cache de clientes SQS do processo, indexado pela configuração utilizada.
+# Clientes do botocore são thread-safe, portanto um único cliente é
+# compartilhado por todas as requisições, reaproveitando o modelo do serviço
+# e o pool de conexões HTTP/TLS. O boto3 e o botocore.config só são
+# importados na criação do cliente: juntos respondem pela maior parte do
+# tempo de importação da aplicação, pago apenas por réplicas que usam o SQS.
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_clients_lock = threading.Lock()
+
+def get_sqs_client():
+    """Retorna o cliente SQS compartilhado do processo.
+
+    O cliente é criado na primeira chamada com a configuração definida em
+    app.config (região, endpoint, pool de conexões, retries e timeouts) e
+    reutilizado nas chamadas seguintes.
+
+    Returns:
+        botocore.client.SQS: Cliente SQS thread-safe
+    """
+    key = (
+        get_sqs_region(), get_sqs_endpoint_url(), get_sqs_max_pool_connections(),
+        get_sqs_max_attempts(), get_sqs_retry_mode(), get_sqs_connect_timeout(), get_sqs_read_timeout()
+    )
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                import boto3
+                from botocore.config import Config
 
-def send_message_to_sqs(message: str) -> str:
+                region, endpoint_url, max_pool, max_attempts, retry_mode, connect_timeout, read_timeout = key
+                config = Config(
+                    region_name=region,
+                    max_pool_connections=max_pool,
+                    retries={"max_attempts": max_attempts, "mode": retry_mode},
+                    connect_timeout=connect_timeout,
+                    read_timeout=read_timeout
+                )
+                # Uma sessão dedicada evita a sessão default do boto3, que não é thread-safe
+                client = boto3.session.Session().client("sqs", endpoint_url=endpoint_url, config=config)
+                _clients[key] = client
+    return client
+
+def reset_sqs_clients() -> None:
+    """Descarta os clientes SQS em cache (ex.: após alterar a configuração)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+def send_message_to_sqs(message: str, codec: Optional[str] = None) -> Dict[str, Any]:
     """Envia uma mensagem para a fila SQS.
-    
+
+    O corpo passa pelo codec do processo (sqs_codec), que pode comprimi-lo
+    ou gravá-lo no blob store conforme a configuração.
+
     Args:
         message: Mensagem a ser enviada
-        
+        codec: Compressão usada nesta mensagem (padrão: SQS_CODEC)
+
     Returns:
-        str: ID da mensagem enviada
-        
+        Dict[str, Any]: 'message_id' e os tamanhos da mensagem codificada
+        ('encoding', 'raw_bytes', 'wire_bytes', 'offloaded', 'compression_ratio', 'bytes_saved')
+
     Raises:
+        ValueError: Se o codec informado for inválido
         RuntimeError: Se houver erro ao enviar a mensagem
     """
+    message_codec = get_message_codec().with_codec(codec)
+    encoded = None
     try:
-        sqs = boto3.client('sqs', region_name='us-east-1')
+        sqs = get_sqs_client()
         queue_url = get_sqs_queue_url()
-        
+        encoded = message_codec.encode(message)
+
         response = sqs.send_message(
             QueueUrl=queue_url,
-            MessageBody=message
+            MessageBody=encoded.body,
+            MessageAttributes=encoded.attributes
         )
-        
-        return response['MessageId']
-        
+
+        return {
+            'message_id': response['MessageId'],
+            'encoding': encoded.encoding,
+            'raw_bytes': encoded.raw_bytes,
+            'wire_bytes': encoded.wire_bytes,
+            'offloaded': encoded.blob_key is not None,
+            'compression_ratio': round(encoded.raw_bytes / encoded.wire_bytes, 3) if encoded.wire_bytes else None,
+            'bytes_saved': encoded.raw_bytes - encoded.wire_bytes
+        }
+
     except ClientError as e:
+        message_codec.discard([encoded] if encoded else [])
         raise RuntimeError(f"Erro ao enviar mensagem para SQS: {e}")
     except Exception as e:
+        message_codec.discard([encoded] if encoded else [])
         raise RuntimeError(f"Erro inesperado: {e}")
 
 def receive_and_delete_message_from_sqs() -> dict:
     """Recebe e deleta uma mensagem da fila SQS.
+
+    Uma mensagem que não pode ser decodificada (com 'decode_error') não é
+    removida: ela volta a ficar visível na fila após o visibility timeout.
     
     Returns:
-        dict: Dados da mensagem recebida ou None se não houver mensagens
+        dict: Dados da mensagem recebida (corpo já decodificado) ou None se não houver mensagens
         
     Raises:
         RuntimeError: Se houver erro ao receber/deletar a mensagem
     """
     try:
-        sqs = boto3.client('sqs', region_name='us-east-1')
+        sqs = get_sqs_client()
         queue_url = get_sqs_queue_url()
         
+        codec = get_message_codec()
+
         # Receber mensagem da fila
         response = sqs.receive_message(
             QueueUrl=queue_url,
             MaxNumberOfMessages=1,
-            WaitTimeSeconds=1  # Short polling
+            WaitTimeSeconds=1,  # Short polling
+            MessageAttributeNames=MESSAGE_ATTRIBUTE_NAMES
         )
         
         messages = response.get('Messages', [])
         if not messages:
             return None
         
-        message = messages[0]
-        receipt_handle = message['ReceiptHandle']
+        message = decode_received(codec, messages)[0]
+        if 'decode_error' in message:
+            return message
         
         # Deletar mensagem da fila
         sqs.delete_message(
             QueueUrl=queue_url,
-            ReceiptHandle=receipt_handle
+            ReceiptHandle=message['receipt_handle']
         )
+        codec.release([message['blob_key']])
         
-        return {
-            'message_id': message['MessageId'],
-            'body': message['Body'],
-            'receipt_handle': receipt_handle
-        }
+        return message
         
     except ClientError as e:
         raise RuntimeError(f"Erro ao receber/deletar mensagem do SQS: {e}")
     except Exception as e:
-        raise RuntimeError(f"Erro inesperado: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Erro inesperado: {e}")
+
+def receive_messages_from_sqs(max_messages: int, wait_seconds: int) -> List[Dict[str, Any]]:
+    """Recebe até 10 mensagens da fila SQS sem removê-las.
+
+    As mensagens ficam invisíveis pelo visibility timeout da fila e devem ser
+    confirmadas posteriormente com delete_message_batch_from_sqs.
+
+    Args:
+        max_messages: Número máximo de mensagens (1-10)
+        wait_seconds: Tempo de long polling em segundos (0-20)
+
+    Returns:
+        List[Dict[str, Any]]: Mensagens com 'message_id', 'body' (já decodificado),
+        'receipt_handle', 'encoding' e 'blob_key'; as que não puderam ser
+        decodificadas trazem também 'decode_error'
+
+    Raises:
+        RuntimeError: Se houver erro ao receber as mensagens
+    """
+    try:
+        sqs = get_sqs_client()
+        queue_url = get_sqs_queue_url()
+
+        codec = get_message_codec()
+
+        response = sqs.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=max(1, min(max_messages, SQS_MAX_BATCH_SIZE)),
+            WaitTimeSeconds=max(0, min(wait_seconds, SQS_MAX_WAIT_SECONDS)),
+            MessageAttributeNames=MESSAGE_ATTRIBUTE_NAMES
+        )
+
+        return decode_received(codec, response.get('Messages', []))
+
+    except ClientError as e:
+        raise RuntimeError(f"Erro ao receber mensagens do SQS: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Erro inesperado: {e}")
+
+def delete_message_batch_from_sqs(receipt_handles: List[str]) -> List[Dict[str, Any]]:
+    """Remove até 10 mensagens da fila SQS em uma única chamada DeleteMessageBatch.
+
+    Args:
+        receipt_handles: Receipt handles das mensagens a remover (no máximo SQS_MAX_BATCH_SIZE)
+
+    Returns:
+        List[Dict[str, Any]]: Falhas com 'receipt_handle', 'code' e 'message' de cada entrada rejeitada
+
+    Raises:
+        RuntimeError: Se a chamada ao SQS falhar como um todo
+    """
+    try:
+        sqs = get_sqs_client()
+        queue_url = get_sqs_queue_url()
+
+        response = sqs.delete_message_batch(
+            QueueUrl=queue_url,
+            Entries=[{"Id": str(i), "ReceiptHandle": handle} for i, handle in enumerate(receipt_handles)]
+        )
+
+        return [
+            {
+                "receipt_handle": receipt_handles[int(entry["Id"])],
+                "code": entry.get("Code", "Unknown"),
+                "message": entry.get("Message", "")
+            }
+            for entry in response.get("Failed", [])
+        ]
+
+    except ClientError as e:
+        raise RuntimeError(f"Erro ao deletar lote de mensagens do SQS: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Erro inesperado: {e}")
+
+def receive_and_delete_messages_from_sqs(count: int, wait_seconds: int, timeout_seconds: float) -> Dict[str, Any]:
+    """Recebe e deleta várias mensagens da fila SQS usando long polling e DeleteMessageBatch.
+
+    Cada chamada ReceiveMessage busca até 10 mensagens aguardando até
+    'wait_seconds' por elas; as mensagens recebidas são confirmadas em uma
+    única chamada DeleteMessageBatch. O processo se repete até obter 'count'
+    mensagens removidas ou até o prazo 'timeout_seconds' expirar. Mensagens que
+    não puderam ser decodificadas não são removidas da fila nem contam para
+    'count': vão para 'undecodable', uma vez por MessageId, mesmo que voltem a
+    ficar visíveis durante a chamada.
+
+    Args:
+        count: Número de mensagens desejadas
+        wait_seconds: Tempo de long polling de cada ReceiveMessage (0-20)
+        timeout_seconds: Prazo total da operação em segundos
+
+    Returns:
+        Dict[str, Any]: Mensagens recebidas e removidas, mensagens não
+        decodificadas (mantidas na fila), falhas de deleção (mensagens que não
+        entram em 'messages'), número de chamadas à API e duração
+
+    Raises:
+        RuntimeError: Se houver erro ao receber/deletar as mensagens
+    """
+    start_time = time.monotonic()
+    deadline = start_time + timeout_seconds
+    messages: List[Dict[str, Any]] = []
+    undecodable: List[Dict[str, Any]] = []
+    delete_failures: List[Dict[str, Any]] = []
+    seen_ids = set()
+    receive_calls = delete_calls = 0
+
+    while len(messages) < count:
+        # WaitTimeSeconds é inteiro: com menos de 1s restante não há como fazer long polling
+        remaining = deadline - time.monotonic()
+        poll_seconds = min(wait_seconds, int(remaining), SQS_MAX_WAIT_SECONDS)
+        if remaining <= 0 or (wait_seconds > 0 and poll_seconds <= 0):
+            break
+
+        received = receive_messages_from_sqs(min(SQS_MAX_BATCH_SIZE, count - len(messages)), poll_seconds)
+        receive_calls += 1
+        if not received:
+            if wait_seconds == 0:
+                # Sem long polling, uma resposta vazia indica fila vazia
+                break
+            continue
+
+        decoded = [m for m in received if 'decode_error' not in m]
+        failed_handles = set()
+        if decoded:
+            delete_calls += 1
+            failures = delete_message_batch_from_sqs([m['receipt_handle'] for m in decoded])
+            delete_failures.extend(failures)
+            failed_handles = {failure['receipt_handle'] for failure in failures}
+            get_message_codec().release(m['blob_key'] for m in decoded if m['receipt_handle'] not in failed_handles)
+
+        # Mensagens cuja deleção falhou voltarão à fila: aparecem só em delete_failures.
+        # Entregas repetidas de uma mesma mensagem (at-least-once ou visibilidade
+        # expirada) são contadas uma única vez
+        for m in received:
+            if m['message_id'] in seen_ids or m['receipt_handle'] in failed_handles:
+                continue
+            seen_ids.add(m['message_id'])
+            if 'decode_error' in m:
+                undecodable.append(m)
+            else:
+                messages.append(m)
+
+    return {
+        'messages': messages,
+        'undecodable': undecodable,
+        'delete_failures': delete_failures,
+        'receive_calls': receive_calls,
+        'delete_calls': delete_calls,
+        'duration_seconds': round(time.monotonic() - start_time, 4)
+    }
+
+def _split_by_request_size(encoded: List[EncodedMessage]) -> List[List[int]]:
+    """Agrupa as mensagens em sub-lotes cuja soma de 'wire_bytes' cabe em uma requisição SendMessageBatch."""
+    groups: List[List[int]] = []
+    size = 0
+    for i, message in enumerate(encoded):
+        if not groups or size + message.wire_bytes > SQS_MAX_MESSAGE_BYTES:
+            groups.append([])
+            size = 0
+        groups[-1].append(i)
+        size += message.wire_bytes
+    return groups
+
+def send_message_batch_to_sqs(
+    messages: List[str], first_index: int = 0, codec: Optional[str] = None
+) -> Tuple[int, List[Dict[str, Any]], CodecTotals, int]:
+    """Envia até 10 mensagens para a fila SQS com SendMessageBatch.
+
+    Os corpos são codificados aqui, na thread do executor do SQS: a
+    compressão do zlib libera o GIL e não bloqueia o event loop. Além das 10
+    entradas, o SQS limita a requisição inteira a 256 KiB, por isso as
+    mensagens codificadas são divididas em quantas chamadas forem necessárias
+    para respeitar o limite. A falha de uma chamada afeta apenas as suas entradas.
+
+    Args:
+        messages: Mensagens a serem enviadas (no máximo SQS_MAX_BATCH_SIZE)
+        first_index: Posição da primeira mensagem no lote total, usada nos relatórios de falha
+        codec: Compressão usada neste lote (padrão: SQS_CODEC)
+
+    Returns:
+        Tuple contendo:
+        - Número de mensagens enviadas com sucesso
+        - Lista de falhas com 'index', 'code' e 'message' de cada entrada rejeitada
+        - Totais de bytes das mensagens enviadas com sucesso
+        - Número de chamadas SendMessageBatch realizadas
+
+    Raises:
+        ValueError: Se o codec informado for inválido
+        RuntimeError: Se não for possível preparar o lote (cliente, fila ou codificação)
+    """
+    message_codec = get_message_codec().with_codec(codec)
+    encoded = []
+    try:
+        sqs = get_sqs_client()
+        queue_url = get_sqs_queue_url()
+        encoded = [message_codec.encode(message) for message in messages]
+    except ClientError as e:
+        message_codec.discard(encoded)
+        raise RuntimeError(f"Erro ao enviar lote de mensagens para SQS: {e}")
+    except Exception as e:
+        message_codec.discard(encoded)
+        raise RuntimeError(f"Erro inesperado: {e}")
+
+    successful = 0
+    failures: List[Dict[str, Any]] = []
+    totals = CodecTotals()
+    groups = _split_by_request_size(encoded)
+    for group in groups:
+        try:
+            response = sqs.send_message_batch(
+                QueueUrl=queue_url,
+                Entries=[
+                    {"Id": str(i), "MessageBody": encoded[i].body, "MessageAttributes": encoded[i].attributes}
+                    for i in group
+                ]
+            )
+            failed = {int(entry["Id"]): entry for entry in response.get("Failed", [])}
+        except ClientError as e:
+            error = {"Code": "BatchError", "Message": f"Erro ao enviar lote de mensagens para SQS: {e}"}
+            failed = {i: error for i in group}
+        except Exception as e:
+            failed = {i: {"Code": "BatchError", "Message": f"Erro inesperado: {e}"} for i in group}
+
+        failures.extend(
+            {
+                "index": first_index + i,
+                "code": entry.get("Code", "Unknown"),
+                "message": entry.get("Message", "")
+            }
+            for i, entry in sorted(failed.items())
+        )
+        message_codec.discard(encoded[i] for i in failed)
+        for i in group:
+            if i not in failed:
+                successful += 1
+                totals.add(encoded[i])
+    return successful, failures, totals, len(groups)
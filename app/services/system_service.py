@@ -1,23 +1,42 @@
 """Serviços relacionados ao sistema."""
 import socket
-import psutil
 import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import psutil
 
 def get_hostname() -> str:
     """Retorna o hostname do servidor."""
     return socket.gethostname()
 
+_process: Optional["psutil.Process"] = None
+
+def get_process() -> "psutil.Process":
+    """Retorna o handle psutil do processo atual, criado uma única vez.
+
+    Reutilizar o handle evita recriá-lo a cada leitura e mantém o estado que
+    o psutil usa para calcular cpu_percent entre chamadas. O handle é
+    recriado se o PID mudar (processo filho após fork). O psutil só é
+    importado aqui, no primeiro uso, para não pesar na inicialização.
+    """
+    global _process
+    process = _process
+    if process is None or process.pid != os.getpid():
+        import psutil
+        process = _process = psutil.Process()
+    return process
+
 def get_memory_usage_mb() -> float:
     """Retorna o uso de memória atual do processo em MB.
     
     Returns:
         float: Uso de memória em megabytes
     """
-    process = psutil.Process()
-    return process.memory_info().rss / (1024 * 1024)
+    return get_process().memory_info().rss / (1024 * 1024)
 
 def get_cpu_count() -> int:
-    """Retorna o número de núcleos de CPU disponíveis."""
+    """Retorna o número de núcleos de CPU do host (ver resource_service para os limites do contêiner)."""
     cpu_cores = os.cpu_count()
     if cpu_cores is None:
         raise RuntimeError("Não foi possível determinar o número de núcleos da CPU")
@@ -0,0 +1,171 @@
+"""Amostragem contínua de uso de recursos do processo.
+
+Um único sampler em background lê, a cada intervalo, CPU%, RSS, threads,
+descritores de arquivo, trocas de contexto e contadores de I/O do processo
+(e o total dos processos filhos, como os workers de CPU) usando handles
+psutil em cache. As amostras ficam em um buffer circular de tamanho fixo,
+consultado pelo endpoint de telemetria, transmitido via SSE e reutilizado
+pelos stress tests em vez de novas leituras do psutil. O psutil só é
+importado quando o sampler coleta a primeira amostra.
+"""
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from ..config import get_telemetry_buffer_size, get_telemetry_interval_seconds
+from .system_service import get_memory_usage_mb, get_process
+
+if TYPE_CHECKING:
+    import psutil
+
+MB = 1024 * 1024
+
+class ResourceSampler:
+    """Thread de amostragem de recursos com buffer circular.
+
+    Args:
+        interval_seconds: Intervalo entre amostras
+        buffer_size: Quantidade de amostras mantidas no buffer
+    """
+
+    def __init__(self, interval_seconds: float, buffer_size: int):
+        self.interval_seconds = interval_seconds
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._sequence = 0
+        self._children: Dict[int, "psutil.Process"] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Indica se a thread de amostragem está ativa."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Inicia a thread de amostragem, se ainda não estiver ativa."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            # Primeira leitura de cpu_percent apenas inicializa a referência
+            get_process().cpu_percent(None)
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Encerra a thread de amostragem."""
+        with self._lock:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join(self.interval_seconds * 2 + 1)
+                self._thread = None
+
+    def _run(self) -> None:
+        import psutil
+
+        next_tick = time.monotonic()
+        while True:
+            try:
+                self._append(self.take_sample())
+            except psutil.Error:
+                pass
+            next_tick = max(next_tick + self.interval_seconds, time.monotonic())
+            if self._stop.wait(next_tick - time.monotonic()):
+                return
+
+    def _append(self, sample: Dict[str, Any]) -> None:
+        # deque.append é atômico; o número de sequência é escrito apenas por esta thread
+        self._sequence += 1
+        sample["seq"] = self._sequence
+        self._samples.append(sample)
+
+    def _children_usage(self, process: "psutil.Process") -> Dict[str, Any]:
+        """Soma CPU% e RSS dos processos filhos, mantendo um handle por PID."""
+        import psutil
+
+        cpu_percent = 0.0
+        rss = 0
+        alive: Dict[int, "psutil.Process"] = {}
+        for child in process.children(recursive=True):
+            handle = self._children.get(child.pid, child)
+            try:
+                with handle.oneshot():
+                    cpu_percent += handle.cpu_percent(None)
+                    rss += handle.memory_info().rss
+                alive[child.pid] = handle
+            except psutil.Error:
+                continue
+        self._children = alive
+        return {"count": len(alive), "cpu_percent": round(cpu_percent, 1), "rss_mb": round(rss / MB, 2)}
+
+    def take_sample(self) -> Dict[str, Any]:
+        """Lê o uso de recursos atual do processo."""
+        import psutil
+
+        process = get_process()
+        with process.oneshot():
+            memory = process.memory_info()
+            ctx = process.num_ctx_switches()
+            sample: Dict[str, Any] = {
+                "timestamp": time.time(),
+                "cpu_percent": round(process.cpu_percent(None), 1),
+                "rss_mb": round(memory.rss / MB, 2),
+                "vms_mb": round(memory.vms / MB, 2),
+                "threads": process.num_threads(),
+                "fds": process.num_fds() if hasattr(process, "num_fds") else None,
+                "ctx_switches_voluntary": ctx.voluntary,
+                "ctx_switches_involuntary": ctx.involuntary,
+                "io_read_bytes": None,
+                "io_write_bytes": None,
+            }
+            try:
+                io = process.io_counters()
+                sample["io_read_bytes"] = io.read_bytes
+                sample["io_write_bytes"] = io.write_bytes
+            except (AttributeError, psutil.Error):
+                pass
+        sample["children"] = self._children_usage(process)
+        return sample
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Retorna a amostra mais recente, se houver."""
+        try:
+            return self._samples[-1]
+        except IndexError:
+            return None
+
+    def since(self, sequence: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Retorna as amostras com número de sequência maior que 'sequence'."""
+        samples = [sample for sample in list(self._samples) if sample["seq"] > sequence]
+        return samples[-limit:] if limit else samples
+
+_sampler: Optional[ResourceSampler] = None
+_sampler_lock = threading.Lock()
+
+def get_resource_sampler() -> ResourceSampler:
+    """Retorna o sampler global de recursos, criando-o na primeira chamada."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ResourceSampler(get_telemetry_interval_seconds(), get_telemetry_buffer_size())
+        return _sampler
+
+def shutdown_resource_sampler() -> None:
+    """Encerra o sampler global de recursos, se existir."""
+    with _sampler_lock:
+        if _sampler is not None:
+            _sampler.stop()
+
+def get_rss_mb(max_age_seconds: float) -> float:
+    """Retorna o RSS do processo em MB reaproveitando a última amostra do sampler.
+
+    Se o sampler não estiver ativo ou a amostra for mais antiga que
+    'max_age_seconds', lê o RSS diretamente pelo handle em cache.
+    """
+    sampler = _sampler
+    sample = sampler.latest() if sampler is not None and sampler.running else None
+    if sample is not None and time.time() - sample["timestamp"] <= max_age_seconds:
+        return sample["rss_mb"]
+    return get_memory_usage_mb()
@@ -0,0 +1,80 @@
+"""Tempos das fases de importação e inicialização da aplicação.
+
+O início do processo é lido de /proc (sem psutil), o que permite separar o
+tempo do interpretador e do servidor antes da aplicação, o tempo de
+importação dos módulos da aplicação, a montagem do app (routers, métricas e
+middlewares) e o lifespan até o worker ficar pronto. O endpoint /startup
+expõe esses tempos e quais dependências pesadas já foram carregadas.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Dependências pesadas carregadas apenas no primeiro uso
+LAZY_MODULES = ("boto3", "psutil")
+
+def get_process_start_time() -> Optional[float]:
+    """Retorna o instante (epoch) de criação do processo, ou None fora do Linux."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Campos após o nome do processo, que pode conter espaços; starttime é o 22º campo
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+class StartupTimings:
+    """Registro das fases de inicialização do worker."""
+
+    def __init__(self) -> None:
+        self.process_started_at = get_process_start_time()
+        self.created_at = time.time()
+        self.phases: List[Dict[str, Any]] = []
+        self.features: Dict[str, bool] = {}
+        self.ready_at: Optional[float] = None
+        if self.process_started_at is not None:
+            # Interpretador, servidor e dependências importadas antes da aplicação
+            self.record("interpreter", self.process_started_at, self.created_at)
+
+    def record(self, name: str, started_at: float, finished_at: Optional[float] = None) -> None:
+        """Registra uma fase a partir dos instantes (epoch) de início e fim."""
+        finished_at = time.time() if finished_at is None else finished_at
+        self.phases.append({"name": name, "started_at": started_at, "duration_seconds": max(0.0, finished_at - started_at)})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mede o bloco como uma fase de inicialização."""
+        started_at = time.time()
+        try:
+            yield
+        finally:
+            self.record(name, started_at)
+
+    def mark_ready(self) -> None:
+        """Marca o fim do lifespan de inicialização."""
+        self.ready_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna as fases com offsets relativos ao início do processo."""
+        origin = self.process_started_at if self.process_started_at is not None else self.created_at
+        return {
+            "process_started_at": self.process_started_at,
+            "time_to_ready_seconds": round(self.ready_at - origin, 4) if self.ready_at is not None else None,
+            "phases": [
+                {
+                    "name": phase["name"],
+                    "offset_seconds": round(phase["started_at"] - origin, 4),
+                    "duration_seconds": round(phase["duration_seconds"], 4),
+                }
+                for phase in self.phases
+            ],
+            "features": dict(self.features),
+            "lazy_modules": {name: name in sys.modules for name in LAZY_MODULES},
+        }
+
+# Criado ao importar app.main, antes dos demais módulos da aplicação
+startup_timings = StartupTimings()
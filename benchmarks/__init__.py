@@ -0,0 +1 @@
+"""Ferramentas de benchmark da Test Application API."""
@@ -0,0 +1,4 @@
+"""Permite executar a suíte de benchmarks com 'python -m benchmarks'."""
+from .bench import main
+
+main()
@@ -0,0 +1,85 @@
+"""Cliente ASGI mínimo para medir a aplicação em processo, sem servidor HTTP.
+
+Chamar o app ASGI diretamente isola o custo da própria aplicação (roteamento,
+validação, serialização e middlewares) do custo de rede e do cliente HTTP.
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Headers = Iterable[Tuple[str, str]]
+
+class ASGIResponse:
+    """Resposta capturada de uma chamada ASGI."""
+
+    def __init__(self) -> None:
+        self.status = 0
+        self.headers: List[Tuple[bytes, bytes]] = []
+        self.chunks: List[bytes] = []
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self.chunks)
+
+async def call(
+    app: Any,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: Optional[Headers] = None,
+    query_string: str = ""
+) -> ASGIResponse:
+    """Executa uma requisição HTTP diretamente no app ASGI.
+
+    Args:
+        app: Aplicação ASGI (ex.: app.main.app)
+        method: Método HTTP
+        path: Caminho da requisição
+        body: Corpo da requisição
+        headers: Cabeçalhos adicionais
+        query_string: Query string sem o '?'
+
+    Returns:
+        ASGIResponse: Status, cabeçalhos e corpo da resposta
+    """
+    raw_headers = [(b"host", b"bench")]
+    raw_headers += [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers or ()]
+    if body:
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("latin-1"),
+        "query_string": query_string.encode("latin-1"),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    response = ASGIResponse()
+    response_complete = asyncio.Event()
+    request_sent = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # O cliente só desconecta depois de receber a resposta completa
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            response.status = message["status"]
+            response.headers = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            response.chunks.append(bytes(message.get("body", b"")))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return response
@@ -0,0 +1,326 @@
+"""Gerador de carga e suíte de benchmarks de todas as rotas da aplicação.
+
+Cada cenário é executado em laço fechado: 'concurrency' usuários virtuais
+repetem a mesma requisição durante 'duration' segundos, e o resultado reporta
+req/s e os percentis p50/p95/p99 de latência. Por padrão as requisições vão
+direto ao app ASGI em processo (com as rotas de mensageria apontadas para o
+SQS stand-in local); com --url a mesma suíte é executada contra um servidor
+real, usando conexões HTTP/1.1 persistentes.
+
+Os resultados podem ser gravados como baseline em JSON e comparados com
+execuções futuras: cenários cujo req/s cai ou cujo p99 sobe além do limite
+(em %) são marcados como regressão e o comando termina com código 1.
+
+Em processo o gerador de carga divide o event loop com a aplicação, então os
+números são comparáveis entre si (mesma máquina, mesmos parâmetros), não com
+os de um servidor real.
+
+Uso:
+    python -m benchmarks --concurrency 16 --duration 5 --save-baseline baseline.json
+    python -m benchmarks --baseline baseline.json --threshold 10
+    python -m benchmarks --url http://localhost:8000 --only health,fault
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .asgi_client import ASGIResponse, call
+from .http_client import HTTPConnection
+
+@dataclass(frozen=True)
+class Scenario:
+    """Requisição repetida por um cenário de benchmark."""
+
+    name: str
+    router: str
+    method: str
+    path: str
+    body: bytes = b""
+    headers: Tuple[Tuple[str, str], ...] = ()
+    query: str = ""
+    expected: Tuple[int, ...] = (200,)
+
+JSON_HEADERS = (("content-type", "application/json"),)
+UPLOAD_BODY = b"\0" * 65536
+
+# A ordem importa: 'messaging.send' abastece a fila consumida por 'messaging.receive'
+SCENARIOS: List[Scenario] = [
+    Scenario("info.root", "info", "GET", "/"),
+    Scenario("info.version", "info", "GET", "/version"),
+    Scenario("health.healthcheck", "health", "GET", "/healthcheck"),
+    Scenario("health.error", "health", "GET", "/healthcheck/error", expected=(500,)),
+    Scenario("fault.normal", "fault", "GET", "/healthcheck/fault", expected=(200, 503)),
+    Scenario("fault.soft", "fault", "GET", "/healthcheck/fault/soft", expected=(200, 503)),
+    Scenario("fault.rules", "fault", "GET", "/admin/fault-rules"),
+    Scenario("performance.download_64k", "performance", "GET", "/download/65536"),
+    Scenario("performance.upload_64k", "performance", "POST", "/upload", body=UPLOAD_BODY,
+             headers=(("content-type", "application/octet-stream"),)),
+    Scenario("messaging.send", "messaging", "POST", "/sent-message",
+             body=b'{"message":"bench"}', headers=JSON_HEADERS),
+    Scenario("messaging.receive", "messaging", "GET", "/receive-message"),
+]
+
+Send = Callable[[Scenario], Awaitable[ASGIResponse]]
+
+@dataclass
+class ScenarioResult:
+    """Medições de um cenário."""
+
+    requests: int = 0
+    errors: int = 0
+    duration_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    error_samples: Dict[str, int] = field(default_factory=dict)
+
+    def record_error(self, description: str) -> None:
+        self.errors += 1
+        self.error_samples[description] = self.error_samples.get(description, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumo serializável: req/s, erros e latências em ms."""
+        latencies = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_second": round(self.requests / self.duration_seconds, 1) if self.duration_seconds else 0.0,
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+                "p50": round(percentile(latencies, 0.50) * 1000, 3),
+                "p95": round(percentile(latencies, 0.95) * 1000, 3),
+                "p99": round(percentile(latencies, 0.99) * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            },
+            "error_samples": self.error_samples,
+        }
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Percentil pelo método nearest-rank de uma lista já ordenada."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+async def run_scenario(
+    scenario: Scenario,
+    make_sender: Callable[[], Tuple[Send, Callable[[], Awaitable[None]]]],
+    concurrency: int,
+    duration: float,
+    warmup: float
+) -> ScenarioResult:
+    """Executa um cenário em laço fechado com 'concurrency' usuários virtuais.
+
+    Requisições iniciadas durante o aquecimento não entram nas medições.
+    """
+    result = ScenarioResult()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+
+    async def user() -> None:
+        send, close = make_sender()
+        try:
+            while True:
+                begin = time.perf_counter()
+                if begin >= deadline:
+                    return
+                try:
+                    response = await send(scenario)
+                    error = None if response.status in scenario.expected else f"status {response.status}"
+                except Exception as e:
+                    error = type(e).__name__
+                if begin < measure_from:
+                    continue
+                result.requests += 1
+                result.latencies.append(time.perf_counter() - begin)
+                if error is not None:
+                    result.record_error(error)
+        finally:
+            await close()
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    result.duration_seconds = time.perf_counter() - max(measure_from, start)
+    return result
+
+def in_process_sender_factory() -> Callable[[], Tuple[Send, Callable[[], Awaitable[None]]]]:
+    """Fábrica de usuários virtuais que chamam o app ASGI diretamente."""
+    from app.main import app
+
+    async def send(scenario: Scenario) -> ASGIResponse:
+        return await call(app, scenario.method, scenario.path, scenario.body, scenario.headers, scenario.query)
+
+    async def close() -> None:
+        pass
+
+    return lambda: (send, close)
+
+def live_sender_factory(url: str, timeout: float) -> Callable[[], Tuple[Send, Callable[[], Awaitable[None]]]]:
+    """Fábrica de usuários virtuais com uma conexão HTTP/1.1 persistente cada."""
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        raise ValueError("Apenas URLs http://host[:porta] são suportadas")
+    host, port = parts.hostname, parts.port or 80
+    prefix = parts.path.rstrip("/")
+
+    def factory() -> Tuple[Send, Callable[[], Awaitable[None]]]:
+        connection = HTTPConnection(host, port, timeout)
+
+        async def send(scenario: Scenario) -> ASGIResponse:
+            return await connection.request(scenario.method, prefix + scenario.path, scenario.body,
+                                            scenario.headers, scenario.query)
+
+        return send, connection.close
+
+    return factory
+
+def select_scenarios(only: Optional[str]) -> List[Scenario]:
+    """Filtra os cenários por nome de router ou de cenário (separados por vírgula)."""
+    if not only:
+        return list(SCENARIOS)
+    wanted = {item.strip() for item in only.split(",") if item.strip()}
+    selected = [s for s in SCENARIOS if s.router in wanted or s.name in wanted]
+    if not selected:
+        raise ValueError(f"Nenhum cenário corresponde a '{only}'")
+    return selected
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, p99_floor_ms: float = 0.0) -> List[str]:
+    """Compara os resultados com o baseline e retorna as regressões encontradas.
+
+    Uma regressão é uma queda de req/s ou um aumento de p99 maior que
+    'threshold' por cento, ou erros em um cenário que não tinha nenhum.
+    Aumentos de p99 menores que 'p99_floor_ms' em valor absoluto são
+    ignorados, já que em rotas sub-milissegundo o p99 oscila muito entre execuções.
+    """
+    regressions = []
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        base_rps, rps = base["requests_per_second"], result["requests_per_second"]
+        if base_rps and (base_rps - rps) / base_rps * 100 > threshold:
+            regressions.append(f"{name}: req/s {base_rps} -> {rps} ({(rps - base_rps) / base_rps * 100:+.1f}%)")
+        base_p99, p99 = base["latency_ms"]["p99"], result["latency_ms"]["p99"]
+        if base_p99 and p99 - base_p99 >= p99_floor_ms and (p99 - base_p99) / base_p99 * 100 > threshold:
+            regressions.append(f"{name}: p99 {base_p99}ms -> {p99}ms ({(p99 - base_p99) / base_p99 * 100:+.1f}%)")
+        if result["errors"] and not base["errors"]:
+            regressions.append(f"{name}: {result['errors']} erro(s), baseline sem erros")
+    return regressions
+
+def print_table(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'cenário':<28}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'erros':>8}"
+    if baseline is not None:
+        header += f"{'Δ req/s':>10}{'Δ p99':>10}"
+    print(header)
+    for name, result in report["scenarios"].items():
+        latency = result["latency_ms"]
+        line = (f"{name:<28}{result['requests_per_second']:>10.1f}{latency['p50']:>10.3f}"
+                f"{latency['p95']:>10.3f}{latency['p99']:>10.3f}{result['errors']:>8}")
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base is not None:
+            rps_delta = ((result["requests_per_second"] / base["requests_per_second"] - 1) * 100
+                         if base["requests_per_second"] else 0.0)
+            p99_delta = (latency["p99"] / base["latency_ms"]["p99"] - 1) * 100 if base["latency_ms"]["p99"] else 0.0
+            line += f"{rps_delta:>+9.1f}%{p99_delta:>+9.1f}%"
+        print(line)
+
+async def run_suite(
+    scenarios: List[Scenario],
+    make_sender: Callable[[], Tuple[Send, Callable[[], Awaitable[None]]]],
+    concurrency: int,
+    duration: float,
+    warmup: float
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for scenario in scenarios:
+        print(f"-> {scenario.name} ({scenario.method} {scenario.path})", file=sys.stderr)
+        result = await run_scenario(scenario, make_sender, concurrency, duration, warmup)
+        results[scenario.name] = result.summary()
+    return results
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="URL de um servidor real (padrão: app ASGI em processo)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Usuários virtuais simultâneos por cenário")
+    parser.add_argument("--duration", type=float, default=5.0, help="Duração medida de cada cenário em segundos")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Aquecimento não medido de cada cenário em segundos")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout de cada requisição com --url")
+    parser.add_argument("--only", help="Routers ou cenários a executar, separados por vírgula (ex.: health,fault.soft)")
+    parser.add_argument("--list", action="store_true", help="Lista os cenários e sai")
+    parser.add_argument("--output", help="Grava o relatório completo em JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Grava os resultados como baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Compara os resultados com um baseline gravado")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Variação tolerada em %% antes de marcar regressão")
+    parser.add_argument("--p99-floor-ms", type=float, default=1.0,
+                        help="Aumento absoluto mínimo de p99 para marcar regressão (padrão: 1 ms)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS:
+            print(f"{scenario.name:<28}{scenario.method:<6}{scenario.path}")
+        return
+    if args.concurrency < 1 or args.duration <= 0 or args.warmup < 0:
+        parser.error("--concurrency deve ser >= 1, --duration > 0 e --warmup >= 0")
+    try:
+        scenarios = select_scenarios(args.only)
+    except ValueError as e:
+        parser.error(str(e))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    server = None
+    if args.url:
+        make_sender = live_sender_factory(args.url, args.timeout)
+    else:
+        from .sqs_standin import configure_environment, start_standin
+
+        if any(s.router == "messaging" for s in scenarios):
+            server, state = start_standin()
+            configure_environment(state)
+        os.environ.setdefault("VERSION", "bench")
+        make_sender = in_process_sender_factory()
+
+    try:
+        results = asyncio.run(run_suite(scenarios, make_sender, args.concurrency, args.duration, args.warmup))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "target": args.url or "in-process",
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "scenarios": results,
+    }
+    print_table(report, baseline)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados gravados em {path}")
+
+    if baseline is not None:
+        if baseline.get("target") != report["target"] or baseline.get("concurrency") != report["concurrency"]:
+            print("Aviso: baseline gravado com alvo ou concorrência diferentes", file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold, args.p99_floor_ms)
+        if regressions:
+            print(f"Regressões acima de {args.threshold:g}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"Nenhuma regressão acima de {args.threshold:g}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark de conexões lentas simultâneas nos endpoints /delay.
+
+Abre N conexões TCP reais contra um worker uvicorn, cada uma chamando
+/delay/{ms}, e mede quantas ficaram abertas ao mesmo tempo (métrica
+delay_requests_in_flight) e quanto o tempo de resposta excedeu o atraso pedido.
+
+Uso:
+    python -m benchmarks.delay_connections --connections 10000 --delay-ms 20000
+    python -m benchmarks.delay_connections --url http://localhost:8000 --connections 5000
+
+Sem --url um worker uvicorn é iniciado em uma porta livre. Aumente o limite de
+arquivos abertos (ulimit -n) para testar mais conexões.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+async def _request(host: str, port: int, path: str) -> Tuple[int, float]:
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    status = int(data.split(b" ", 2)[1]) if data.startswith(b"HTTP/") else 0
+    return status, time.perf_counter() - start
+
+async def _in_flight(host: str, port: int) -> Optional[float]:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /metrics HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    data = await reader.read()
+    writer.close()
+    for line in data.decode("utf-8", "replace").splitlines():
+        if line.startswith("delay_requests_in_flight "):
+            return float(line.split()[1])
+    return None
+
+async def _run(host: str, port: int, connections: int, delay_ms: int, ramp_per_second: int) -> None:
+    path = f"/delay/{delay_ms}"
+    tasks: List[asyncio.Task] = []
+    start = time.perf_counter()
+    for i in range(connections):
+        tasks.append(asyncio.create_task(_request(host, port, path)))
+        if ramp_per_second and i % 100 == 99:
+            await asyncio.sleep(100 / ramp_per_second)
+    ramp_seconds = time.perf_counter() - start
+
+    # Amostra a métrica até o pico, enquanto as conexões seguem abertas
+    peak = 0.0
+    while not all(task.done() for task in tasks):
+        value = await _in_flight(host, port)
+        peak = max(peak, value or 0.0)
+        if peak >= connections:
+            break
+        await asyncio.sleep(0.5)
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    ok = [elapsed for result in results if isinstance(result, tuple) and result[0] == 200 for elapsed in (result[1],)]
+    errors = connections - len(ok)
+    overhead = sorted(elapsed * 1000 - delay_ms for elapsed in ok)
+
+    print(f"conexões: {connections} (abertas em {ramp_seconds:.1f}s), atraso: {delay_ms} ms")
+    print(f"pico simultâneo (delay_requests_in_flight): {peak:.0f}")
+    print(f"respostas 200: {len(ok)}, erros: {errors}")
+    if overhead:
+        print(f"excesso sobre o atraso: p50={statistics.median(overhead):.1f}ms "
+              f"p99={overhead[int(len(overhead) * 0.99) - 1]:.1f}ms max={overhead[-1]:.1f}ms")
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _start_server(port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--backlog", "65535", "--log-level", "warning", "--no-access-log"],
+        env=dict(os.environ)
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("O servidor uvicorn não iniciou a tempo")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="URL de uma instância em execução (padrão: inicia um worker local)")
+    parser.add_argument("--connections", type=int, default=10000, help="Conexões simultâneas")
+    parser.add_argument("--delay-ms", type=int, default=20000, help="Atraso de cada requisição")
+    parser.add_argument("--ramp-per-second", type=int, default=0, help="Limita a taxa de abertura de conexões (0: sem limite)")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname or "localhost", parsed.port or 80
+    else:
+        host, port = "127.0.0.1", _free_port()
+        process = _start_server(port)
+    try:
+        asyncio.run(_run(host, port, args.connections, args.delay_ms, args.ramp_per_second))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+if __name__ == "__main__":
+    main()
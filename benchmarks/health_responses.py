@@ -0,0 +1,84 @@
+"""Micro-benchmark dos endpoints de health e fault injection.
+
+Compara, em processo e sem rede, a vazão por worker das rotas atuais (corpos
+pré-serializados em handlers async) com a implementação anterior (dict +
+JSONResponse em handlers síncronos executados no threadpool).
+
+Uso:
+    python -m benchmarks.health_responses --requests 20000
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Set, Tuple
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+
+from .asgi_client import call
+
+PATHS = ("/healthcheck", "/healthcheck/fault", "/healthcheck/fault/soft")
+
+def _legacy_app() -> FastAPI:
+    """Aplicação com as rotas na forma anterior, usada como referência."""
+    normal_options = [200, 503]
+    soft_weights = [200, 200, 200, 200, 200, 200, 200, 503]
+
+    router = APIRouter()
+
+    @router.get("/healthcheck")
+    def healthcheck() -> JSONResponse:
+        return JSONResponse(content={"status": "healthy"}, status_code=200)
+
+    @router.get("/healthcheck/fault")
+    def fault() -> JSONResponse:
+        random_status = random.choice(normal_options)
+        return JSONResponse(status_code=random_status,
+                            content={"status": random_status, "description": "fault injection"})
+
+    @router.get("/healthcheck/fault/soft")
+    def soft() -> JSONResponse:
+        random_status = random.choice(soft_weights)
+        return JSONResponse(status_code=random_status,
+                            content={"status": random_status, "description": "fault injection"})
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+def _current_app() -> FastAPI:
+    """Aplicação apenas com os routers atuais de health e fault injection."""
+    from app.routers import fault, health
+
+    app = FastAPI()
+    app.include_router(health.router)
+    app.include_router(fault.router)
+    return app
+
+async def _measure(app: Any, path: str, requests: int) -> Tuple[float, Set[bytes]]:
+    await call(app, "GET", path)
+    bodies = set()
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await call(app, "GET", path)
+        bodies.add(response.body)
+    return requests / (time.perf_counter() - start), bodies
+
+async def _run(requests: int) -> None:
+    legacy, current = _legacy_app(), _current_app()
+    print(f"{'rota':<26}{'anterior (req/s)':>18}{'atual (req/s)':>16}{'ganho':>8}")
+    for path in PATHS:
+        before, legacy_bodies = await _measure(legacy, path, requests)
+        after, current_bodies = await _measure(current, path, requests)
+        same = "" if legacy_bodies == current_bodies else "  (corpos diferentes!)"
+        print(f"{path:<26}{before:>18.0f}{after:>16.0f}{after / before:>7.2f}x{same}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Requisições por rota e implementação")
+    args = parser.parse_args()
+    asyncio.run(_run(args.requests))
+
+if __name__ == "__main__":
+    main()
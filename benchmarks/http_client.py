@@ -0,0 +1,106 @@
+"""Cliente HTTP/1.1 mínimo com keep-alive para benchmarks contra uma URL real.
+
+Cada instância mantém uma única conexão aberta e a reutiliza entre
+requisições, como um usuário virtual de um gerador de carga. Suporta corpos
+com Content-Length e Transfer-Encoding: chunked.
+"""
+import asyncio
+from typing import Iterable, List, Optional, Tuple
+
+from .asgi_client import ASGIResponse
+
+Headers = Iterable[Tuple[str, str]]
+
+class HTTPConnection:
+    """Conexão HTTP/1.1 persistente com um servidor.
+
+    Args:
+        host: Endereço do servidor
+        port: Porta do servidor
+        timeout: Tempo máximo de cada requisição em segundos
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def close(self) -> None:
+        """Fecha a conexão, se aberta."""
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        headers: Optional[Headers] = None,
+        query_string: str = ""
+    ) -> ASGIResponse:
+        """Envia uma requisição e lê a resposta completa.
+
+        Em caso de erro a conexão é descartada e reaberta na próxima chamada.
+        """
+        try:
+            return await asyncio.wait_for(self._request(method, path, body, headers, query_string), self.timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _request(self, method: str, path: str, body: bytes, headers: Optional[Headers], query_string: str) -> ASGIResponse:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        target = f"{path}?{query_string}" if query_string else path
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in headers or ()]
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self._writer.drain()
+
+        response = ASGIResponse()
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionError("Conexão encerrada pelo servidor")
+        response.status = int(status_line.split(b" ", 2)[1])
+        length: Optional[int] = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            name, value = name.strip().lower(), value.strip()
+            response.headers.append((name, value))
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding" and value.lower() == b"chunked":
+                chunked = True
+            elif name == b"connection" and value.lower() == b"close":
+                keep_alive = False
+
+        if chunked:
+            response.chunks = await self._read_chunked()
+        elif length is not None:
+            response.chunks = [await self._reader.readexactly(length)]
+        else:
+            response.chunks = [await self._reader.read()]
+            keep_alive = False
+        if not keep_alive:
+            await self.close()
+        return response
+
+    async def _read_chunked(self) -> List[bytes]:
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Trailers opcionais até a linha vazia
+                while (await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return chunks
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
@@ -0,0 +1,63 @@
+"""Benchmark de isolamento entre o I/O de fila e as demais rotas.
+
+Dispara long pollings concorrentes em /receive-message/batch contra uma fila
+vazia do SQS stand-in e, ao mesmo tempo, mede a latência de GET /version
+(rota síncrona que usa o threadpool padrão do Starlette). Com a camada
+assíncrona de SQS os long pollings rodam no executor dedicado e não devem
+afetar a latência de /version.
+
+Uso:
+    python -m benchmarks.messaging_isolation --pollers 100 --wait-seconds 2
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+from .asgi_client import call
+from .sqs_standin import configure_environment, start_standin
+
+async def _run(pollers: int, wait_seconds: int, probes: int) -> None:
+    from app.main import app
+
+    async def long_poll() -> int:
+        response = await call(app, "GET", "/receive-message/batch",
+                              query_string=f"count=1&wait_seconds={wait_seconds}&timeout_seconds={wait_seconds}")
+        return response.status
+
+    async def probe() -> List[float]:
+        latencies = []
+        for _ in range(probes):
+            start = time.perf_counter()
+            await call(app, "GET", "/version")
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(wait_seconds / probes)
+        return latencies
+
+    await asyncio.sleep(0)
+    poll_tasks = [asyncio.create_task(long_poll()) for _ in range(pollers)]
+    await asyncio.sleep(0.05)
+    latencies = sorted(await probe())
+    statuses = await asyncio.gather(*poll_tasks)
+
+    print(f"long pollings concorrentes: {pollers} (status: {sorted(set(statuses))})")
+    print(f"/version durante os long pollings: mean={statistics.fmean(latencies):.2f}ms "
+          f"p50={latencies[len(latencies) // 2]:.2f}ms max={latencies[-1]:.2f}ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pollers", type=int, default=100, help="Long pollings concorrentes")
+    parser.add_argument("--wait-seconds", type=int, default=2, help="Duração de cada long polling")
+    parser.add_argument("--probes", type=int, default=20, help="Requisições de /version durante o teste")
+    args = parser.parse_args()
+
+    server, state = start_standin()
+    configure_environment(state)
+    os.environ.setdefault("VERSION", "bench")
+    asyncio.run(_run(args.pollers, args.wait_seconds, args.probes))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
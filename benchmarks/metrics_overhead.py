@@ -0,0 +1,78 @@
+"""Micro-benchmark do custo por requisição da instrumentação Prometheus.
+
+Mede, em processo e sem rede, o tempo médio por requisição de rotas leves
+em cada modo de métricas (off, default, lean e lean com amostragem) e o
+custo adicional em relação ao modo off. Cada modo usa uma aplicação e um
+registry próprios, com os mesmos routers, e as rodadas se alternam entre os
+modos para diluir variações da máquina.
+
+Uso:
+    python -m benchmarks.metrics_overhead --requests 20000 --rounds 3
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry
+
+from app.metrics import MetricsSettings, setup_metrics
+
+from .asgi_client import call
+
+PATHS = ("/healthcheck", "/version")
+
+def _modes(sample_every: int) -> List[Tuple[str, MetricsSettings]]:
+    return [
+        ("off", MetricsSettings(mode="off")),
+        ("default", MetricsSettings(mode="default")),
+        ("lean", MetricsSettings(mode="lean")),
+        (f"lean 1/{sample_every}", MetricsSettings(mode="lean", sampled_routes=list(PATHS), sample_every=sample_every)),
+    ]
+
+def _app(settings: MetricsSettings) -> FastAPI:
+    """Aplicação com os routers de info e health instrumentada no modo indicado."""
+    from app.routers import health, info
+
+    app = FastAPI()
+    app.include_router(info.router)
+    app.include_router(health.router)
+    setup_metrics(app, settings, CollectorRegistry())
+    return app
+
+async def _measure(app: Any, path: str, requests: int) -> float:
+    """Tempo médio por requisição em microssegundos."""
+    for _ in range(min(requests, 500)):
+        await call(app, "GET", path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app, "GET", path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+async def _run(requests: int, rounds: int, sample_every: int) -> None:
+    modes = [(name, _app(settings)) for name, settings in _modes(sample_every)]
+    best: Dict[Tuple[str, str], float] = {}
+    for _ in range(rounds):
+        for path in PATHS:
+            for name, app in modes:
+                elapsed = await _measure(app, path, requests)
+                best[(name, path)] = min(best.get((name, path), elapsed), elapsed)
+
+    print(f"{'rota':<16}{'modo':<14}{'µs/req':>10}{'custo (µs)':>12}")
+    for path in PATHS:
+        baseline = best[("off", path)]
+        for name, _ in modes:
+            elapsed = best[(name, path)]
+            print(f"{path:<16}{name:<14}{elapsed:>10.1f}{elapsed - baseline:>12.1f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Requisições por rota, modo e rodada")
+    parser.add_argument("--rounds", type=int, default=3, help="Rodadas alternadas; vale o melhor resultado de cada modo")
+    parser.add_argument("--sample-every", type=int, default=10, help="Amostragem do modo lean amostrado")
+    args = parser.parse_args()
+    asyncio.run(_run(args.requests, args.rounds, args.sample_every))
+
+if __name__ == "__main__":
+    main()
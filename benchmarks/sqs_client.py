@@ -0,0 +1,56 @@
+"""Benchmark da latência por requisição do envio de mensagens ao SQS.
+
+Compara a criação de um cliente boto3 a cada chamada (comportamento antigo)
+com o cliente compartilhado de app.services.sqs_service, usando o SQS
+stand-in local.
+
+Uso:
+    python -m benchmarks.sqs_client --requests 200 --latency-ms 1
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import boto3
+
+from .sqs_standin import configure_environment, start_standin
+
+def _measure(label: str, requests: int, call: Callable[[], None]) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    result = {
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+    print(f"{label:<28} mean={result['mean_ms']:7.2f}ms  p50={result['p50_ms']:7.2f}ms  p99={result['p99_ms']:7.2f}ms")
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Número de mensagens enviadas por cenário")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latência artificial do SQS stand-in")
+    args = parser.parse_args()
+
+    server, state = start_standin(latency_ms=args.latency_ms)
+    queue_url = configure_environment(state)
+
+    from app.services.sqs_service import get_sqs_client, send_message_to_sqs
+
+    def per_request_client() -> None:
+        sqs = boto3.client("sqs", region_name="us-east-1", endpoint_url=state.base_url)
+        sqs.send_message(QueueUrl=queue_url, MessageBody="benchmark")
+
+    get_sqs_client()  # Aquece o cache antes da medição
+    baseline = _measure("cliente por requisição", args.requests, per_request_client)
+    shared = _measure("cliente compartilhado", args.requests, lambda: send_message_to_sqs("benchmark"))
+    print(f"speedup: {baseline['mean_ms'] / shared['mean_ms']:.1f}x")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
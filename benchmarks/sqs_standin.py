@@ -0,0 +1,262 @@
+"""Servidor local que emula o subconjunto da API do Amazon SQS usado pela aplicação.
+
+Implementa o protocolo JSON do SQS (cabeçalho X-Amz-Target) para as operações
+SendMessage, SendMessageBatch, ReceiveMessage (com long polling),
+DeleteMessage, DeleteMessageBatch, CreateQueue, GetQueueUrl,
+GetQueueAttributes e PurgeQueue. As filas são criadas automaticamente no
+primeiro uso e mantidas em memória.
+
+Uso:
+    python -m benchmarks.sqs_standin --port 9324 --latency-ms 2
+
+    export SQS_ENDPOINT_URL=http://localhost:9324
+    export SQS_QUEUE_URL=http://localhost:9324/000000000000/test-queue
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+ACCOUNT_ID = "000000000000"
+DEFAULT_VISIBILITY_TIMEOUT = 30
+MAX_BATCH_REQUEST_BYTES = 256 * 1024
+
+class SQSError(Exception):
+    """Erro retornado ao cliente com o código do SQS (ex.: BatchRequestTooLong)."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+def _message_size(body: str, attributes: Optional[Dict[str, Dict[str, str]]]) -> int:
+    """Tamanho da mensagem como o SQS conta: corpo, nome, tipo e valor de cada atributo."""
+    return len(body.encode("utf-8")) + sum(
+        len(name.encode("utf-8")) + len(value["DataType"]) + len(value.get("StringValue", "").encode("utf-8"))
+        for name, value in (attributes or {}).items()
+    )
+
+class Queue:
+    """Fila em memória com suporte a visibility timeout e long polling."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.available: Deque[Dict[str, Any]] = deque()
+        self.in_flight: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.condition = threading.Condition()
+
+    def send(self, body: str, attributes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        message = {
+            "MessageId": str(uuid.uuid4()),
+            "Body": body,
+            "MD5OfBody": hashlib.md5(body.encode("utf-8")).hexdigest(),
+            "MessageAttributes": attributes or {},
+        }
+        with self.condition:
+            self.available.append(message)
+            self.condition.notify()
+        return message
+
+    def receive(self, max_messages: int, wait_seconds: float, visibility_timeout: float) -> List[Dict[str, Any]]:
+        deadline = time.monotonic() + wait_seconds
+        with self.condition:
+            self._requeue_expired()
+            while not self.available:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self.condition.wait(remaining)
+                self._requeue_expired()
+            received = []
+            while self.available and len(received) < max_messages:
+                message = self.available.popleft()
+                receipt_handle = uuid.uuid4().hex
+                self.in_flight[receipt_handle] = (time.monotonic() + visibility_timeout, message)
+                received.append(dict(message, ReceiptHandle=receipt_handle))
+            return received
+
+    def delete(self, receipt_handle: str) -> bool:
+        with self.condition:
+            return self.in_flight.pop(receipt_handle, None) is not None
+
+    def purge(self) -> None:
+        with self.condition:
+            self.available.clear()
+            self.in_flight.clear()
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        expired = [handle for handle, (until, _) in self.in_flight.items() if until <= now]
+        for handle in expired:
+            self.available.append(self.in_flight.pop(handle)[1])
+
+class SQSStandIn:
+    """Estado das filas e implementação das operações do SQS."""
+
+    def __init__(self, base_url: str, latency_seconds: float = 0.0):
+        self.base_url = base_url
+        self.latency_seconds = latency_seconds
+        self.queues: Dict[str, Queue] = {}
+        self.lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def queue_url(self, name: str) -> str:
+        return f"{self.base_url}/{ACCOUNT_ID}/{name}"
+
+    def get_queue(self, queue_url: str) -> Queue:
+        name = queue_url.rstrip("/").rsplit("/", 1)[-1]
+        with self.lock:
+            if name not in self.queues:
+                self.queues[name] = Queue(name)
+            return self.queues[name]
+
+    def handle(self, operation: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+        handler = getattr(self, f"op_{operation}", None)
+        if handler is None:
+            raise NotImplementedError(operation)
+        return handler(payload)
+
+    def op_CreateQueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url = self.queue_url(payload["QueueName"])
+        self.get_queue(url)
+        return {"QueueUrl": url}
+
+    def op_GetQueueUrl(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self.op_CreateQueue(payload)
+
+    def op_GetQueueAttributes(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        queue = self.get_queue(payload["QueueUrl"])
+        return {"Attributes": {
+            "ApproximateNumberOfMessages": str(len(queue.available)),
+            "ApproximateNumberOfMessagesNotVisible": str(len(queue.in_flight)),
+        }}
+
+    def op_PurgeQueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.get_queue(payload["QueueUrl"]).purge()
+        return {}
+
+    def op_SendMessage(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        message = self.get_queue(payload["QueueUrl"]).send(payload["MessageBody"], payload.get("MessageAttributes"))
+        return {"MessageId": message["MessageId"], "MD5OfMessageBody": message["MD5OfBody"]}
+
+    def op_SendMessageBatch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        queue = self.get_queue(payload["QueueUrl"])
+        total = sum(_message_size(entry["MessageBody"], entry.get("MessageAttributes")) for entry in payload["Entries"])
+        if total > MAX_BATCH_REQUEST_BYTES:
+            raise SQSError("BatchRequestTooLong", f"Batch requests cannot be longer than {MAX_BATCH_REQUEST_BYTES} bytes")
+        successful = []
+        for entry in payload["Entries"]:
+            message = queue.send(entry["MessageBody"], entry.get("MessageAttributes"))
+            successful.append({
+                "Id": entry["Id"],
+                "MessageId": message["MessageId"],
+                "MD5OfMessageBody": message["MD5OfBody"],
+            })
+        return {"Successful": successful, "Failed": []}
+
+    def op_ReceiveMessage(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        messages = self.get_queue(payload["QueueUrl"]).receive(
+            max_messages=min(int(payload.get("MaxNumberOfMessages", 1)), 10),
+            wait_seconds=float(payload.get("WaitTimeSeconds", 0)),
+            visibility_timeout=float(payload.get("VisibilityTimeout", DEFAULT_VISIBILITY_TIMEOUT)),
+        )
+        for message in messages:
+            if not message["MessageAttributes"]:
+                del message["MessageAttributes"]
+        return {"Messages": messages} if messages else {}
+
+    def op_DeleteMessage(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.get_queue(payload["QueueUrl"]).delete(payload["ReceiptHandle"])
+        return {}
+
+    def op_DeleteMessageBatch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        queue = self.get_queue(payload["QueueUrl"])
+        successful, failed = [], []
+        for entry in payload["Entries"]:
+            if queue.delete(entry["ReceiptHandle"]):
+                successful.append({"Id": entry["Id"]})
+            else:
+                failed.append({"Id": entry["Id"], "Code": "ReceiptHandleIsInvalid", "SenderFault": True,
+                               "Message": "Receipt handle inválido"})
+        return {"Successful": successful, "Failed": failed}
+
+def _make_handler(state: SQSStandIn):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            operation = self.headers.get("X-Amz-Target", "").rsplit(".", 1)[-1]
+            if state.latency_seconds:
+                time.sleep(state.latency_seconds)
+            try:
+                status, body = 200, state.handle(operation, payload)
+            except NotImplementedError:
+                status, body = 400, {"__type": "com.amazonaws.sqs#UnsupportedOperation", "message": operation}
+            except SQSError as e:
+                status, body = 400, {"__type": f"com.amazonaws.sqs#{e.code}", "message": str(e)}
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/x-amz-json-1.0")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+def start_standin(host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0) -> Tuple[ThreadingHTTPServer, SQSStandIn]:
+    """Inicia o servidor em uma thread daemon.
+
+    Args:
+        host: Endereço de escuta
+        port: Porta de escuta (0 escolhe uma porta livre)
+        latency_ms: Latência artificial adicionada a cada requisição
+
+    Returns:
+        Tuple com o servidor HTTP e o estado das filas
+    """
+    server = ThreadingHTTPServer((host, port), None)
+    server.daemon_threads = True
+    state = SQSStandIn(f"http://{host}:{server.server_address[1]}", latency_ms / 1000)
+    server.RequestHandlerClass = _make_handler(state)
+    threading.Thread(target=server.serve_forever, name="sqs-standin", daemon=True).start()
+    return server, state
+
+def configure_environment(state: SQSStandIn, queue_name: str = "test-queue") -> str:
+    """Aponta a aplicação para o servidor local e retorna a URL da fila."""
+    queue_url = state.queue_url(queue_name)
+    os.environ["SQS_ENDPOINT_URL"] = state.base_url
+    os.environ["SQS_QUEUE_URL"] = queue_url
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+    return queue_url
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor local compatível com o SQS")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9324)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latência artificial por requisição")
+    args = parser.parse_args()
+
+    server, state = start_standin(args.host, args.port, args.latency_ms)
+    print(f"SQS stand-in escutando em {state.base_url} (fila exemplo: {state.queue_url('test-queue')})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
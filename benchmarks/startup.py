@@ -0,0 +1,114 @@
+"""Benchmark de inicialização a frio: tempo até a primeira resposta saudável.
+
+Para cada configuração inicia um worker uvicorn novo, mede o tempo entre o
+lançamento do processo e o primeiro 200 de /healthcheck e lê /startup para
+decompor esse tempo nas fases registradas pelo worker. Cada configuração é
+executada várias vezes, alternando com as demais, e o relatório mostra a
+mediana e o mínimo.
+
+Uso:
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    "padrão": {},
+    "fast_start": {"FAST_START": "true"},
+    "mínimo": {"FAST_START": "true", "MESSAGING_ENABLED": "false", "PERFORMANCE_ENABLED": "false"},
+}
+PHASES = ("interpreter", "imports", "routers", "metrics", "lifespan")
+POLL_INTERVAL_SECONDS = 0.005
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _get(port: int, path: str) -> Tuple[int, bytes]:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+def _cold_start(overrides: Dict[str, str], timeout: float) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """Inicia um worker e retorna o tempo até o primeiro 200 de /healthcheck e o relatório de /startup."""
+    port = _free_port()
+    env = dict(os.environ, **overrides)
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        env=env
+    )
+    try:
+        deadline = start + timeout
+        while time.perf_counter() < deadline:
+            try:
+                status, _ = _get(port, "/healthcheck")
+                if status == 200:
+                    elapsed = time.perf_counter() - start
+                    break
+            except OSError:
+                pass
+            if process.poll() is not None:
+                raise RuntimeError(f"O worker encerrou durante a inicialização (código {process.returncode})")
+            time.sleep(POLL_INTERVAL_SECONDS)
+        else:
+            raise RuntimeError("O worker não respondeu /healthcheck a tempo")
+        status, body = _get(port, "/startup")
+        return elapsed, json.loads(body) if status == 200 else None
+    finally:
+        process.terminate()
+        process.wait()
+
+def _run(names: List[str], runs: int, timeout: float) -> None:
+    healthy: Dict[str, List[float]] = {name: [] for name in names}
+    phases: Dict[str, Dict[str, List[float]]] = {name: {phase: [] for phase in PHASES} for name in names}
+    lazy: Dict[str, Dict[str, bool]] = {}
+    for _ in range(runs):
+        for name in names:
+            elapsed, report = _cold_start(CONFIGURATIONS[name], timeout)
+            healthy[name].append(elapsed)
+            if report is not None:
+                lazy[name] = report["lazy_modules"]
+                for phase in report["phases"]:
+                    if phase["name"] in phases[name]:
+                        phases[name][phase["name"]].append(phase["duration_seconds"])
+
+    header = "".join(f"{phase:>13}" for phase in PHASES)
+    print(f"{'configuração':<14}{'1º 200 p50':>12}{'mín':>9}{header}   carregados")
+    for name in names:
+        medians = "".join(
+            f"{statistics.median(values) * 1000:>11.0f}ms" if values else f"{'-':>13}"
+            for values in phases[name].values()
+        )
+        loaded = ",".join(module for module, imported in lazy.get(name, {}).items() if imported) or "-"
+        print(f"{name:<14}{statistics.median(healthy[name]) * 1000:>10.0f}ms{min(healthy[name]) * 1000:>7.0f}ms"
+              f"{medians}   {loaded}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Inicializações por configuração")
+    parser.add_argument("--only", help=f"Configurações separadas por vírgula ({', '.join(CONFIGURATIONS)})")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Tempo máximo de cada inicialização em segundos")
+    args = parser.parse_args()
+    names = [name.strip() for name in args.only.split(",")] if args.only else list(CONFIGURATIONS)
+    unknown = [name for name in names if name not in CONFIGURATIONS]
+    if unknown:
+        parser.error(f"configurações desconhecidas: {', '.join(unknown)}")
+    _run(names, args.runs, args.timeout)
+
+if __name__ == "__main__":
+    main()
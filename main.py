@@ -1,8 +1,7 @@
 """Ponto de entrada principal para manter compatibilidade."""
-from app.main import app
 
 if __name__ == "__main__":
-    import uvicorn
-    from app.config import get_host, get_port
-    
-    uvicorn.run(app, host=get_host(), port=get_port())
\ No newline at end of file
+    # Inicia os workers através do launcher (WORKERS define a quantidade)
+    from app.launcher import main
+
+    main()
\ No newline at end of file
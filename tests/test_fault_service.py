@@ -0,0 +1,57 @@
+"""Testes da reconfiguração das regras de fault injection."""
+import pytest
+
+from app.services.fault_service import FaultEngine
+
+TAIL = {"outcomes": [{"status": 200, "weight": 1}, {"status": 500, "weight": 1}]}
+
+def _sequence(engine: FaultEngine, name: str, count: int = 20):
+    rule = engine.get(name)
+    return [rule.decide()[0].status_code for _ in range(count)]
+
+def test_replace_keeps_default_rules() -> None:
+    engine = FaultEngine(seed=1)
+    engine.configure({"tail": TAIL}, replace=True)
+    assert set(engine.snapshot()["rules"]) == {"normal", "soft", "tail"}
+
+    engine.configure({}, replace=True)
+    assert set(engine.snapshot()["rules"]) == {"normal", "soft"}
+
+def test_replace_drops_custom_rules_but_keeps_redefined_defaults() -> None:
+    engine = FaultEngine(seed=1)
+    engine.configure({"tail": TAIL, "soft": TAIL})
+    engine.configure({"other": TAIL}, replace=True)
+
+    rules = engine.snapshot()["rules"]
+    assert set(rules) == {"normal", "soft", "other"}
+    assert len(rules["soft"]["outcomes"]) == 2 and rules["soft"]["outcomes"][1]["status"] == 500
+
+def test_new_seed_rebuilds_rules_without_touching_live_ones() -> None:
+    engine = FaultEngine(seed=1)
+    engine.configure({"tail": TAIL})
+    live = engine.get("normal")
+    expected = _sequence(engine, "normal")
+    live_state = live._rng.getstate()
+
+    engine.configure({}, seed=1)
+
+    # A regra em uso continua de onde parou; a nova reproduz a sequência desde o início
+    assert engine.get("normal") is not live
+    assert live._rng.getstate() == live_state
+    assert _sequence(engine, "normal") == expected
+    assert engine.get("tail").decisions == 0
+
+def test_invalid_rule_applies_nothing() -> None:
+    engine = FaultEngine(seed=1)
+    before = engine.snapshot()
+    with pytest.raises(ValueError):
+        engine.configure({"ok": TAIL, "bad": {"outcomes": []}}, seed=2, replace=True)
+    assert engine.snapshot() == before
+
+@pytest.mark.parametrize("status", [101, 204, 205, 304, 600])
+def test_rejects_statuses_without_body(status: int) -> None:
+    engine = FaultEngine(seed=1)
+    before = engine.snapshot()
+    with pytest.raises(ValueError):
+        engine.configure({"bad": {"outcomes": [{"status": status, "weight": 1}]}})
+    assert engine.snapshot() == before
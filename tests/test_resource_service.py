@@ -0,0 +1,131 @@
+"""Testes da detecção de limites do cgroup contra árvores de arquivos falsas."""
+import os
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from app.services import resource_service
+from app.services.resource_service import MB, CgroupReader, get_memory_headroom_mb, get_resource_limits
+
+def _write_tree(root: Path, files: Dict[str, str]) -> None:
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+@pytest.fixture(autouse=True)
+def eight_cpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixa a afinidade do processo em 8 CPUs para o resultado não depender da máquina."""
+    monkeypatch.setattr(resource_service, "_process_affinity", lambda: list(range(8)))
+
+def test_cgroup_v1(tmp_path: Path) -> None:
+    root = tmp_path / "cgroup"
+    _write_tree(root, {
+        "cpu,cpuacct/docker/abc/cpu.cfs_quota_us": "150000\n",
+        "cpu,cpuacct/docker/abc/cpu.cfs_period_us": "100000\n",
+        "cpuset/docker/abc/cpuset.effective_cpus": "2-3,5\n",
+        "memory/docker/abc/memory.limit_in_bytes": f"{512 * MB}\n",
+        "memory/docker/abc/memory.usage_in_bytes": f"{300 * MB}\n",
+        "memory/docker/abc/memory.stat": f"cache {120 * MB}\ninactive_file 1\ntotal_inactive_file {100 * MB}\n",
+    })
+    # No cgroup v1 os controladores montados juntos aparecem como links (cpu -> cpu,cpuacct)
+    os.symlink(root / "cpu,cpuacct", root / "cpu")
+    proc_cgroup = tmp_path / "proc_cgroup"
+    proc_cgroup.write_text(
+        "12:memory:/docker/abc\n"
+        "5:cpu,cpuacct:/docker/abc\n"
+        "3:cpuset:/docker/abc\n"
+        "1:name=systemd:/docker/abc\n"
+    )
+
+    limits = get_resource_limits(str(root), str(proc_cgroup))
+
+    assert limits.cgroup_version == 1
+    assert limits.cpu_quota_cores == 1.5
+    assert limits.cpuset == [2, 3, 5]
+    assert limits.effective_cpu_count == 2
+    assert limits.allowed_cpus == [2, 3]
+    assert limits.memory_limit_bytes == 512 * MB
+    assert limits.memory_usage_bytes == 300 * MB
+    assert limits.memory_working_set_bytes == 200 * MB
+    assert limits.effective_memory_bytes == min(512 * MB, limits.host_memory_bytes)
+
+def test_cgroup_v1_unlimited_memory(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {
+        "memory/memory.limit_in_bytes": "9223372036854771712\n",
+        "cpu/cpu.cfs_quota_us": "-1\n",
+        "cpu/cpu.cfs_period_us": "100000\n",
+    })
+    reader = CgroupReader(str(tmp_path), str(tmp_path / "missing"))
+
+    assert reader.version == 1
+    assert reader.memory_limit_bytes() is None
+    assert reader.cpu_quota_cores() is None
+
+def test_cgroup_v2_nested_path(tmp_path: Path) -> None:
+    root = tmp_path / "cgroup"
+    nested = "kubepods.slice/kubepods-burstable.slice/kubepods-burstable-pod123.slice/cri-containerd-abc.scope"
+    _write_tree(root, {
+        "cgroup.controllers": "cpuset cpu io memory pids\n",
+        # Valores da raiz que não devem ser usados quando o cgroup do processo existe
+        "cpu.max": "max 100000\n",
+        "memory.max": "max\n",
+        f"{nested}/cpu.max": "250000 100000\n",
+        f"{nested}/cpuset.cpus.effective": "0-3,6\n",
+        f"{nested}/memory.max": f"{256 * MB}\n",
+        f"{nested}/memory.current": f"{96 * MB}\n",
+        f"{nested}/memory.stat": f"anon {60 * MB}\nfile {36 * MB}\nactive_file {4 * MB}\ninactive_file {32 * MB}\n",
+    })
+    proc_cgroup = tmp_path / "proc_cgroup"
+    proc_cgroup.write_text(f"0::/{nested}\n")
+
+    limits = get_resource_limits(str(root), str(proc_cgroup))
+
+    assert limits.cgroup_version == 2
+    assert limits.cpu_quota_cores == 2.5
+    assert limits.cpuset == [0, 1, 2, 3, 6]
+    assert limits.effective_cpu_count == 3
+    assert limits.allowed_cpus == [0, 1, 2]
+    assert limits.memory_limit_bytes == 256 * MB
+    assert limits.memory_usage_bytes == 96 * MB
+    assert limits.memory_working_set_bytes == 64 * MB
+
+def test_cgroup_v2_namespace_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Com cgroup namespace o caminho de /proc/self/cgroup não existe sob a raiz e os arquivos são lidos nela."""
+    _write_tree(tmp_path, {
+        "cgroup.controllers": "cpu memory\n",
+        "cpu.max": "100000 100000\n",
+        "memory.max": f"{1024 * MB}\n",
+        "memory.current": f"{400 * MB}\n",
+        "memory.stat": f"inactive_file {100 * MB}\n",
+    })
+    proc_cgroup = tmp_path / "proc_cgroup"
+    proc_cgroup.write_text("0::/kubepods/burstable/pod123/abc\n")
+    monkeypatch.setenv("CGROUP_ROOT", str(tmp_path))
+    monkeypatch.setenv("MEMORY_LIMIT_HEADROOM_PERCENT", "10")
+
+    limits = get_resource_limits(str(tmp_path), str(proc_cgroup))
+
+    assert limits.effective_cpu_count == 1
+    assert limits.memory_working_set_bytes == 300 * MB
+    # O uso do cgroup inteiro é descontado, não o RSS informado pelo processo
+    assert get_memory_headroom_mb(process_rss_mb=10) == pytest.approx(1024 * 0.9 - 300)
+
+def test_no_cgroup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CGROUP_ROOT", str(tmp_path))
+    monkeypatch.setenv("MEMORY_LIMIT_HEADROOM_PERCENT", "10")
+
+    limits = get_resource_limits(str(tmp_path), str(tmp_path / "missing"))
+
+    assert limits.cgroup_version is None
+    assert limits.cpu_quota_cores is None
+    assert limits.cpuset is None
+    assert limits.effective_cpu_count == 8
+    assert limits.memory_limit_bytes is None
+    assert limits.memory_usage_bytes is None
+    assert limits.memory_working_set_bytes is None
+    assert limits.effective_memory_bytes == limits.host_memory_bytes
+    # Sem cgroup o espaço livre é calculado a partir do RSS do processo
+    ceiling_mb = limits.host_memory_bytes * 0.9 / MB
+    assert get_memory_headroom_mb(process_rss_mb=100) == pytest.approx(ceiling_mb - 100)